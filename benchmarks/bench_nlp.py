@@ -0,0 +1,199 @@
+"""
+Benchmarks for the NLP hot paths used by search, resume generation and interviews
+
+Corpora are generated from the OpportunityFinder mock job templates with a
+fixed seed, so every run scores the same texts.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_nlp                     # 1k and 10k job corpora
+    python -m benchmarks.bench_nlp --sizes 1000 10000 100000
+    python -m benchmarks.bench_nlp --save-baseline     # store results as the new baseline
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+
+from utils import nlp_utils
+from utils import interview_ai
+from utils.opportunity_finder import OpportunityFinder
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Throughput drop (relative to the baseline) reported as a regression
+DEFAULT_TOLERANCE = 0.2
+
+PROFILE_TEXT = (
+    "Backend engineer with five years of experience building scalable web applications "
+    "and data pipelines. Python, Django, PostgreSQL, AWS, Docker, Kubernetes, "
+    "machine learning models and CI/CD pipelines. Led a team of four engineers and "
+    "collaborated with product managers on distributed systems."
+)
+
+ANSWER_SENTENCES = [
+    "In my previous role I was responsible for the payment service.",
+    "The situation was that our deployments kept failing under load.",
+    "My task was to stabilise the release process before the launch.",
+    "I implemented automated tests and executed a staged rollout.",
+    "The result was a forty percent drop in incidents.",
+    "For example, we cut the average recovery time to ten minutes.",
+    "I think it went well, but maybe we could have started sooner.",
+    "Um, I sort of handled most of it myself, you know.",
+    "I learned a lot about communicating with stakeholders.",
+    "I am confident that I can bring the same approach to this team.",
+    "We achieved the goal and I managed the follow-up work.",
+    "It was a difficult period, like, for the whole company.",
+]
+
+def generate_corpus(size, seed):
+    """Generate job descriptions from the mock job templates"""
+    random.seed(seed)
+    # Skip __init__: only the template-based generator is needed, not a full catalog
+    finder = OpportunityFinder.__new__(OpportunityFinder)
+    return [f"{job.title} {job.description}" for job in finder._generate_mock_jobs(count=size)]
+
+def generate_answers(size, seed):
+    """Generate (question, answer) pairs from the interview question banks"""
+    rng = random.Random(seed)
+    questions = interview_ai.HR_QUESTIONS + interview_ai.BEHAVIORAL_QUESTIONS
+    return [
+        (rng.choice(questions), " ".join(rng.sample(ANSWER_SENTENCES, rng.randint(2, 8))))
+        for _ in range(size)
+    ]
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(func, inputs):
+    """
+    Time func over every input, then repeat under tracemalloc for peak memory
+
+    Returns:
+        dict: throughput (calls/s), p50_us, p99_us and peak_kb
+    """
+    latencies = []
+    perf_counter_ns = time.perf_counter_ns
+    started = perf_counter_ns()
+    for args in inputs:
+        call_start = perf_counter_ns()
+        func(*args)
+        latencies.append(perf_counter_ns() - call_start)
+    elapsed = (perf_counter_ns() - started) / 1e9
+
+    # Memory is measured in a separate pass so tracing does not skew the timings
+    nlp_utils.invalidate_analysis_cache()
+    tracemalloc.start()
+    for args in inputs:
+        func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'calls': len(inputs),
+        'throughput': len(inputs) / elapsed if elapsed else float('inf'),
+        'p50_us': _percentile(latencies, 0.50) / 1000,
+        'p99_us': _percentile(latencies, 0.99) / 1000,
+        'peak_kb': peak / 1024,
+    }
+
+def run(sizes, seed):
+    """
+    Run every benchmark for every corpus size
+
+    Returns:
+        dict: "<size>/<benchmark>" to measurements
+    """
+    results = {}
+    for size in sizes:
+        corpus = generate_corpus(size, seed)
+        answers = generate_answers(size, seed)
+        nlp_utils.observe_phrases(corpus)
+
+        benchmarks = {
+            'extract_keywords': (nlp_utils.extract_keywords, [(text,) for text in corpus]),
+            'calculate_match_score': (nlp_utils.calculate_match_score, [(PROFILE_TEXT, text) for text in corpus]),
+            'calculate_match_scores': (nlp_utils.calculate_match_scores, [(PROFILE_TEXT, corpus)]),
+            'suggest_resume_improvements': (nlp_utils.suggest_resume_improvements, [(PROFILE_TEXT, text) for text in corpus]),
+            'nlp_utils.analyze_answer': (nlp_utils.analyze_answer, answers),
+            'nlp_utils.analyze_answers': (nlp_utils.analyze_answers, [(answers,)]),
+            'interview_ai.analyze_answer': (interview_ai.analyze_answer, answers),
+        }
+
+        for name, (func, inputs) in benchmarks.items():
+            nlp_utils.invalidate_analysis_cache()
+            results[f"{size}/{name}"] = measure(func, inputs)
+            print(format_result(f"{size}/{name}", results[f"{size}/{name}"]), flush=True)
+    return results
+
+def format_result(key, result, baseline=None):
+    line = (f"{key:<42} {result['throughput']:>12.1f}/s  p50 {result['p50_us']:>9.1f}us  "
+            f"p99 {result['p99_us']:>9.1f}us  peak {result['peak_kb']:>9.1f}KB")
+    if baseline:
+        line += f"  ({result['throughput'] / baseline['throughput']:.2f}x baseline)"
+    return line
+
+def compare(results, baseline, tolerance):
+    """
+    Print results next to the stored baseline
+
+    Returns:
+        list: Keys whose throughput regressed by more than the tolerance
+    """
+    regressions = []
+    print("\nComparison with baseline:")
+    for key, result in results.items():
+        reference = baseline.get('results', {}).get(key)
+        print(format_result(key, result, reference))
+        if reference and result['throughput'] < reference['throughput'] * (1 - tolerance):
+            regressions.append(key)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help="Corpus sizes")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for the synthetic corpora")
+    parser.add_argument('--with-cache', action='store_true', help="Keep the analysis cache enabled")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="Store the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative throughput drop before failing")
+    args = parser.parse_args(argv)
+
+    if not args.with_cache:
+        # Measure the uncached code paths: nothing fits under a zero ceiling
+        nlp_utils.ANALYSIS_CACHE.max_bytes = 0
+
+    results = run(args.sizes, args.seed)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'seed': args.seed,
+                'results': results
+            }, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nThroughput regressions: " + ", ".join(regressions))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+import copy
+import hashlib
 from datetime import datetime
 
 class User:
@@ -102,8 +104,13 @@ class Question:
         self.feedback = None
         self.score = 0  # Score for this particular question
 
+def stable_id(kind, key):
+    """Identifier derived from a natural key (the URL), so it survives catalog refreshes"""
+    return f"{kind}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
 class JobOpportunity:
-    def __init__(self, title, company, location, job_type, description, url, posted_date):
+    def __init__(self, title, company, location, job_type, description, url, posted_date, id=None):
+        self.id = id or stable_id('job', url or f"{title}|{company}|{location}")
         self.title = title
         self.company = company
         self.location = location
@@ -116,7 +123,8 @@ class JobOpportunity:
 
 class Hackathon:
     def __init__(self, name, organizer, location, start_date, end_date, description, 
-                 url, is_remote, skill_level, team_size, prizes=None):
+                 url, is_remote, skill_level, team_size, prizes=None, id=None):
+        self.id = id or stable_id('hackathon', url or f"{name}|{organizer}|{start_date}")
         self.name = name
         self.organizer = organizer
         self.location = location
@@ -129,3 +137,65 @@ class Hackathon:
         self.team_size = team_size  # "individual", "team", "both"
         self.prizes = prizes or []
         self.saved_date = datetime.now()
+
+class SavedOpportunities:
+    """
+    A user's saved jobs and hackathons, keyed by opportunity ID
+
+    Iterates in the order items were saved, like the list it replaces;
+    saving, removing and membership checks are dict operations.
+    """
+
+    def __init__(self, opportunities=()):
+        self._by_id = {}
+        self._id_by_url = {}
+        for opportunity in opportunities:
+            self.add(opportunity)
+
+    def __iter__(self):
+        return iter(list(self._by_id.values()))
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, opportunity_id):
+        return opportunity_id in self._by_id
+
+    def ids(self):
+        """IDs of the saved opportunities"""
+        return self._by_id.keys()
+
+    def get(self, opportunity_id):
+        return self._by_id.get(opportunity_id)
+
+    def add(self, opportunity):
+        """
+        Save a copy of an opportunity stamped with the save time
+
+        Returns:
+            bool: False if it was already saved
+        """
+        if opportunity.id in self._by_id:
+            return False
+        saved = copy.copy(opportunity)
+        saved.saved_date = datetime.now()
+        self._by_id[saved.id] = saved
+        if saved.url:
+            self._id_by_url[saved.url] = saved.id
+        return True
+
+    def remove(self, opportunity_id=None, url=None):
+        """
+        Unsave an opportunity by ID (or by URL)
+
+        Returns:
+            bool: False if it was not saved
+        """
+        if opportunity_id is None:
+            opportunity_id = self._id_by_url.get(url)
+        saved = self._by_id.pop(opportunity_id, None)
+        if saved is None:
+            return False
+        if saved.url:
+            self._id_by_url.pop(saved.url, None)
+        return True
@@ -80,13 +80,13 @@ def register():
         current_app.users[username] = new_user
         
         # Initialize empty profile
-        from models import Profile
+        from models import Profile, SavedOpportunities
         current_app.profiles[username] = Profile(username)
         
         # Initialize empty collections
         current_app.resumes[username] = []
         current_app.interviews[username] = []
-        current_app.saved_opportunities[username] = []
+        current_app.saved_opportunities[username] = SavedOpportunities()
         
         flash('Registration successful! Please log in.', 'success')
         return redirect(url_for('auth.login'))
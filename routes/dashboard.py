@@ -1,7 +1,7 @@
 from flask import Blueprint, render_template, current_app
 from flask_login import login_required, current_user
 from datetime import datetime, timedelta
-from utils.opportunity_finder import OpportunityFinder
+from utils.catalog import CATALOG
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
@@ -47,7 +47,7 @@ def index():
     # Get personalized recommendations if profile is complete
     recommendations = None
     if profile.skills and profile.experience:
-        finder = OpportunityFinder()
+        finder = CATALOG.finder
         recommendations = finder.get_personalized_recommendations(profile, limit=3)
     
     # Calculate profile completeness
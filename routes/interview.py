@@ -3,10 +3,69 @@ from flask_login import login_required, current_user
 from models import Interview
 from utils.interview_simulator import InterviewSimulator
 from utils.speech_utils import speech_to_text, text_to_speech, analyze_speech_characteristics
+from utils.nlp_utils import StreamingAnswerAnalyzer
+from collections import OrderedDict
+import threading
 import base64
+import time
 
 interview_bp = Blueprint('interview', __name__)
 
+# Live answers idle longer than this are dropped (seconds)
+ANSWER_STREAM_TTL = 30 * 60
+# Most live answers kept at once; the least recently fed go first
+MAX_ANSWER_STREAMS = 1000
+
+class AnswerStreams:
+    """
+    Live answer analyzers by username; analyzer state is not session-serializable
+
+    Users who abandon an interview never submit, so entries also expire
+    after ttl seconds without a chunk, and at most max_streams are kept.
+    """
+
+    def __init__(self, ttl=ANSWER_STREAM_TTL, max_streams=MAX_ANSWER_STREAMS):
+        self.ttl = ttl
+        self.max_streams = max_streams
+        self._streams = OrderedDict()  # username -> (last fed, (question index, analyzer))
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._streams)
+
+    def get(self, username):
+        """The user's (question index, analyzer), or None if absent or expired"""
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._streams.get(username)
+            return entry[1] if entry is not None else None
+
+    def put(self, username, stream):
+        """Store or refresh the user's stream, evicting the oldest over the cap"""
+        now = time.monotonic()
+        with self._lock:
+            self._streams.pop(username, None)
+            self._streams[username] = (now, stream)
+            self._expire(now)
+            while len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+
+    def pop(self, username, default=None):
+        """Drop the user's stream"""
+        with self._lock:
+            entry = self._streams.pop(username, None)
+            return entry[1] if entry is not None else default
+
+    def _expire(self, now):
+        # Entries are in order of last use, so expired ones are at the front
+        while self._streams:
+            username, (fed, _) = next(iter(self._streams.items()))
+            if now - fed < self.ttl:
+                break
+            del self._streams[username]
+
+answer_streams = AnswerStreams()
+
 @interview_bp.route('/')
 @login_required
 def index():
@@ -37,6 +96,9 @@ def start():
         num_questions=num_questions
     )
     
+    # A live answer from a previous interview no longer applies
+    answer_streams.pop(current_user.username, None)
+    
     # Store in session
     session['interview'] = {
         'role': role,
@@ -104,6 +166,8 @@ def submit_answer():
     from utils.nlp_utils import analyze_answer
     feedback = analyze_answer(question, answer_text)
     
+    answer_streams.pop(current_user.username, None)
+    
     # Store answer and feedback
     interview['answers'][current_index] = answer_text
     interview['feedback'][current_index] = feedback
@@ -116,6 +180,39 @@ def submit_answer():
         'total_questions': len(interview['questions'])
     })
 
+@interview_bp.route('/answer-chunk', methods=['POST'])
+@login_required
+def answer_chunk():
+    """Feed the next piece of a live transcript and return feedback so far"""
+    if 'interview' not in session:
+        return jsonify({'success': False, 'message': 'No active interview session.'})
+    
+    interview = session['interview']
+    current_index = interview['current_index']
+    
+    if current_index >= len(interview['questions']):
+        return jsonify({'success': False, 'message': 'Interview already complete.'})
+    
+    question = interview['questions'][current_index]
+    stream = answer_streams.get(current_user.username)
+    
+    # Start over when the user moved on to another question
+    if stream is None or stream[0] != current_index or stream[1].question != question:
+        stream = (current_index, StreamingAnswerAnalyzer(question))
+    answer_streams.put(current_user.username, stream)
+    
+    analyzer = stream[1]
+    analyzer.feed(request.form.get('text', ''))
+    
+    return jsonify({
+        'success': True,
+        'feedback': analyzer.feedback(),
+        'word_count': analyzer.word_count,
+        'sentence_count': analyzer.sentence_count,
+        'question_number': current_index + 1,
+        'total_questions': len(interview['questions'])
+    })
+
 @interview_bp.route('/audio-answer', methods=['POST'])
 @login_required
 def audio_answer():
@@ -151,6 +248,8 @@ def audio_answer():
         feedback = content_feedback
         feedback['speech_analysis'] = speech_analysis
         
+        answer_streams.pop(current_user.username, None)
+        
         # Store answer and feedback
         interview['answers'][current_index] = text
         interview['feedback'][current_index] = feedback
@@ -255,6 +354,7 @@ def complete():
     
     # Clear session data
     session.pop('interview', None)
+    answer_streams.pop(current_user.username, None)
     
     return jsonify({
         'success': True,
@@ -1,9 +1,28 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify
 from flask_login import login_required, current_user
-from utils.opportunity_finder import OpportunityFinder
+from utils.catalog import CATALOG
+from utils.trending import TRENDING_SKILLS
+from models import SavedOpportunities
 
 opportunities_bp = Blueprint('opportunities', __name__)
 
+# Results rendered per search page (the limit query argument is capped at MAX_PAGE_SIZE)
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def _page_args():
+    """Page size and cursor from the query string"""
+    limit = request.args.get('limit', PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE)), request.args.get('cursor') or None
+
+def _next_page_url(endpoint, page):
+    """URL of the page after a SearchPage with the same filters, or None on the last page"""
+    if not page.next_cursor:
+        return None
+    args = request.args.to_dict()
+    args['cursor'] = page.next_cursor
+    return url_for(endpoint, **args)
+
 @opportunities_bp.route('/')
 @login_required
 def index():
@@ -14,7 +33,7 @@ def index():
 @login_required
 def jobs():
     """Job search page"""
-    finder = OpportunityFinder()
+    finder = CATALOG.finder
     
     # Get filter parameters
     keywords = request.args.get('keywords', '')
@@ -27,18 +46,20 @@ def jobs():
     # Check if we should use profile for recommendations
     use_profile = request.args.get('use_profile') == '1'
     profile = current_app.profiles.get(current_user.username) if use_profile else None
+    limit, cursor = _page_args()
     
-    # Search jobs
+    # Search jobs (one page)
     job_results = finder.search_jobs(
         keywords=keyword_list,
         job_type=job_type if job_type else None,
         location=location if location else None,
-        profile=profile
+        profile=profile,
+        limit=limit,
+        cursor=cursor
     )
     
     # Get saved opportunities
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
-    saved_job_urls = [opp.url for opp in saved_opportunities if hasattr(opp, 'job_type')]
+    saved_job_ids = _saved_index().ids()
     
     return render_template(
         'opportunities/jobs.html',
@@ -47,14 +68,16 @@ def jobs():
         job_type=job_type,
         location=location,
         use_profile=use_profile,
-        saved_job_urls=saved_job_urls
+        saved_job_ids=saved_job_ids,
+        total_results=job_results.total,
+        next_page_url=_next_page_url('opportunities.jobs', job_results)
     )
 
 @opportunities_bp.route('/hackathons')
 @login_required
 def hackathons():
     """Hackathon search page"""
-    finder = OpportunityFinder()
+    finder = CATALOG.finder
     
     # Get filter parameters
     keywords = request.args.get('keywords', '')
@@ -71,18 +94,21 @@ def hackathons():
     elif remote == '0':
         remote_filter = False
     
-    # Search hackathons
+    limit, cursor = _page_args()
+    
+    # Search hackathons (one page)
     hackathon_results = finder.search_hackathons(
         keywords=keyword_list,
         location=location if location else None,
         remote=remote_filter,
         skill_level=skill_level if skill_level else None,
-        team_size=team_size if team_size else None
+        team_size=team_size if team_size else None,
+        limit=limit,
+        cursor=cursor
     )
     
     # Get saved opportunities
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
-    saved_hackathon_urls = [opp.url for opp in saved_opportunities if hasattr(opp, 'is_remote')]
+    saved_hackathon_ids = _saved_index().ids()
     
     return render_template(
         'opportunities/hackathons.html',
@@ -92,87 +118,102 @@ def hackathons():
         remote=remote,
         skill_level=skill_level,
         team_size=team_size,
-        saved_hackathon_urls=saved_hackathon_urls
+        saved_hackathon_ids=saved_hackathon_ids,
+        total_results=hackathon_results.total,
+        next_page_url=_next_page_url('opportunities.hackathons', hackathon_results)
     )
 
+def _saved_index():
+    """The current user's saved opportunities, created on first use"""
+    saved = current_app.saved_opportunities.get(current_user.username)
+    if not isinstance(saved, SavedOpportunities):
+        saved = current_app.saved_opportunities[current_user.username] = SavedOpportunities(saved or [])
+    return saved
+
 @opportunities_bp.route('/save-job', methods=['POST'])
 @login_required
 def save_job():
     """Save a job opportunity"""
-    finder = OpportunityFinder()
-    
     job_id = request.form.get('job_id')
-    if not job_id or not job_id.isdigit():
+    if not job_id:
         return jsonify({'success': False, 'message': 'Invalid job ID.'})
     
-    job_id = int(job_id)
-    
-    if job_id < 0 or job_id >= len(finder.mock_jobs):
+    job = CATALOG.finder.get_job(job_id)
+    if job is None:
         return jsonify({'success': False, 'message': 'Job not found.'})
     
-    job = finder.mock_jobs[job_id]
-    
-    # Check if already saved
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
-    if any(opp.url == job.url for opp in saved_opportunities):
+    # Save the job unless it already is
+    if not _saved_index().add(job):
         return jsonify({'success': False, 'message': 'Job already saved.'})
     
-    # Save the job
-    if current_user.username not in current_app.saved_opportunities:
-        current_app.saved_opportunities[current_user.username] = []
-    
-    current_app.saved_opportunities[current_user.username].append(job)
-    
     return jsonify({'success': True})
 
 @opportunities_bp.route('/save-hackathon', methods=['POST'])
 @login_required
 def save_hackathon():
     """Save a hackathon opportunity"""
-    finder = OpportunityFinder()
-    
     hackathon_id = request.form.get('hackathon_id')
-    if not hackathon_id or not hackathon_id.isdigit():
+    if not hackathon_id:
         return jsonify({'success': False, 'message': 'Invalid hackathon ID.'})
     
-    hackathon_id = int(hackathon_id)
-    
-    if hackathon_id < 0 or hackathon_id >= len(finder.mock_hackathons):
+    hackathon = CATALOG.finder.get_hackathon(hackathon_id)
+    if hackathon is None:
         return jsonify({'success': False, 'message': 'Hackathon not found.'})
     
-    hackathon = finder.mock_hackathons[hackathon_id]
-    
-    # Check if already saved
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
-    if any(opp.url == hackathon.url for opp in saved_opportunities):
+    # Save the hackathon unless it already is
+    if not _saved_index().add(hackathon):
         return jsonify({'success': False, 'message': 'Hackathon already saved.'})
     
-    # Save the hackathon
-    if current_user.username not in current_app.saved_opportunities:
-        current_app.saved_opportunities[current_user.username] = []
-    
-    current_app.saved_opportunities[current_user.username].append(hackathon)
-    
     return jsonify({'success': True})
 
 @opportunities_bp.route('/remove-saved', methods=['POST'])
 @login_required
 def remove_saved():
-    """Remove a saved opportunity"""
+    """Remove a saved opportunity by ID (or by URL)"""
+    opportunity_id = request.form.get('id')
     url = request.form.get('url')
-    if not url:
-        return jsonify({'success': False, 'message': 'URL is required.'})
-    
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
+    if not opportunity_id and not url:
+        return jsonify({'success': False, 'message': 'ID or URL is required.'})
     
-    # Find and remove the opportunity
-    for i, opp in enumerate(saved_opportunities):
-        if opp.url == url:
-            del saved_opportunities[i]
-            return jsonify({'success': True})
+    if _saved_index().remove(opportunity_id, url=url):
+        return jsonify({'success': True})
     
     return jsonify({'success': False, 'message': 'Saved opportunity not found.'})
 
+@opportunities_bp.route('/skill-gaps')
+@login_required
+def skill_gaps():
+    """Skills most often missing for the user's target role and location"""
+    profile = current_app.profiles.get(current_user.username)
+    
+    if not profile:
+        return jsonify({'success': False, 'message': 'Please complete your profile first.'})
+    
+    finder = CATALOG.finder
+    gaps = finder.find_skill_gaps(
+        profile,
+        role=request.args.get('role') or None,
+        location=request.args.get('location') or None,
+        limit=request.args.get('limit', 10, type=int)
+    )
+    
+    return jsonify({'success': True, **gaps})
+
+@opportunities_bp.route('/trending-skills')
+@login_required
+def trending_skills():
+    """Skills rising in demand across ingested jobs"""
+    role = request.args.get('role') or None
+    location = request.args.get('location') or None
+    window = request.args.get('window', 7, type=int)
+    limit = request.args.get('limit', 10, type=int)
+    
+    return jsonify({
+        'success': True,
+        'trending': TRENDING_SKILLS.trending(limit=limit, window=window, role=role, location=location),
+        'top': TRENDING_SKILLS.top_skills(limit=limit, window=window, role=role, location=location)
+    })
+
 @opportunities_bp.route('/recommendations')
 @login_required
 def recommendations():
@@ -184,12 +225,11 @@ def recommendations():
         return redirect(url_for('profile.edit'))
     
     # Get recommendations
-    finder = OpportunityFinder()
+    finder = CATALOG.finder
     recommendations = finder.get_personalized_recommendations(profile)
     
     # Get saved opportunities
-    saved_opportunities = current_app.saved_opportunities.get(current_user.username, [])
-    saved_urls = [opp.url for opp in saved_opportunities]
+    saved_urls = [opp.url for opp in _saved_index()]
     
     return render_template(
         'opportunities/jobs.html',
@@ -3,7 +3,8 @@ from flask_login import login_required, current_user
 from io import BytesIO
 from models import Resume
 from utils.resume_generator import generate_customized_resume, render_resume_html, generate_resume_pdf
-from utils.nlp_utils import extract_keywords, suggest_resume_improvements
+from utils.nlp_utils import TextAnalysis, extract_keywords, suggest_resume_improvements
+from utils.fuzzy_match import normalize_skills
 
 resume_bp = Blueprint('resume', __name__)
 
@@ -86,7 +87,7 @@ def preview(index):
     
     if profile:
         profile_text = profile.personal_info.get('summary', '') + " "
-        profile_text += " ".join(profile.skills) + " "
+        profile_text += " ".join(normalize_skills(profile.skills)) + " "
         
         for exp in profile.experience:
             profile_text += exp.title + " " + exp.description + " "
@@ -158,8 +159,11 @@ def analyze_job():
     if not job_description:
         return jsonify({'success': False, 'message': 'Job description is required.'})
     
+    # Analyze the description once and share it with the suggestions below
+    job_analysis = TextAnalysis(job_description)
+    
     # Extract keywords
-    keywords = extract_keywords(job_description)
+    keywords = extract_keywords(job_analysis)
     
     # Get profile data
     profile = current_app.profiles.get(current_user.username)
@@ -167,7 +171,7 @@ def analyze_job():
     
     if profile:
         profile_text = profile.personal_info.get('summary', '') + " "
-        profile_text += " ".join(profile.skills) + " "
+        profile_text += " ".join(normalize_skills(profile.skills)) + " "
         
         for exp in profile.experience:
             profile_text += exp.title + " " + exp.description + " "
@@ -177,7 +181,7 @@ def analyze_job():
             profile_text += " ".join(proj.technologies) + " "
     
     # Get suggestions
-    suggestions = suggest_resume_improvements(profile_text, job_description)
+    suggestions = suggest_resume_improvements(profile_text, job_analysis)
     
     return jsonify({
         'success': True,
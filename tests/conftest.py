@@ -0,0 +1,43 @@
+import random
+
+import pytest
+from flask import Flask
+from flask_login import LoginManager
+
+from models import User, SavedOpportunities
+
+
+@pytest.fixture(scope='session')
+def finder():
+    """A fully indexed mock catalog, built once (treat it as read-only)"""
+    from utils.opportunity_finder import OpportunityFinder
+    random.seed(0)
+    return OpportunityFinder()
+
+
+@pytest.fixture
+def user():
+    return User('tester', 'tester@example.com', 'hash')
+
+
+@pytest.fixture
+def app(user):
+    """Flask app with the opportunities blueprint and a logged-in test user"""
+    from routes.opportunities import opportunities_bp
+
+    app = Flask(__name__, root_path='.', template_folder='templates')
+    app.config['TESTING'] = True
+    app.secret_key = 'test'
+    app.register_blueprint(opportunities_bp, url_prefix='/opportunities')
+
+    login_manager = LoginManager(app)
+    login_manager.request_loader(lambda request: user)
+
+    app.profiles = {}
+    app.saved_opportunities = {user.username: SavedOpportunities()}
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('gtts')
+pytest.importorskip('speech_recognition')
+
+from routes.interview import AnswerStreams
+
+
+def test_streams_expire_after_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr('routes.interview.time.monotonic', lambda: clock[0])
+    streams = AnswerStreams(ttl=60, max_streams=10)
+    streams.put('alice', (0, 'analyzer'))
+    clock[0] += 30
+    assert streams.get('alice') == (0, 'analyzer')
+    clock[0] += 61
+    assert streams.get('alice') is None
+    assert len(streams) == 0
+
+
+def test_streams_are_capped_least_recently_fed_first():
+    streams = AnswerStreams(ttl=3600, max_streams=2)
+    streams.put('alice', (0, 'a'))
+    streams.put('bob', (0, 'b'))
+    streams.put('alice', (1, 'a'))
+    streams.put('carol', (0, 'c'))
+    assert streams.get('bob') is None
+    assert streams.get('alice') == (1, 'a')
+    assert streams.pop('carol') == (0, 'c')
+    assert len(streams) == 1
@@ -0,0 +1,38 @@
+import threading
+
+from utils.catalog import OpportunityCatalog
+
+
+class FakeFinder:
+    def __init__(self, name):
+        self.name = name
+        self.mock_jobs = []
+        self.mock_hackathons = []
+
+
+def test_first_reader_loads_once():
+    loads = []
+    catalog = OpportunityCatalog(loader=lambda: loads.append(1) or FakeFinder('first'))
+    assert catalog.version == 0
+
+    threads = [threading.Thread(target=catalog.snapshot) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert catalog.version == 1
+    assert catalog.finder.name == 'first'
+
+
+def test_refresh_publishes_a_new_snapshot():
+    names = iter(['first', 'second'])
+    catalog = OpportunityCatalog(loader=lambda: FakeFinder(next(names)))
+    old = catalog.snapshot()
+    new = catalog.refresh()
+
+    assert (old.version, new.version) == (1, 2)
+    assert old.finder.name == 'first' and catalog.finder.name == 'second'
+    assert catalog.swap(FakeFinder('third')).version == 3
+    assert catalog.snapshot().jobs == []
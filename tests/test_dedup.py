@@ -0,0 +1,36 @@
+from utils.dedup import NearDuplicateDetector, deduplicate, shingle_hashes
+
+DESCRIPTION = ("Build and operate Python services on AWS with PostgreSQL and Docker "
+               "for the payments platform team.")
+
+
+def job(**fields):
+    return {'title': "Backend Engineer", 'company': "Acme", 'description': DESCRIPTION,
+            'location': "New York, NY", 'job_type': "full-time", **fields}
+
+
+def test_syndicated_copies_are_collapsed():
+    records = [job(url='a'), job(url='b', description=DESCRIPTION + " Apply now!"), job(url='c', title="Designer",
+               company="Pixel", description="Design mobile apps in Figma")]
+    unique, clusters = deduplicate(records, key=lambda record: record['url'])
+    assert [record['url'] for record in unique] == ['a', 'c']
+    assert clusters == {'a': ['b']}
+
+
+def test_other_location_or_job_type_is_a_separate_job():
+    records = [job(), job(location="Berlin, Germany"), job(job_type="internship")]
+    unique, clusters = deduplicate(records)
+    assert len(unique) == 3
+    assert clusters == {}
+
+
+def test_records_without_tokens_are_kept():
+    detector = NearDuplicateDetector()
+    assert detector.add('empty', "") is None
+    assert detector.add('also-empty', "") is None
+    assert detector.clusters() == {}
+
+
+def test_shingles_of_short_texts():
+    assert len(shingle_hashes("python developer")) == 1
+    assert shingle_hashes("") == set()
@@ -0,0 +1,38 @@
+import pytest
+
+from utils import facets
+from utils.facets import FacetIndex
+
+RECORDS = [
+    {'type': 'remote', 'city': 'new york'},
+    {'type': 'full-time', 'city': 'boston'},
+    {'type': 'remote', 'city': 'new haven'},
+    {'type': 'internship', 'city': 'boston'},
+]
+
+
+@pytest.fixture(params=['numpy', 'int'])
+def index(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(facets, 'np', None)
+    return FacetIndex(RECORDS, {'type': lambda r: r['type'], 'city': lambda r: r['city']})
+
+
+def test_any_of_and_where(index):
+    remote = index.any_of('type', ['remote'])
+    assert index.rows(remote) == [0, 2]
+    assert index.rows(index.where('city', lambda city: 'new' in city)) == [0, 2]
+    assert index.rows(index.any_of('type', ['remote', 'internship'])) == [0, 2, 3]
+    assert index.rows(index.any_of('type', ['unknown'])) == []
+
+
+def test_bitmaps_combine(index):
+    combined = index.any_of('type', ['remote']) & index.any_of('city', ['new haven'])
+    assert index.rows(combined) == [2]
+    assert index.count(combined) == 1
+    assert index.contains(combined, 2) and not index.contains(combined, 0)
+    assert index.count(index.all()) == 4
+    assert index.count(index.none()) == 0
+    assert sorted(index.values('city')) == ['boston', 'new haven', 'new york']
@@ -0,0 +1,53 @@
+import pytest
+
+from utils.fuzzy_match import SkillSpellIndex, correct_skill, edit_distance, normalize_skills
+
+
+@pytest.mark.parametrize('typed, expected', [
+    ('pyhton', 'python'),
+    ('javscript', 'javascript'),
+    ('Kubernets', 'kubernetes'),
+    ('angualr', 'angular'),
+    ('Postgress', 'postgresql'),
+])
+def test_corrects_misspellings(typed, expected):
+    assert correct_skill(typed) == expected
+
+
+@pytest.mark.parametrize('skill', ['Rust', 'Jest', 'Nest', 'Scss', 'Sketchup', 'PySpark', 'MSSQL'])
+def test_keeps_valid_skills(skill):
+    assert correct_skill(skill) == skill.lower()
+
+
+def test_short_words_need_an_exact_match():
+    index = SkillSpellIndex(['rest', 'react'], vocabulary=())
+    assert index.lookup('rust') is None
+    assert index.lookup('reat') is None
+    assert index.lookup('raect') == 'react'
+
+
+def test_corrections_are_conservative():
+    index = SkillSpellIndex(['spark', 'mysql', 'kotlin', 'typescript'], vocabulary=())
+    # A known skill contained in the word is not a correction of it
+    assert index.lookup('pyspark') is None
+    # Nor is one starting with another letter
+    assert index.lookup('nysql') is None
+    # Words shorter than eight letters may only be one edit away
+    assert index.lookup('kotlnn') == 'kotlin'
+    assert index.lookup('kttlnn') is None
+    assert index.lookup('typscrpt') == 'typescript'
+
+
+def test_ambiguous_typos_are_not_corrected():
+    index = SkillSpellIndex(['kotlin', 'kotlen'], vocabulary=())
+    assert index.lookup('kotlun') is None
+    assert index.lookup('kotlim') == 'kotlin'
+
+
+def test_synonyms_resolve_to_canonical_form():
+    assert normalize_skills(['JS', ' ', 'Node', 'pyhton']) == ['javascript', 'node.js', 'python']
+
+
+def test_edit_distance_counts_transpositions():
+    assert edit_distance('pyhton', 'python', 2) == 1
+    assert edit_distance('abc', 'xyz', 1) == 2
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from models import JobOpportunity, SavedOpportunities, stable_id
+
+
+def make_job(url='https://jobs.example.com/1'):
+    return JobOpportunity("Developer", "Acme", "Remote", "remote", "Build things", url, datetime(2024, 1, 1))
+
+
+def test_stable_ids_follow_the_url():
+    assert make_job().id == make_job().id == stable_id('job', 'https://jobs.example.com/1')
+    assert make_job().id != make_job('https://jobs.example.com/2').id
+    assert make_job().id.startswith('job-')
+
+
+def test_saved_opportunities_keep_copies_in_save_order():
+    first, second = make_job(), make_job('https://jobs.example.com/2')
+    saved = SavedOpportunities([first])
+    assert saved.add(second)
+    assert not saved.add(first)
+
+    assert [job.id for job in saved] == [first.id, second.id]
+    assert first.id in saved and len(saved) == 2
+    assert saved.get(first.id) is not first
+    assert set(saved.ids()) == {first.id, second.id}
+
+
+def test_saved_opportunities_remove_by_id_or_url():
+    job = make_job()
+    saved = SavedOpportunities([job])
+    assert saved.remove(url=job.url)
+    assert not saved.remove(job.id)
+    assert saved.add(job)
+    assert saved.remove(job.id)
+    assert len(saved) == 0
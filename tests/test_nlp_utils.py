@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+from utils import nlp_utils
+from utils.nlp_utils import analyze_answer, analyze_answers, analyze_text
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_token_spans_index_the_original_text():
+    analysis = analyze_text("İstanbul team: Node.js and Machine Learning")
+    assert [analysis.text[start:end].lower() for start, end in analysis.token_spans][-5:] == \
+        ['node', 'js', 'and', 'machine', 'learning']
+    spans = analysis.keyword_spans(['node.js', 'machine learning'])
+    assert [analysis.text[start:end] for start, end in spans['node.js']] == ['Node.js']
+    assert [analysis.text[start:end] for start, end in spans['machine learning']] == ['Machine Learning']
+
+
+def test_keyword_spans_include_aliases():
+    explanation = nlp_utils.explain_match("JavaScript, Node.js and PostgreSQL", "We need JS, NodeJS and Postgres")
+    job = "We need JS, NodeJS and Postgres"
+    spans = {keyword: [job[start:end] for start, end in found] for keyword, found in explanation['job_spans'].items()}
+    assert spans['javascript'] == ['JS']
+    assert spans['node.js'] == ['NodeJS']
+    assert spans['postgresql'] == ['Postgres']
+
+
+def test_token_spans_without_case_expansion():
+    analysis = analyze_text("Python and SQL")
+    assert analysis.token_spans == [(0, 6), (7, 10), (11, 14)]
+
+
+def test_terms_starting_with_punctuation_are_whole_keywords():
+    counts = nlp_utils._count_keywords("senior .net developer with .net core and dotnet")
+    assert counts['.net'] == 3
+    assert 'net' not in counts
+
+
+def test_analyze_answers_matches_analyze_answer():
+    pairs = [("Tell me about a challenging project", "I led the migration to Kubernetes. Maybe it was hard."),
+             ("Why do you want this job?", ""),
+             ("Tell me about a challenging project", "We shipped on time")]
+    assert analyze_answers(pairs) == [analyze_answer(question, answer) for question, answer in pairs]
+
+
+def test_analyze_answers_skips_the_pool_on_one_cpu(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(nlp_utils.os, 'cpu_count', lambda: 1)
+    monkeypatch.setattr(nlp_utils, 'ProcessPoolExecutor', no_pool)
+    pairs = [("Why this role?", "I enjoy building reliable systems")] * (max(nlp_utils.PARALLEL_MIN_ANSWERS.values()) + 1)
+    assert len(analyze_answers(pairs)) == len(pairs)
+
+
+def test_learned_phrases_are_counted_as_keywords(monkeypatch):
+    table = nlp_utils.PhraseTable(min_count=2)
+    assert table.observe(["Build data pipelines daily", "Own our data pipelines", "Unrelated text"]) == 1
+    assert list(table.phrases.values()) == ['data pipelines']
+    monkeypatch.setattr(nlp_utils, 'PHRASES', table)
+
+    counts = nlp_utils._count_keywords("data pipelines, data. pipelines and data pipelines")
+    assert counts['data pipelines'] == 2
+
+
+def test_phrase_keys_do_not_depend_on_the_process():
+    # Tables are shipped to pool workers, which may use another hash seed
+    script = ("from utils.nlp_utils import PhraseTable; t = PhraseTable(); "
+              "t.observe(['cloud platform team'] * 2); print(sorted(t.phrases.items()))")
+    outputs = {
+        subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=ROOT,
+                       env={**os.environ, 'PYTHONHASHSEED': seed}).stdout
+        for seed in ('1', '2')
+    }
+    assert len(outputs) == 1
+    assert 'cloud platform team' in outputs.pop()
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from models import Profile, WorkExperience, Project
+from utils.catalog import CATALOG, CatalogSnapshot
+
+
+def test_skill_gaps_requires_profile(client):
+    response = client.get('/opportunities/skill-gaps')
+    assert response.status_code == 200
+    assert response.get_json()['success'] is False
+
+
+def test_skill_gaps_with_profile_object(app, client, user):
+    profile = Profile(user.username)
+    profile.personal_info['summary'] = "Backend developer"
+    profile.skills = ["Python", "Flask"]
+    profile.experience = [WorkExperience("Developer", "Acme", "Remote", "2020", "2023",
+                                         "Built REST APIs", ["Maintained PostgreSQL databases"])]
+    profile.projects = [Project("Tracker", "Issue tracker", ["Docker"])]
+    app.profiles[user.username] = profile
+
+    response = client.get('/opportunities/skill-gaps?limit=5')
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['jobs_considered'] > 0
+    missing = [gap['skill'] for gap in data['skills']]
+    assert len(missing) <= 5
+    assert not {'python', 'flask', 'docker', 'postgresql'} & set(missing)
+
+
+def test_jobs_page_with_malformed_cursor(app, client):
+    app.jinja_env.globals['now'] = datetime.now
+    response = client.get('/opportunities/jobs?limit=5&cursor=eyJvZmZzZXQiOiAxZTQwMH0')
+    assert response.status_code == 200
+
+
+def test_save_and_remove_job_by_id(app, client, user, finder, monkeypatch):
+    monkeypatch.setattr(CATALOG, '_snapshot', CatalogSnapshot(1, finder))
+    job = finder.mock_jobs[0]
+
+    assert client.post('/opportunities/save-job', data={'job_id': job.id}).get_json()['success']
+    assert job.id in app.saved_opportunities[user.username]
+    assert not client.post('/opportunities/save-job', data={'job_id': job.id}).get_json()['success']
+    assert client.post('/opportunities/remove-saved', data={'id': job.id}).get_json()['success']
+    assert len(app.saved_opportunities[user.username]) == 0
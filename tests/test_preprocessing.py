@@ -0,0 +1,35 @@
+from utils.preprocessing import CorpusArtifacts, iter_preprocessed, preprocess_corpus
+
+TEXTS = [
+    "Python developer building data pipelines on AWS",
+    "React frontend engineer, TypeScript and CSS",
+    "DevOps engineer: Kubernetes, Docker, CI/CD",
+    "Data scientist with machine learning and SQL",
+    "Backend developer for data pipelines in Go",
+]
+
+
+def test_serial_and_pool_results_match():
+    serial = preprocess_corpus(TEXTS, workers=1)
+    pooled = preprocess_corpus(iter(TEXTS), workers=2, chunk_size=2, max_in_flight=1)
+    assert pooled.keywords == serial.keywords
+    if serial.vectors is not None:
+        assert (pooled.vectors == serial.vectors).all()
+    assert len(serial) == len(TEXTS)
+
+
+def test_chunks_come_back_in_order():
+    chunks = list(iter_preprocessed(TEXTS, workers=1, chunk_size=2))
+    assert [len(keywords) for keywords, _ in chunks] == [2, 2, 1]
+
+
+def test_artifacts_round_trip(tmp_path):
+    artifacts = preprocess_corpus(TEXTS, workers=1)
+    artifacts.save(str(tmp_path))
+    loaded = CorpusArtifacts.load(str(tmp_path))
+    assert loaded.keywords == artifacts.keywords
+    assert len(loaded.documents) == len(TEXTS)
+    if artifacts.vectors is not None:
+        assert (loaded.vectors == artifacts.vectors).all()
+        index = loaded.vector_index(keys=range(len(TEXTS)))
+        assert index.search(artifacts.vectors[2], limit=1)[0][0] == 2
@@ -0,0 +1,92 @@
+import pytest
+
+from utils.nlp_utils import extract_keywords
+from utils.search_index import BM25Index, index_terms
+
+
+@pytest.fixture
+def index():
+    index = BM25Index({'title': 3.0, 'description': 1.0})
+    index.add('db', {'title': "Database Administrator", 'description': "Maintain PostgreSQL clusters"})
+    index.add('data', {'title': "Data Analyst", 'description': "Dashboards and reporting"})
+    index.add('ml', {'title': "ML Engineer", 'description': "Train AI models on Kubernetes"})
+    index.add('web', {'title': "Web Developer", 'description': "Build React front ends"})
+    return index
+
+
+def matches(index, query):
+    return set(index.score(query))
+
+
+def test_exact_term_also_matches_its_prefix_extensions(index):
+    assert matches(index, 'data') == {'db', 'data'}
+
+
+def test_partial_word_matches_full_term(index):
+    assert matches(index, 'kube') == {'ml'}
+    assert matches(index, 'datab') == {'db'}
+
+
+def test_short_tokens_match_as_substrings(index):
+    # "ai" is shorter than MIN_PREFIX: it matches "ai" and "maintain"
+    assert matches(index, 'ai') == {'db', 'ml'}
+
+
+def test_language_names_with_symbols_are_whole_terms(index):
+    index.add('cs', {'title': "C# Developer", 'description': "ASP.NET services on .NET"})
+    index.add('cpp', {'title': "Systems Engineer", 'description': "Modern C++ and some F#"})
+    assert matches(index, 'c#') == {'cs'}
+    assert matches(index, 'csharp') == {'cs'}
+    assert matches(index, 'c++') == {'cpp'}
+    assert matches(index, 'f#') == {'cpp'}
+    assert matches(index, '.net') == {'cs'}
+    # A single character is not expanded to every term containing it
+    assert matches(index, 'c') == set()
+
+
+def test_keyword_tokens_are_intersected_and_keywords_united(index):
+    assert matches(index, 'react developer') == {'web'}
+    assert matches(index, 'react analyst') == set()
+    assert matches(index, ['react', 'analyst']) == {'web', 'data'}
+
+
+def test_title_matches_rank_above_description_matches(index):
+    ranked = [doc_id for doc_id, _ in index.search('database')]
+    assert ranked[0] == 'db'
+
+
+def test_removed_documents_leave_no_prefixes(index):
+    assert index.remove('ml')
+    assert not index.remove('ml')
+    assert matches(index, 'kube') == set()
+    assert 'ml' not in index
+    assert len(index) == 3
+
+
+def test_index_terms_keep_js_frameworks_whole():
+    terms = index_terms("Vue.js, React.js and Node.js")
+    assert set(terms) == {'vue.js', 'react', 'node.js'}
+    assert 'javascript' not in terms
+
+
+def test_index_terms_resolve_multi_word_aliases():
+    assert index_terms("Google Cloud")['gcp'] == 1
+    assert index_terms("artificial intelligence and AI")['ai'] == 2
+    assert set(index_terms("google cloud", parts=False)) == {'gcp'}
+
+
+def test_search_and_scoring_agree_on_canonical_terms():
+    text = "Vue.js and Node.js on Google Cloud with ML"
+    canonical = {'vue.js', 'node.js', 'gcp', 'machine learning'}
+    assert canonical <= set(index_terms(text))
+    assert canonical <= set(extract_keywords(text, limit=None))
+
+
+def test_aliases_match_canonical_documents():
+    index = BM25Index({'description': 1.0})
+    index.add('gcp', {'description': "Deploy services on GCP"})
+    index.add('vue', {'description': "Vue.js single page apps"})
+    index.add('js', {'description': "Plain JavaScript widgets"})
+    assert set(index.score('google cloud')) == {'gcp'}
+    assert set(index.score('vuejs')) == {'vue'}
+    assert set(index.score('js')) == {'js'}
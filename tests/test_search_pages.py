@@ -0,0 +1,92 @@
+import base64
+import json
+import random
+
+import pytest
+
+from utils.opportunity_finder import SearchPage, _decode_cursor, _encode_cursor
+
+
+def raw_cursor(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+
+
+def test_cursor_round_trip():
+    assert _decode_cursor(_encode_cursor(40)) == 40
+    assert _decode_cursor(None) == 0
+
+
+@pytest.mark.parametrize('cursor', [
+    '!!!',
+    'bm90IGpzb24',
+    raw_cursor([1]),
+    raw_cursor({'page': 2}),
+    raw_cursor({'offset': -5}),
+    raw_cursor({'offset': '7'}),
+    raw_cursor({'offset': 2.5}),
+    raw_cursor({'offset': True}),
+    base64.urlsafe_b64encode(b'{"offset": 1e400}').decode(),
+])
+def test_malformed_cursors_start_from_the_first_page(cursor):
+    assert _decode_cursor(cursor) == 0
+
+
+def test_search_page_is_a_list():
+    page = SearchPage([1, 2], total=5, next_cursor='abc')
+    assert page == [1, 2]
+    assert (page.total, page.next_cursor) == (5, 'abc')
+
+
+@pytest.mark.parametrize('search, kwargs', [
+    ('search_jobs', {}),
+    ('search_jobs', {'keywords': ['developer']}),
+    ('search_hackathons', {}),
+    ('search_hackathons', {'keywords': ['ai']}),
+])
+def test_pages_concatenate_to_the_full_results(finder, search, kwargs):
+    search = getattr(finder, search)
+    full = search(**kwargs)
+    pages, cursor = [], None
+    while True:
+        page = search(limit=3, cursor=cursor, **kwargs)
+        assert page.total == len(full)
+        pages.extend(page)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert [item.id for item in pages] == [item.id for item in full]
+
+
+@pytest.mark.parametrize('limit', [0, -1, 2.5, True])
+@pytest.mark.parametrize('search', ['search_jobs', 'search_hackathons'])
+def test_page_size_must_be_positive(finder, search, limit):
+    with pytest.raises(ValueError):
+        getattr(finder, search)(limit=limit)
+
+
+def test_profile_search_pages_follow_match_score(finder):
+    profile = {'skills': ["Python", "AWS"]}
+    full = finder.search_jobs(profile=profile)
+    first = finder.search_jobs(profile=profile, limit=5)
+    assert [job.id for job in first] == [job.id for job in full[:5]]
+    scores = [job.match_score for job in full]
+    assert scores == sorted(scores, reverse=True)
+    # Scores are stamped on copies; the shared catalog is untouched
+    assert all(job.match_score == 0 for job in finder.mock_jobs)
+
+
+def test_lookup_by_stable_id(finder):
+    job = finder.mock_jobs[0]
+    assert finder.get_job(job.id) is job
+    assert finder.get_job('job-missing') is None
+
+
+def test_regenerated_catalog_keeps_ids_on_the_same_postings(finder):
+    random.seed(1)
+    regenerated = {job.id: job for job in finder._generate_mock_jobs()}
+    for job in finder.mock_jobs:
+        other = regenerated.get(job.id)
+        if other is not None:
+            assert (other.title, other.company, other.location, other.description) == \
+                (job.title, job.company, job.location, job.description)
+    assert set(regenerated) != set(finder.jobs_by_id)
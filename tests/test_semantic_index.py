@@ -0,0 +1,42 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from utils.semantic_index import VectorIndex, embed, text_features
+
+
+def test_embeddings_are_normalized_and_canonical():
+    vector = embed("Senior JS developer")
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert not embed("").any()
+    assert 'w:javascript' in text_features("JS developer")
+
+
+def test_similar_texts_are_nearest():
+    index = VectorIndex(min_train_size=1000)
+    texts = {
+        'ml': "Machine learning engineer with Python and TensorFlow",
+        'web': "Frontend developer with React and CSS",
+        'ops': "DevOps engineer running Kubernetes and Docker",
+    }
+    for key, text in texts.items():
+        index.add(key, embed(text))
+    assert index.search(embed("ML engineer using TensorFlow"), limit=1)[0][0] == 'ml'
+    assert index.remove('ml') and 'ml' not in index
+    assert 'ml' not in [key for key, _ in index.search(embed("machine learning"), limit=3)]
+
+
+def test_trained_index_round_trips(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(300, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = VectorIndex(dimensions=32, nprobe=4, min_train_size=100)
+    for key, vector in enumerate(vectors):
+        index.add(key, vector)
+    assert index.search(vectors[42], limit=1)[0][0] == 42
+
+    path = str(tmp_path / 'index.npz')
+    index.save(path)
+    loaded = VectorIndex.load(path)
+    assert len(loaded) == 300
+    assert loaded.search(vectors[7], limit=3) == index.search(vectors[7], limit=3)
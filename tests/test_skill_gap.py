@@ -0,0 +1,65 @@
+from utils.skill_gap import SkillMatrix, profile_skill_columns
+
+JOBS = [
+    {'title': "Backend Developer", 'location': "Boston", 'description': "Python, Django and PostgreSQL on AWS"},
+    {'title': "Backend Developer", 'location': "Remote", 'description': "Python and Docker with Kubernetes"},
+    {'title': "Frontend Developer", 'location': "Boston", 'description': "React and TypeScript"},
+]
+
+
+def matrix():
+    skill_matrix = SkillMatrix()
+    for job in JOBS:
+        skill_matrix.add(job)
+    return skill_matrix
+
+
+def gap_skills(result):
+    return [gap['skill'] for gap in result['skills']]
+
+
+def test_aliases_share_the_canonical_column():
+    skill_matrix = matrix()
+    assert skill_matrix.skill_columns("k8s") == skill_matrix.skill_columns("Kubernetes")
+
+
+def test_missing_skills_for_a_role():
+    skill_matrix = matrix()
+    columns = profile_skill_columns(skill_matrix, {'skills': ["Python"]})
+    result = skill_matrix.skill_gaps(columns, role="backend")
+    assert result['jobs_considered'] == 2
+    missing = gap_skills(result)
+    assert 'python' not in missing
+    assert {'django', 'docker', 'kubernetes'} <= set(missing)
+    assert 'react' not in missing
+
+
+def test_profile_objects_and_profile_text_count():
+    from models import Profile
+    skill_matrix = matrix()
+    profile = Profile('tester')
+    profile.skills = ["pyhton"]
+    columns = profile_skill_columns(skill_matrix, profile, "Shipped Docker images")
+    assert columns == set(skill_matrix.skill_columns("python docker"))
+
+
+def test_location_filter():
+    result = matrix().skill_gaps(set(), location="boston", limit=50)
+    assert result['jobs_considered'] == 2
+    assert 'docker' not in gap_skills(result)
+
+
+def test_profile_without_known_skills_still_gets_gaps():
+    result = matrix().skill_gaps(set(), role="backend")
+    assert result['jobs_considered'] == 2
+    # Python is asked for by both backend jobs
+    assert gap_skills(result)[0] == 'python'
+
+
+def test_python_fallback_matches_numpy(monkeypatch):
+    from utils import skill_gap
+    skill_matrix = matrix()
+    columns = profile_skill_columns(skill_matrix, {'skills': ["Python"]})
+    expected = skill_matrix.skill_gaps(columns, limit=50)
+    monkeypatch.setattr(skill_gap, 'np', None)
+    assert skill_matrix.skill_gaps(columns, limit=50) == expected
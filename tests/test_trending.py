@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from utils.trending import CountMinSketch, SpaceSaving, TrendingSkills
+
+NOW = datetime(2024, 6, 30, 12)
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = CountMinSketch(width=64, depth=4)
+    for i in range(500):
+        sketch.add(f"item-{i % 50}")
+    assert all(sketch.estimate(f"item-{i}") >= 10 for i in range(50))
+
+
+def test_space_saving_keeps_heavy_hitters():
+    tracker = SpaceSaving(capacity=3)
+    for item in ['python'] * 20 + ['a', 'b', 'c', 'd', 'e'] + ['docker'] * 10:
+        tracker.add(item)
+    assert {'python', 'docker'} <= set(tracker.candidates())
+    assert len(tracker.candidates()) == 3
+
+
+def test_skills_are_counted_once_per_job_in_canonical_form():
+    trending = TrendingSkills()
+    assert trending.observe("Backend Developer", "Remote", "JS, JavaScript and k8s", when=NOW, key='a')
+    assert not trending.observe("Backend Developer", "Remote", "JS again", when=NOW, key='a')
+    top = dict(trending.top_skills(now=NOW))
+    assert top == {'javascript': 1, 'kubernetes': 1}
+
+
+def test_trending_compares_with_the_previous_window():
+    trending = TrendingSkills()
+    for day in range(7, 14):
+        trending.observe("Developer", "Boston", "Python", when=NOW - timedelta(days=day))
+    for day in range(7):
+        for _ in range(3):
+            trending.observe("Developer", "Boston", "Rust and Docker", when=NOW - timedelta(days=day))
+        trending.observe("Developer", "Boston", "Python", when=NOW - timedelta(days=day))
+
+    rising = trending.trending(now=NOW, role="developer", location="boston")
+    assert rising[0]['skill'] == 'docker'
+    assert rising[0]['previous'] == 0
+    assert 'python' in [item['skill'] for item in rising]
+    assert trending.trending(now=NOW, role="designer") == []
@@ -0,0 +1,146 @@
+import os
+import sys
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+# Default memory ceiling for cached analysis results (bytes)
+DEFAULT_MAX_BYTES = int(os.environ.get("NLP_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+def _estimate_size(value):
+    """Roughly estimate the memory footprint of a cached result in bytes"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
+
+def content_key(namespace, arguments):
+    """
+    Build a content-addressed cache key
+
+    Args:
+        namespace (str): Name of the cached function
+        arguments (dict): Parameter name to value; strings and objects with a
+            text attribute (TextAnalysis) are hashed by their text
+
+    Returns:
+        tuple: (namespace, hex digest)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, value in arguments.items():
+        if isinstance(value, str):
+            data = value
+        elif isinstance(getattr(value, 'text', None), str):
+            data = value.text
+        else:
+            data = repr(value)
+        digest.update(name.encode('utf-8'))
+        digest.update(b'=')
+        digest.update(data.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\x00')
+    return namespace, digest.hexdigest()
+
+class AnalysisCache:
+    """Thread-safe LRU cache for text analysis results with a memory ceiling"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Store a value, evicting least recently used entries over the ceiling"""
+        if self.max_bytes <= 0:
+            # Caching disabled; skip sizing the value
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, namespace=None):
+        """
+        Drop cached results
+
+        Args:
+            namespace (str): Only drop results of this function (default: all)
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                return
+
+            for key in [k for k in self._entries if k[0] == namespace]:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        """Return hit/miss/eviction counters and memory usage"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def memoize(self, namespace, copy=None):
+        """
+        Decorator caching a text analysis function by content
+
+        Args:
+            namespace (str): Name used in cache keys and for invalidation
+            copy (callable): Applied to results handed out, so callers can
+                mutate them without corrupting the cache
+        """
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                # Bind so extract_keywords(text) and extract_keywords(text, limit=20) share a key
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = content_key(namespace, bound.arguments)
+                result = self.get(key, _MISSING)
+                if result is _MISSING:
+                    result = func(*args, **kwargs)
+                    self.put(key, result)
+                return copy(result) if copy else result
+            return wrapper
+        return decorator
+
+_MISSING = object()
@@ -0,0 +1,111 @@
+import logging
+import threading
+from datetime import datetime
+from utils.opportunity_finder import OpportunityFinder
+
+class CatalogSnapshot:
+    """
+    One loaded version of the opportunity catalog
+
+    A snapshot is never modified after it is published; a refresh builds a
+    new one. Requests should take a snapshot once and use it throughout, so
+    every lookup in a request sees the same data.
+    """
+
+    __slots__ = ('version', 'finder', 'loaded_at')
+
+    def __init__(self, version, finder):
+        self.version = version
+        self.finder = finder
+        self.loaded_at = datetime.now()
+
+    @property
+    def jobs(self):
+        return self.finder.mock_jobs
+
+    @property
+    def hackathons(self):
+        return self.finder.mock_hackathons
+
+class OpportunityCatalog:
+    """
+    Process-wide opportunity catalog shared by all blueprints
+
+    The current snapshot is a single reference, so readers take it without
+    locking and never see a half-built catalog. The first reader loads it;
+    refresh builds the next version off to the side and swaps it in
+    atomically. Readers holding the old snapshot keep using it until their
+    request ends.
+    """
+
+    def __init__(self, loader=OpportunityFinder):
+        """
+        Args:
+            loader (callable): Builds a fully indexed OpportunityFinder
+        """
+        self._loader = loader
+        self._snapshot = None
+        self._version = 0
+        # Serializes loads and refreshes; readers never take it once loaded
+        self._build_lock = threading.Lock()
+
+    def snapshot(self):
+        """
+        Current catalog snapshot, loading it on first use
+
+        Returns:
+            CatalogSnapshot: The published snapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._build_lock:
+                if self._snapshot is None:
+                    self._publish(self._loader())
+                snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def finder(self):
+        """OpportunityFinder of the current snapshot"""
+        return self.snapshot().finder
+
+    @property
+    def version(self):
+        """Version of the published snapshot (0 before the first load)"""
+        snapshot = self._snapshot
+        return snapshot.version if snapshot is not None else 0
+
+    def refresh(self):
+        """
+        Rebuild the catalog and swap it in
+
+        Returns:
+            CatalogSnapshot: The new snapshot
+        """
+        with self._build_lock:
+            return self._publish(self._loader())
+
+    def swap(self, finder):
+        """
+        Publish an already built finder (e.g. from a background ingestion job)
+
+        Args:
+            finder (OpportunityFinder): Fully indexed catalog
+
+        Returns:
+            CatalogSnapshot: The new snapshot
+        """
+        with self._build_lock:
+            return self._publish(finder)
+
+    def _publish(self, finder):
+        self._version += 1
+        snapshot = CatalogSnapshot(self._version, finder)
+        # A single reference assignment: readers see the old or the new snapshot
+        self._snapshot = snapshot
+        logging.info(f"Opportunity catalog version {snapshot.version} published "
+                     f"({len(snapshot.jobs)} jobs, {len(snapshot.hackathons)} hackathons)")
+        return snapshot
+
+# Loaded once per process, on first use
+CATALOG = OpportunityCatalog()
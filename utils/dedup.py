@@ -0,0 +1,188 @@
+import random
+import zlib
+import logging
+from utils.nlp_utils import analyze_text
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Mersenne prime used by the universal hash family (values fit in 31 bits)
+_PRIME = (1 << 31) - 1
+
+# Fields compared when looking for syndicated copies of the same posting
+JOB_DEDUP_FIELDS = ('title', 'company', 'description')
+# Fields a copy must match exactly: the same role in another location or
+# of another type is a separate job, however similar the text
+JOB_DEDUP_KEY_FIELDS = ('location', 'job_type')
+
+def _record_text(record, fields):
+    """Join the given fields of a model object or dict into one text"""
+    if isinstance(record, dict):
+        values = (record.get(field) for field in fields)
+    else:
+        values = (getattr(record, field, None) for field in fields)
+    return " ".join(value for value in values if value)
+
+def _record_group(record, fields):
+    """Normalized values of the exact-match fields of a record"""
+    if isinstance(record, dict):
+        values = (record.get(field) for field in fields)
+    else:
+        values = (getattr(record, field, None) for field in fields)
+    return tuple((value or "").strip().lower() for value in values)
+
+def shingle_hashes(text, size=3):
+    """
+    Hash the word n-gram shingles of a text
+
+    Args:
+        text (str or TextAnalysis): Text to shingle
+        size (int): Words per shingle (shorter texts use their whole token list)
+
+    Returns:
+        set: 31-bit shingle hashes
+    """
+    tokens = analyze_text(text).tokens
+    if len(tokens) < size:
+        size = len(tokens)
+    return {
+        zlib.crc32(" ".join(tokens[i:i + size]).encode('utf-8')) % _PRIME
+        for i in range(len(tokens) - size + 1)
+    } if size else set()
+
+class NearDuplicateDetector:
+    """
+    Streaming near-duplicate detection with MinHash signatures and LSH banding
+
+    Every record costs one signature plus one bucket lookup per band, so
+    bulk ingestion is linear in the number of records. Only canonical
+    records are kept in the buckets; a record whose estimated Jaccard
+    similarity with a bucket-mate reaches the threshold joins that
+    canonical record's cluster instead of being kept.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=64, bands=16, seed=1):
+        """
+        Args:
+            threshold (float): Estimated Jaccard similarity for a duplicate
+            num_perm (int): MinHash signature length
+            bands (int): LSH bands (num_perm must be divisible by bands)
+            seed (int): Seed for the hash family, so signatures are reproducible
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}  # canonical key -> signature
+        self._clusters = {}  # canonical key -> [duplicate keys]
+
+    def signature(self, text):
+        """
+        Compute the MinHash signature of a text
+
+        Returns:
+            tuple: num_perm minimum hash values, or None for texts without tokens
+        """
+        hashes = shingle_hashes(text)
+        if not hashes:
+            return None
+
+        if np is not None:
+            values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+            return tuple((((self._a_np * values) + self._b_np) % _PRIME).min(axis=1).tolist())
+
+        return tuple(
+            min((a * value + b) % _PRIME for value in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def _similarity(self, signature, other):
+        return sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+
+    def add(self, key, text, group=None):
+        """
+        Register a record
+
+        Args:
+            key: Unique record identifier
+            text (str): Text compared for near-duplicates
+            group: Hashable value a duplicate must share (e.g. location and job type)
+
+        Returns:
+            Key of the canonical record this one duplicates, or None if it is new
+        """
+        signature = self.signature(text)
+        if signature is None:
+            self._clusters.setdefault(key, [])
+            return None
+
+        rows = self.rows
+        # Records of different groups never share a bucket, so they are never compared
+        band_keys = [(group, signature[i * rows:(i + 1) * rows]) for i in range(self.bands)]
+
+        checked = set()
+        for bucket, band_key in zip(self._buckets, band_keys):
+            for candidate in bucket.get(band_key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self._similarity(signature, self._signatures[candidate]) >= self.threshold:
+                    self._clusters[candidate].append(key)
+                    return candidate
+
+        self._signatures[key] = signature
+        self._clusters[key] = []
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, []).append(key)
+        return None
+
+    def clusters(self):
+        """
+        Report the duplicate clusters found so far
+
+        Returns:
+            dict: Canonical key to the keys collapsed into it (only clusters with duplicates)
+        """
+        return {key: list(duplicates) for key, duplicates in self._clusters.items() if duplicates}
+
+def deduplicate(records, fields=JOB_DEDUP_FIELDS, key=None, detector=None, key_fields=JOB_DEDUP_KEY_FIELDS):
+    """
+    Collapse near-duplicate records into their first occurrence
+
+    Args:
+        records (iterable): Model objects or dicts
+        fields (tuple): Fields compared for similarity
+        key (callable): Record identifier (defaults to the position in records)
+        detector (NearDuplicateDetector): Existing detector to extend
+        key_fields (tuple): Fields duplicates must match exactly (case-insensitive)
+
+    Returns:
+        tuple: (canonical records in input order, {canonical key: [duplicate keys]})
+    """
+    detector = detector or NearDuplicateDetector()
+    unique = []
+
+    for position, record in enumerate(records):
+        record_key = key(record) if key else position
+        if detector.add(record_key, _record_text(record, fields), _record_group(record, key_fields)) is None:
+            unique.append(record)
+
+    clusters = detector.clusters()
+    if clusters:
+        logging.info("Collapsed %d near-duplicate postings into %d records",
+                     sum(len(d) for d in clusters.values()), len(clusters))
+    return unique, clusters
@@ -0,0 +1,105 @@
+import logging
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.info("NumPy not installed; facet bitmaps will use Python integers")
+
+class FacetIndex:
+    """
+    Bitmap index over facet values of a fixed list of records
+
+    Every distinct value of every facet gets a bitmap with one bit per
+    record, built once when the catalog is loaded. A filter is a few bitwise
+    AND/OR operations on bitmaps, whose cost depends on the catalog size in
+    machine words rather than on Python objects, plus one pass per distinct
+    value for substring facets like location. Bitmaps are NumPy bool arrays,
+    or Python integers used as bit sets without NumPy; both support & and |.
+    """
+
+    def __init__(self, records, facets):
+        """
+        Args:
+            records (list): Records, addressed by position
+            facets (dict): Facet name to a function reading its value from a record
+        """
+        self.size = len(records)
+        self._bitmaps = {}  # facet -> value -> bitmap
+        for name, read in facets.items():
+            rows_by_value = {}
+            for row, record in enumerate(records):
+                rows_by_value.setdefault(read(record), []).append(row)
+            self._bitmaps[name] = {value: self._bitmap(rows) for value, rows in rows_by_value.items()}
+
+    def _bitmap(self, rows):
+        if np is not None:
+            bitmap = np.zeros(self.size, dtype=bool)
+            bitmap[rows] = True
+            return bitmap
+        bits = 0
+        for row in rows:
+            bits |= 1 << row
+        return bits
+
+    def all(self):
+        """Bitmap with every record set"""
+        if np is not None:
+            return np.ones(self.size, dtype=bool)
+        return (1 << self.size) - 1
+
+    def none(self):
+        """Bitmap with no record set"""
+        if np is not None:
+            return np.zeros(self.size, dtype=bool)
+        return 0
+
+    def values(self, facet):
+        """Distinct values of a facet"""
+        return list(self._bitmaps[facet])
+
+    def any_of(self, facet, values):
+        """
+        Records whose facet value is one of values (OR of their bitmaps)
+
+        Args:
+            facet (str): Facet name
+            values (iterable): Accepted values; unknown values match nothing
+
+        Returns:
+            Bitmap of the matching records
+        """
+        bitmaps = self._bitmaps[facet]
+        result = self.none()
+        for value in values:
+            bitmap = bitmaps.get(value)
+            if bitmap is not None:
+                result = result | bitmap
+        return result
+
+    def where(self, facet, predicate):
+        """Records whose facet value satisfies predicate (tested once per distinct value)"""
+        return self.any_of(facet, [value for value in self._bitmaps[facet] if predicate(value)])
+
+    def rows(self, bitmap):
+        """Positions of the set records, ascending"""
+        if np is not None:
+            return np.flatnonzero(bitmap).tolist()
+        rows = []
+        while bitmap:
+            lowest = bitmap & -bitmap
+            rows.append(lowest.bit_length() - 1)
+            bitmap ^= lowest
+        return rows
+
+    def contains(self, bitmap, row):
+        """Whether a record is set in a bitmap"""
+        if np is not None:
+            return bool(bitmap[row])
+        return bool(bitmap >> row & 1)
+
+    def count(self, bitmap):
+        """Number of set records"""
+        if np is not None:
+            return int(np.count_nonzero(bitmap))
+        return bin(bitmap).count('1')
@@ -0,0 +1,190 @@
+import threading
+from utils.nlp_utils import TECH_TERMS
+from utils.synonyms import canonicalize
+
+# Skill vocabulary misspellings are resolved against
+KNOWN_SKILLS = TECH_TERMS + (
+    'typescript', 'django', 'flask', 'postgresql', 'postgres', 'mysql', 'sqlite',
+    'redis', 'graphql', 'terraform', 'tensorflow', 'pytorch', 'scikit-learn',
+    'pandas', 'numpy', 'golang', 'ruby', 'rails', 'spring boot', 'express',
+    'firebase', 'heroku', 'gcp', 'linux', 'git', 'jenkins', 'spark', 'hadoop',
+    'scala', 'kotlin', 'swift', 'figma', 'sketch', 'vue.js', '.net', 'grpc',
+    'microservices', 'rest', 'restful apis', 'tableau', 'excel'
+)
+
+# Correctly spelled skills that are never rewritten, even when they are one or
+# two edits away from a known skill ("rust" is not a typo of "rest")
+SKILL_VOCABULARY = KNOWN_SKILLS + (
+    'rust', 'jest', 'nest', 'nestjs', 'next.js', 'nuxt', 'svelte', 'ember', 'jquery',
+    'scss', 'sass', 'less', 'tailwind', 'bootstrap', 'webpack', 'vite', 'babel',
+    'php', 'laravel', 'symfony', 'perl', 'lua', 'dart', 'flutter', 'elixir', 'erlang',
+    'haskell', 'clojure', 'julia', 'matlab', 'fortran', 'cobol', 'bash', 'shell',
+    'powershell', 'c', 'c++', 'c#', 'f#', 'r', 'go', 'groovy', 'gradle', 'maven',
+    'ansible', 'puppet', 'chef', 'helm', 'nginx', 'apache', 'kafka', 'rabbitmq',
+    'elasticsearch', 'cassandra', 'dynamodb', 'oracle', 'mariadb', 'mssql', 'neo4j', 'snowflake',
+    'pyspark', 'airflow', 'dbt', 'looker', 'power bi', 'keras', 'opencv', 'spacy', 'nltk', 'xgboost',
+    'unity', 'unreal', 'blender', 'sketchup', 'autocad', 'photoshop', 'illustrator',
+    'invision', 'zeplin', 'jira', 'confluence', 'trello', 'notion', 'slack', 'github',
+    'gitlab', 'bitbucket', 'vercel', 'netlify', 'supabase', 'prisma', 'sequelize',
+    'selenium', 'cypress', 'playwright', 'mocha', 'chai', 'pytest', 'junit', 'vagrant',
+    'unix', 'windows', 'macos', 'ios', 'android', 'xamarin', 'ionic', 'electron',
+    'solidity', 'web3', 'hive', 'presto', 'flink', 'storm', 'sas', 'spss', 'stata'
+)
+
+def _max_distance_for(word, max_distance):
+    """
+    Allowed edit distance for a word
+
+    Words of four letters or fewer must match exactly and words shorter than
+    eight letters may differ by one edit; only longer words get max_distance.
+    """
+    if len(word) <= 4:
+        return 0
+    if len(word) < 8:
+        return min(1, max_distance)
+    return max_distance
+
+def _plausible_correction(word, term):
+    """
+    Whether a term is a believable correction of a word
+
+    Typos rarely hit the first letter, and a term contained in the word
+    ("spark" in "pyspark") is more likely a different, more specific skill.
+    """
+    return term[0] == word[0] and term not in word
+
+def edit_distance(a, b, limit):
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions)
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        limit (int): Give up once the distance must exceed this
+
+    Returns:
+        int: Distance, or limit + 1 if it exceeds the limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+class SkillSpellIndex:
+    """
+    Symmetric-delete (SymSpell) index for typo-tolerant skill lookup
+
+    Every vocabulary term is stored under all strings reachable by deleting
+    up to max_distance characters. A lookup generates the same deletes for
+    the query and only verifies the handful of terms sharing one, so the
+    cost does not grow with the size of the vocabulary.
+    """
+
+    def __init__(self, terms=KNOWN_SKILLS, max_distance=2, vocabulary=SKILL_VOCABULARY):
+        """
+        Args:
+            terms (iterable): Skills that misspellings are corrected to
+            max_distance (int): Largest edit distance that is corrected
+            vocabulary (iterable): Correctly spelled skills that are kept as typed
+        """
+        self.max_distance = max_distance
+        self._vocabulary = {term.lower() for term in vocabulary}
+        self._terms = set()
+        self._deletes = {}
+        self._lock = threading.Lock()
+        for term in terms:
+            self.add(term)
+
+    def __contains__(self, term):
+        return term.lower() in self._terms
+
+    def _variants(self, word, distance):
+        """The word and every string reachable by deleting up to distance characters"""
+        variants = {word}
+        frontier = {word}
+        for _ in range(distance):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+            variants |= frontier
+        return variants
+
+    def add(self, term):
+        """Add a correctly spelled term to the vocabulary"""
+        term = term.lower()
+        if term in self._terms:
+            return
+        with self._lock:
+            self._terms.add(term)
+            for variant in self._variants(term, _max_distance_for(term, self.max_distance)):
+                self._deletes.setdefault(variant, set()).add(term)
+
+    def lookup(self, word):
+        """
+        Find the closest vocabulary term
+
+        Args:
+            word (str): Possibly misspelled skill
+
+        Returns:
+            str or None: The word itself if it is a known or otherwise valid
+                skill, else the single nearest term within the allowed
+                distance (None if there is none or several are equally near)
+        """
+        word = word.strip().lower()
+        if not word:
+            return None
+        if word in self._terms or word in self._vocabulary:
+            return word
+
+        limit = _max_distance_for(word, self.max_distance)
+        best, best_distance, tied = None, limit + 1, False
+        seen = set()
+        for variant in self._variants(word, limit):
+            for term in self._deletes.get(variant, ()):
+                if term in seen:
+                    continue
+                seen.add(term)
+                if not _plausible_correction(word, term):
+                    continue
+                distance = edit_distance(word, term, min(limit, best_distance))
+                if distance < best_distance:
+                    best, best_distance, tied = term, distance, False
+                elif distance == best_distance and best is not None:
+                    tied = True
+        # An ambiguous typo is left alone rather than guessed
+        return None if tied else best
+
+# Shared index over the known skill vocabulary
+SKILL_INDEX = SkillSpellIndex()
+
+def correct_skill(skill):
+    """
+    Resolve a possibly misspelled skill to its canonical spelling
+
+    Args:
+        skill (str): Skill as typed by the user
+
+    Returns:
+        str: Canonical form of the known skill it resolves to, or of the
+            input if none is close ("JS" and "javscript" both give "javascript")
+    """
+    skill = canonicalize(skill)
+    return canonicalize(SKILL_INDEX.lookup(skill) or skill)
+
+def normalize_skills(skills):
+    """Correct a list of user-entered skills, keeping their order"""
+    return [correct_skill(skill) for skill in skills if skill and skill.strip()]
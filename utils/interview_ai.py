@@ -1,5 +1,5 @@
 import random
-import re
+from utils.nlp_utils import LexiconMatcher, QUESTION_KEYWORDS
 
 # Sample question templates for different interview types
 HR_QUESTIONS = [
@@ -129,6 +129,12 @@ GENERIC_TECHNICAL_QUESTIONS = [
     "Describe a situation where you had to explain technical concepts to non-technical stakeholders."
 ]
 
+# Keywords of every bank question are computed once, for answer scoring
+QUESTION_KEYWORDS.register(
+    HR_QUESTIONS + BEHAVIORAL_QUESTIONS + GENERIC_TECHNICAL_QUESTIONS
+    + [question for questions in TECHNICAL_QUESTIONS.values() for question in questions]
+)
+
 def generate_interview_questions(job_role, interview_type, num_questions=5):
     """
     Generate interview questions based on the job role and interview type.
@@ -171,6 +177,24 @@ def generate_interview_questions(job_role, interview_type, num_questions=5):
     
     return questions
 
+# Lexicons checked by analyze_answer
+EXAMPLE_PHRASES = ['for example', 'for instance', 'e.g.', 'specifically', 'in particular', 'in my experience']
+FILLER_WORDS = ['um', 'uh', 'like', 'you know', 'sort of', 'kind of']
+STAR_ELEMENTS = {
+    'situation': ['situation', 'context', 'background', 'setting'],
+    'task': ['task', 'responsibility', 'assignment', 'charged with', 'needed to', 'had to'],
+    'action': ['action', 'approach', 'steps', 'procedure', 'initiative', 'implemented', 'executed', 'performed'],
+    'result': ['result', 'outcome', 'achievement', 'accomplishment', 'impact', 'effect', 'led to', 'concluded with']
+}
+POSITIVE_WORDS = ['learned', 'improved', 'growth', 'development', 'opportunity', 'overcome', 'solution']
+
+# All lexicons compiled into one matcher, so an answer is scanned once.
+# Example phrases match anywhere; the rest only as whole words.
+_ANSWER_LEXICONS = LexiconMatcher(
+    dict({'examples': EXAMPLE_PHRASES, 'fillers': FILLER_WORDS, 'positive': POSITIVE_WORDS}, **STAR_ELEMENTS),
+    unbounded=('examples',)
+)
+
 def analyze_answer(question, answer):
     """
     Analyze the answer to an interview question and provide feedback.
@@ -199,31 +223,23 @@ def analyze_answer(question, answer):
         feedback_points.append("Your answer is quite lengthy. Consider being more concise while maintaining key points.")
         score -= 0.5
     
+    # One scan finds every lexicon term in the answer
+    found = _ANSWER_LEXICONS.scan(answer)
+    
     # Check for use of specific examples
-    if not re.search(r'(for example|for instance|e\.g\.|specifically|in particular|in my experience)', answer, re.IGNORECASE):
+    if not found['examples']:
         feedback_points.append("Consider including specific examples to strengthen your answer.")
         score -= 1
     
     # Check for filler words
-    filler_words = ['um', 'uh', 'like', 'you know', 'sort of', 'kind of']
-    filler_count = sum(1 for word in filler_words if re.search(r'\b' + word + r'\b', answer, re.IGNORECASE))
+    filler_count = len(found['fillers'])
     if filler_count > 3:
         feedback_points.append("Try to reduce the use of filler words like 'um', 'uh', 'like', etc.")
         score -= 1
     
     # Check for STAR method elements in behavioral questions
     if any(x in question.lower() for x in ['tell me about a time', 'describe a situation', 'give an example']):
-        star_elements = {
-            'situation': ['situation', 'context', 'background', 'setting'],
-            'task': ['task', 'responsibility', 'assignment', 'charged with', 'needed to', 'had to'],
-            'action': ['action', 'approach', 'steps', 'procedure', 'initiative', 'implemented', 'executed', 'performed'],
-            'result': ['result', 'outcome', 'achievement', 'accomplishment', 'impact', 'effect', 'led to', 'concluded with']
-        }
-        
-        missing_elements = []
-        for element, keywords in star_elements.items():
-            if not any(re.search(r'\b' + keyword + r'\b', answer, re.IGNORECASE) for keyword in keywords):
-                missing_elements.append(element)
+        missing_elements = [element for element in STAR_ELEMENTS if not found[element]]
         
         if missing_elements:
             elements_str = ', '.join(missing_elements)
@@ -232,8 +248,7 @@ def analyze_answer(question, answer):
     
     # Check for positivity in discussing challenges or weaknesses
     if any(x in question.lower() for x in ['weakness', 'difficult', 'challenging', 'failed', 'mistake']):
-        positive_words = ['learned', 'improved', 'growth', 'development', 'opportunity', 'overcome', 'solution']
-        if not any(re.search(r'\b' + word + r'\b', answer, re.IGNORECASE) for word in positive_words):
+        if not found['positive']:
             feedback_points.append("When discussing challenges or weaknesses, try to include how you've grown or what you've learned from them.")
             score -= 1
     
@@ -5,6 +5,7 @@ Uses llama-cpp-python as the backend for inference with quantized models.
 import os
 import json
 import random
+from utils.nlp_utils import QUESTION_KEYWORDS
 
 # Define sample questions by role and difficulty for fallback
 SAMPLE_QUESTIONS = {
@@ -239,6 +240,14 @@ FEEDBACK_TEMPLATES = {
     }
 }
 
+# Keywords of the fallback questions are computed once, for answer scoring
+QUESTION_KEYWORDS.register(
+    question["text"]
+    for bank in [*SAMPLE_QUESTIONS.values(), DEFAULT_QUESTIONS]
+    for questions in bank.values()
+    for question in questions
+)
+
 def safe_llm_call(model, prompt, fallback_result):
     """Safely attempt to call the LLM, with fallback if it fails."""
     try:
@@ -385,7 +394,11 @@ class LLMInterviewer:
                         # Invalid structure, use fallback
                         return fallback_questions
                 
-                return questions[:num_questions]
+                # Generated questions join the keyword store on first sight
+                # (the model may return a non-string text, which cannot be analyzed)
+                questions = questions[:num_questions]
+                QUESTION_KEYWORDS.register(q['text'] for q in questions if isinstance(q.get('text'), str))
+                return questions
             except json.JSONDecodeError:
                 # If we can't parse JSON, use fallback
                 return fallback_questions
@@ -1,7 +1,7 @@
 import logging
 import random
 from datetime import datetime
-from utils.nlp_utils import generate_interview_questions, analyze_answer
+from utils.nlp_utils import generate_interview_questions, analyze_answer, analyze_answers
 from utils.speech_utils import text_to_speech
 
 class InterviewSimulator:
@@ -194,3 +194,41 @@ class InterviewSimulator:
         summary['areas_for_improvement'] = weaknesses
         
         return summary
+
+def rescore_interviews(interviews, workers=None):
+    """
+    Re-score every stored answer with the current scoring rules
+    
+    Args:
+        interviews (dict): Username to list of Interview objects (current_app.interviews)
+        workers (int): Worker processes passed to analyze_answers
+        
+    Returns:
+        int: Number of answers re-scored
+    """
+    answered = [
+        (interview, question)
+        for user_interviews in interviews.values()
+        for interview in user_interviews
+        for question in interview.questions
+        if question.answer
+    ]
+    feedback = analyze_answers(
+        ((question.question_text, question.answer) for _, question in answered),
+        workers=workers
+    )
+    
+    for (_, question), fb in zip(answered, feedback):
+        # Speech metrics come from the recording, not the transcript, so keep them
+        if question.feedback and 'speech_analysis' in question.feedback:
+            fb['speech_analysis'] = question.feedback['speech_analysis']
+        question.feedback = fb
+        question.score = (fb['clarity'] + fb['relevance'] + fb['confidence']) / 3
+    
+    # Same overall score as routes/interview.complete
+    for interview in {id(interview): interview for interview, _ in answered}.values():
+        scores = [q.score for q in interview.questions if q.answer]
+        interview.score = sum(scores) / len(scores) if scores else 0
+    
+    logging.info(f"Re-scored {len(answered)} interview answers")
+    return len(answered)
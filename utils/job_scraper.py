@@ -3,6 +3,8 @@ import json
 import os
 import random
 from datetime import datetime, timedelta
+from utils.dedup import deduplicate
+from utils.trending import record_jobs
 
 # Sample job data for fallback mode
 SAMPLE_JOBS = [
@@ -262,7 +264,8 @@ def search_jobs(query=None, job_type=None, location=None):
         location (str): Job location
         
     Returns:
-        list: Job listings matching the search criteria
+        list: Job listings matching the search criteria; an API listing that
+            collapsed syndicated copies lists their URLs under "duplicate_urls"
     """
     # Try to use a real job search API if available
     api_key = os.environ.get("JOB_SEARCH_API_KEY")
@@ -304,6 +307,16 @@ def search_jobs(query=None, job_type=None, location=None):
                         "salary_range": job.get("job_salary_currency") + job.get("job_salary") if job.get("job_salary") else "Not specified"
                     })
                 
+                # Job boards syndicate postings; keep one record per near-duplicate
+                # cluster, listing where the collapsed copies were posted
+                postings = jobs
+                jobs, clusters = deduplicate(postings)
+                for canonical, duplicates in clusters.items():
+                    postings[canonical]["duplicate_urls"] = [postings[position]["url"] for position in duplicates]
+                
+                # Update the streaming skill demand counters
+                record_jobs(jobs)
+                
                 return jobs
             
         except Exception as e:
@@ -1,23 +1,656 @@
+import os
 import re
+import zlib
+import copy
 import logging
+import threading
+import multiprocessing
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from array import array
+from functools import cached_property
+
+from utils.analysis_cache import AnalysisCache
+from utils.synonyms import SYNONYM_TABLE, TOKEN_ALIASES, PHRASE_ALIASES
+from utils.vocabulary import VOCABULARY, TOKEN_ID_TYPECODE, EncodedDocument, to_numpy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.info("NumPy not installed; batch match scoring will use pure Python")
 
 # Simple NLP alternatives while spaCy is unavailable
 logging.warning("Using simplified NLP functions without spaCy")
 
+# Word tokens, equivalent to stripping punctuation and splitting on whitespace
+_TOKEN_RE = re.compile(r'\w+')
+
+# Simple stopwords list
+STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
+    'when', 'where', 'how', 'who', 'which', 'this', 'that', 'to', 'in',
+    'for', 'with', 'by', 'at', 'of', 'from', 'about', 'is', 'are', 'was',
+    'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'shall', 'should', 'can', 'could', 'may',
+    'might', 'must', 'on', 'our', 'your', 'my', 'ours', 'yours', 'their', 'his', 'her'
+})
+
+# Technical terms and skills, counted on top of the plain tokens
+TECH_TERMS = (
+    'python', 'java', 'javascript', 'html', 'css', 'react', 'angular', 'node.js',
+    'sql', 'nosql', 'mongodb', 'aws', 'azure', 'docker', 'kubernetes',
+    'machine learning', 'ai', 'data science', 'agile', 'scrum', 'devops', 'ci/cd'
+)
+
+
+class TermMatcher:
+    """
+    Compiled matcher for a fixed set of single- and multi-word terms
+
+    All terms are compiled into one prefix-trie regular expression (longest
+    match first), so a text is scanned once in C however many terms there are. first_tokens
+    lets callers skip the scan entirely when no term can start in a text.
+    Terms are delimited by lookarounds rather than \b, so terms starting or
+    ending with punctuation (".net", "c++") match as whole terms too.
+    """
+
+    def __init__(self, terms):
+        terms = sorted({term.lower() for term in terms}, key=len, reverse=True)
+        self.terms = tuple(terms)
+        self.first_tokens = frozenset(_TOKEN_RE.findall(term)[0] for term in terms if _TOKEN_RE.search(term))
+        self._pattern = re.compile(r'(?<!\w)(?:' + _trie_pattern(terms) + r')(?!\w)') if terms else None
+
+    def findall(self, lowered):
+        """Return every term occurrence in a lowercased text, in order"""
+        if self._pattern is None:
+            return []
+        return self._pattern.findall(lowered)
+
+    def finditer(self, lowered):
+        """Iterate over the match objects of every term occurrence, in order"""
+        if self._pattern is None:
+            return iter(())
+        return self._pattern.finditer(lowered)
+
+def _trie_pattern(terms):
+    """
+    Regular expression matching any of the terms, factored into a prefix trie
+
+    A flat alternation makes the regex engine retry every term at every
+    position; the trie form rejects most positions on their first character.
+    """
+    root = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + pattern + ')?' if '' in node else pattern
+
+    return build(root)
+
+class LexiconMatcher:
+    """
+    Compiled presence matcher for several named lexicons
+
+    The terms of all lexicons are compiled into one case-insensitive trie
+    regex inside a lookahead, so a single scan reports every term found in a
+    text, overlapping hits included. A term that is a prefix of another term
+    could be hidden by it at the same position, so such terms are checked
+    with their own pattern instead.
+    """
+
+    def __init__(self, lexicons, unbounded=()):
+        """
+        Args:
+            lexicons (dict): Lexicon name to literal terms
+            unbounded (iterable): Lexicons whose terms may match inside words
+                (the others only match whole words, like r'\bterm\b')
+        """
+        unbounded = set(unbounded)
+        self._names = tuple(lexicons)
+        self._names_by_key = {}  # (term, whole word) -> lexicon names
+        for name, terms in lexicons.items():
+            for term in terms:
+                self._names_by_key.setdefault((term.lower(), name not in unbounded), []).append(name)
+
+        keys = list(self._names_by_key)
+        shadowed = {key for key in keys if any(other[0] != key[0] and other[0].startswith(key[0]) for other in keys)}
+        self._separate = [(key, re.compile(self._bounded(re.escape(key[0]), key[1]), re.IGNORECASE))
+                          for key in shadowed]
+
+        scanned = [key for key in keys if key not in shadowed]
+        alternatives = [
+            self._bounded('(' + _trie_pattern(key[0] for key in scanned if key[1] == whole_word) + ')', whole_word)
+            for whole_word in (True, False)
+        ]
+        self._pattern = re.compile('(?=(?:' + '|'.join(alternatives) + '))', re.IGNORECASE) if scanned else None
+
+    @staticmethod
+    def _bounded(pattern, whole_word):
+        return r'\b' + pattern + r'\b' if whole_word else pattern
+
+    def _key(self, matched, whole_word):
+        """Lexicon key of a matched span (case-insensitive matches may not lowercase to the term)"""
+        key = (matched.lower(), whole_word)
+        if key in self._names_by_key:
+            return key
+        return next(key for key in self._names_by_key
+                    if key[1] == whole_word and re.fullmatch(re.escape(key[0]), matched, re.IGNORECASE))
+
+    def scan(self, text):
+        """
+        Find which terms of each lexicon occur in a text
+
+        Returns:
+            dict: Lexicon name to the set of its terms found
+        """
+        found = {name: set() for name in self._names}
+        keys = set()
+        if self._pattern is not None:
+            for bounded, unbounded in set(self._pattern.findall(text)):
+                keys.add(self._key(bounded, True) if bounded else self._key(unbounded, False))
+        keys.update(key for key, pattern in self._separate if pattern.search(text))
+        for key in keys:
+            for name in self._names_by_key[key]:
+                found[name].add(key[0])
+        return found
+
+# Single-token technical terms are exactly the matching keyword tokens,
+# so they are counted from the token counts; only the rest need a scan
+_TECH_TOKENS = frozenset(
+    term for term in TECH_TERMS
+    if _TOKEN_RE.fullmatch(term) and len(term) > 2 and term not in STOPWORDS
+)
+
+# Spellings folded into their canonical form before counting ("js" -> "javascript").
+# Multi-token aliases and canonical forms are scanned along with the multi-word
+# technical terms in one pass; single-token aliases are remapped by token count.
+_ALIAS_TOKENS = frozenset(TOKEN_ALIASES)
+_TECH_MATCHER = TermMatcher(
+    [term for term in TECH_TERMS if term not in _TECH_TOKENS]
+    + list(PHRASE_ALIASES)
+    + [canonical for canonical in SYNONYM_TABLE if not _TOKEN_RE.fullmatch(canonical)]
+)
+# Tokens of each scanned term; alias tokens among them are already counted as the term
+_TERM_TOKENS = {term: _TOKEN_RE.findall(term) for term in _TECH_MATCHER.terms}
+# Terms located by the scan itself (keyword_spans takes their offsets from it)
+_SCANNED_TERMS = frozenset(_TECH_MATCHER.terms)
+# The one token of a single-token term (".net" -> "net") is the term, not a word of its own
+_TERM_WORDS = {term: tokens[0] for term, tokens in _TERM_TOKENS.items() if len(tokens) == 1}
+
+# Results of extract_keywords, calculate_match_score and
+# suggest_resume_improvements, keyed by a hash of the input texts
+ANALYSIS_CACHE = AnalysisCache()
+
+def invalidate_analysis_cache(namespace=None):
+    """
+    Drop cached analysis results, e.g. after changing stopwords or scoring rules
+    
+    Args:
+        namespace (str): Function name to invalidate (default: everything)
+    """
+    ANALYSIS_CACHE.invalidate(namespace)
+
+class _NgramWindow:
+    """
+    Rolling hashes of the 2- and 3-grams ending at the current token
+
+    Only runs of content tokens (not stopwords, longer than two characters)
+    separated by plain whitespace form n-grams, so phrases never span
+    punctuation or sentence boundaries. Token hashes are CRC32, not hash(),
+    so phrase keys are the same in every process (pool workers included).
+    """
+
+    __slots__ = ('tokens', 'hashes', 'end')
+
+    _BASE = 1000003
+    _MASK = (1 << 64) - 1
+
+    def __init__(self):
+        self.tokens = []
+        self.hashes = []
+        self.end = None
+
+    def push(self, lowered, token, start, end):
+        """
+        Advance past one token
+
+        Returns:
+            list: (hash, n) for every n-gram ending at this token
+        """
+        if len(token) <= 2 or token in STOPWORDS:
+            self.tokens, self.hashes, self.end = [], [], None
+            return []
+        if self.end is None or not lowered[self.end:start].isspace():
+            self.tokens, self.hashes = [], []
+        self.end = end
+
+        token_hash = zlib.crc32(token.encode('utf-8'))
+        # Extend the running hashes of the previous window by the new token
+        self.hashes = [(h * self._BASE + token_hash) & self._MASK for h in self.hashes[-2:]] + [token_hash]
+        self.tokens = self.tokens[-2:] + [token]
+        return [(h, len(self.hashes) - i) for i, h in enumerate(self.hashes[:-1])]
+
+    def phrase(self, n):
+        """The n-gram ending at the current token"""
+        return " ".join(self.tokens[-n:])
+
+class PhraseTable:
+    """
+    Corpus-level 2- and 3-gram statistics with bounded memory
+
+    Candidate n-grams are counted by rolling hash (one int per candidate,
+    once per document) and promoted to phrases once they occur in
+    min_count documents; only promoted phrases keep their text. When the
+    candidate table outgrows max_candidates the rarer half is pruned.
+    Promoted phrases are counted as keywords by extract_keywords.
+    """
+
+    def __init__(self, min_count=2, max_candidates=100000):
+        self.min_count = min_count
+        self.max_candidates = max_candidates
+        self.phrases = {}  # hash -> phrase
+        self._candidates = {}  # hash -> document frequency
+        self._token_pattern = None
+        self._token_pattern_key = None
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def token_pattern(self):
+        """
+        Regex matching the tokens that occur in promoted phrases
+
+        The keyword scan advances the n-gram window over these tokens only,
+        so the regex engine skips every other token in C. Phrases are only
+        ever added, so the pattern is rebuilt when their number changes
+        (or the table is replaced, as in preprocessing workers).
+        """
+        key = (id(self.phrases), len(self.phrases))
+        if self._token_pattern_key != key:
+            tokens = {token for phrase in self.phrases.values() for token in phrase.split()}
+            self._token_pattern = re.compile(r'\b(?:' + _trie_pattern(tokens) + r')\b')
+            self._token_pattern_key = key
+        return self._token_pattern
+
+    def observe(self, texts):
+        """
+        Update phrase statistics from documents
+
+        Args:
+            texts (iterable): Documents (str or TextAnalysis)
+
+        Returns:
+            int: Number of newly promoted phrases
+        """
+        if isinstance(texts, (str, TextAnalysis)):
+            texts = [texts]
+
+        promoted = 0
+        candidates = self._candidates
+        for text in texts:
+            lowered = analyze_text(text).lower
+            window = _NgramWindow()
+            seen = set()
+            for match in _TOKEN_RE.finditer(lowered):
+                for ngram_hash, n in window.push(lowered, match.group(), match.start(), match.end()):
+                    if ngram_hash in seen or ngram_hash in self.phrases:
+                        continue
+                    seen.add(ngram_hash)
+                    count = candidates.get(ngram_hash, 0) + 1
+                    if count >= self.min_count:
+                        candidates.pop(ngram_hash, None)
+                        phrase = window.phrase(n)
+                        if phrase not in _TECH_PHRASES:
+                            self.phrases[ngram_hash] = phrase
+                            promoted += 1
+                    else:
+                        candidates[ngram_hash] = count
+
+            if len(candidates) > self.max_candidates:
+                self._prune()
+
+        if promoted:
+            # Keyword lists computed before the promotion no longer apply
+            invalidate_analysis_cache()
+        return promoted
+
+    def _prune(self):
+        """Drop the less frequent half of the candidates"""
+        counts = sorted(self._candidates.values())
+        cutoff = counts[len(counts) // 2]
+        self._candidates = {h: c for h, c in self._candidates.items() if c > cutoff}
+
+# Multi-word technical terms and synonyms are already counted by the term matcher
+_TECH_PHRASES = frozenset(term for term in _TECH_MATCHER.terms if ' ' in term)
+
+# Phrases learned from the opportunity catalog
+PHRASES = PhraseTable()
+
+def observe_phrases(texts):
+    """
+    Learn frequent 2- and 3-word phrases from a corpus
+    
+    Args:
+        texts (iterable): Documents to learn from
+        
+    Returns:
+        int: Number of newly promoted phrases
+    """
+    return PHRASES.observe(texts)
+
 def _tokenize(text):
     """Simple tokenization function"""
-    # Convert to lowercase and remove punctuation
-    text = re.sub(r'[^\w\s]', ' ', text.lower())
-    # Split by whitespace
-    return text.split()
+    # Lowercase and keep runs of word characters (punctuation acts as a separator)
+    return _TOKEN_RE.findall(text.lower())
+
+def fold_synonyms(lowered, token_counts, spans=False):
+    """
+    Resolve the synonyms and multi-word technical terms of a text
 
+    Multi-word terms, multi-token aliases ("google cloud") and multi-token
+    canonical forms ("vue.js") are found in one scan; alias tokens inside a
+    match belong to it, so the "js" of "vue.js" is not also "javascript".
+    The remaining single-token aliases are remapped by count. Keyword
+    counting and the search index both canonicalize through this.
+
+    Args:
+        lowered (str): Lowercased text
+        token_counts (Counter): Token counts of the text
+        spans (bool): Also locate the matched terms and aliases (one more
+            pass over the tokens, so only when they are highlighted)
+
+    Returns:
+        tuple: (Counter of single-token canonical forms of alias tokens,
+            Counter of scanned terms by canonical form,
+            Counter of the tokens inside scanned terms,
+            Counter of the tokens that make up a single-token term on their own,
+            dict of canonical form to the (start, end) offsets in lowered of
+            the terms and aliases counted as it, or None without spans)
+    """
+    term_counts = Counter()
+    covered = Counter()
+    absorbed = Counter()
+    term_spans = [] if spans else None
+    # Multi-word and short terms only need a scan if one of them can start here
+    if not _TECH_MATCHER.first_tokens.isdisjoint(token_counts):
+        matches = _TECH_MATCHER.finditer(lowered) if spans else _TECH_MATCHER.findall(lowered)
+        for match in matches:
+            term = match.group() if spans else match
+            canonical = PHRASE_ALIASES.get(term, term)
+            term_counts[canonical] += 1
+            covered.update(_TERM_TOKENS[term])
+            if term in _TERM_WORDS:
+                absorbed[_TERM_WORDS[term]] += 1
+            if spans:
+                term_spans.append((canonical, match.start(), match.end()))
+
+    canonical_counts = Counter()
+    aliases = _ALIAS_TOKENS.intersection(token_counts)
+    for alias in aliases:
+        remaining = token_counts[alias] - covered[alias]
+        if remaining <= 0:
+            continue
+        canonical = TOKEN_ALIASES[alias]
+        if _TOKEN_RE.fullmatch(canonical):
+            canonical_counts[canonical] += remaining
+        else:
+            term_counts[canonical] += remaining
+
+    if spans:
+        spans = {}
+        for canonical, start, end in term_spans:
+            spans.setdefault(canonical, []).append((start, end))
+        if aliases:
+            for canonical, span in _alias_spans(lowered, [(start, end) for _, start, end in term_spans]):
+                spans.setdefault(canonical, []).append(span)
+    else:
+        spans = None
+    return canonical_counts, term_counts, covered, absorbed, spans
+
+def _alias_spans(lowered, term_spans):
+    """
+    Locate the single-token aliases of a text that are not part of a scanned term
+
+    Args:
+        lowered (str): Lowercased text
+        term_spans (list): (start, end) offsets of the scanned terms, in order
+
+    Yields:
+        tuple: (canonical form, (start, end)) for every such alias, in order
+    """
+    i = 0
+    for match in _TOKEN_RE.finditer(lowered):
+        canonical = TOKEN_ALIASES.get(match.group())
+        if canonical is None:
+            continue
+        start, end = match.span()
+        while i < len(term_spans) and term_spans[i][1] <= start:
+            i += 1
+        if i < len(term_spans) and term_spans[i][0] < end:
+            continue
+        yield canonical, (start, end)
+
+def _count_keywords(lowered, tokens=None):
+    """
+    Count keyword occurrences in a lowercased text
+
+    Plain tokens are counted if they are not stopwords and longer than two
+    characters; technical terms are counted once more on top, so they rank
+    above ordinary words with the same frequency. Aliases from the synonym
+    table count as their canonical form ("js" and "ecmascript" as
+    "javascript"). Phrases learned by observe_phrases are counted as
+    keywords too, from an n-gram window advanced over the phrase tokens in
+    the text. Every other pass runs in C (regex, Counter, set operations);
+    Python only touches distinct tokens.
+
+    Args:
+        lowered (str): Lowercased text to scan
+        tokens (list): Tokens of the text, if already computed
+
+    Returns:
+        Counter: Keyword counts, ordered by first occurrence
+    """
+    token_counts = Counter(_TOKEN_RE.findall(lowered) if tokens is None else tokens)
+    keyword_counts = Counter({
+        token: count for token, count in token_counts.items()
+        if len(token) > 2 and token not in STOPWORDS and token not in _ALIAS_TOKENS
+    })
+
+    canonical_counts, extra_counts, _, absorbed, _ = fold_synonyms(lowered, token_counts)
+    # "net" of ".net" is counted as ".net" only
+    keyword_counts -= absorbed
+    keyword_counts.update(canonical_counts)
+
+    for term in _TECH_TOKENS.intersection(keyword_counts):
+        keyword_counts[term] += keyword_counts[term]
+
+    phrases = PHRASES.phrases
+    if phrases:
+        # The rolling window advances along the stream of phrase tokens; any
+        # other token between two of them breaks the run like punctuation does
+        window = _NgramWindow()
+        for match in PHRASES.token_pattern().finditer(lowered):
+            for ngram_hash, n in window.push(lowered, match.group(), match.start(), match.end()):
+                phrase = phrases.get(ngram_hash)
+                # Guard against hash collisions before counting
+                if phrase is not None and phrase == window.phrase(n):
+                    extra_counts[phrase] += 1
+
+    for term, count in extra_counts.items():
+        keyword_counts[term] += count
+
+    return keyword_counts
+
+class TextAnalysis:
+    """
+    Lazily computed, memoized views of one text
+
+    Build one per text per request and pass it to any nlp_utils function in
+    place of the raw string; lowercasing, tokenization and keyword counting
+    then happen at most once no matter how many functions look at the text.
+    """
+
+    def __init__(self, text):
+        self.text = text or ""
+
+    def __bool__(self):
+        return bool(self.text)
+
+    def __str__(self):
+        return self.text
+
+    @cached_property
+    def lower(self):
+        """Lowercased text"""
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        """Word tokens of the lowercased text"""
+        return _TOKEN_RE.findall(self.lower)
+
+    @cached_property
+    def token_counts(self):
+        """Occurrences of every token"""
+        return Counter(self.tokens)
+
+    @cached_property
+    def token_ids(self):
+        """Tokens encoded against the shared vocabulary"""
+        return VOCABULARY.encode(self.tokens)
+
+    @cached_property
+    def keyword_counts(self):
+        """Keyword counts as used by extract_keywords"""
+        return _count_keywords(self.lower, self.tokens)
+
+    @cached_property
+    def _ranked_keywords(self):
+        return [keyword for keyword, _ in self.keyword_counts.most_common()]
+
+    def keywords(self, limit=20):
+        """
+        Most frequent keywords
+
+        Args:
+            limit (int): Maximum number of keywords to return
+
+        Returns:
+            list: Keywords, most frequent first
+        """
+        # most_common is a stable sort, so every limit is a prefix of the full ranking
+        return self._ranked_keywords[:limit]
+
+    def keyword_ids(self, limit=20):
+        """Most frequent keywords encoded against the shared vocabulary"""
+        return VOCABULARY.encode(self.keywords(limit))
+
+    def contains_any(self, terms):
+        """Whether any of the terms occurs as a substring of the lowercased text"""
+        lowered = self.lower
+        return any(term in lowered for term in terms)
+
+    def _text_spans(self, spans):
+        """Map (start, end) offsets into the lowercased text to offsets into the text"""
+        if len(self.lower) == len(self.text):
+            return spans
+        # A few characters lowercase to several ("İ" -> "i̇"); map lowered
+        # offsets back to the character of the text they came from
+        origin = self._origin
+        return [(origin[start], origin[end - 1] + 1) for start, end in spans]
+
+    @cached_property
+    def _origin(self):
+        return [i for i, char in enumerate(self.text) for _ in char.lower()]
+
+    @cached_property
+    def token_spans(self):
+        """(start, end) character offsets of every token in the text, parallel to tokens"""
+        return self._text_spans([match.span() for match in _TOKEN_RE.finditer(self.lower)])
+
+    @cached_property
+    def _synonym_spans(self):
+        """Canonical form to the offsets of the terms and aliases counted as it"""
+        spans = fold_synonyms(self.lower, self.token_counts, spans=True)[4]
+        return {canonical: self._text_spans(found) for canonical, found in spans.items()}
+
+    @cached_property
+    def _token_positions(self):
+        positions = {}
+        for i, token in enumerate(self.tokens):
+            positions.setdefault(token, []).append(i)
+        return positions
+
+    def keyword_spans(self, keywords):
+        """
+        Locate keywords in the text using the token positions
+
+        Keywords counted by fold_synonyms are located where it matched them,
+        so "javascript" is also found at "JS" and "node.js" at "NodeJS".
+        Other multi-word keywords (learned phrases) are found as runs of
+        consecutive tokens whose covered text equals the keyword, so no
+        keyword is searched for in the raw text.
+
+        Args:
+            keywords (iterable): Keywords as returned by keywords()
+
+        Returns:
+            dict: Keyword to a list of (start, end) offsets, in text order
+        """
+        spans = self.token_spans
+        tokens = self.tokens
+        text = self.text
+        synonym_spans = self._synonym_spans
+        result = {}
+        for keyword in keywords:
+            parts = _TOKEN_RE.findall(keyword)
+            if not parts:
+                continue
+            found = list(synonym_spans.get(keyword, ()))
+            if keyword in _SCANNED_TERMS:
+                result[keyword] = sorted(found)
+                continue
+            for i in self._token_positions.get(parts[0], ()):
+                last = i + len(parts) - 1
+                if last >= len(tokens) or tokens[i:last + 1] != parts:
+                    continue
+                start, end = spans[i][0], spans[last][1]
+                if len(parts) == 1 or text[start:end].lower() == keyword:
+                    found.append((start, end))
+            result[keyword] = sorted(found)
+        return result
+
+def analyze_text(text):
+    """
+    Wrap a string in a TextAnalysis, passing existing analyses through
+    
+    Args:
+        text (str or TextAnalysis): Text to analyze
+        
+    Returns:
+        TextAnalysis: Analysis of the text
+    """
+    if isinstance(text, TextAnalysis):
+        return text
+    return TextAnalysis(text)
+
+@ANALYSIS_CACHE.memoize('extract_keywords', copy=list)
 def extract_keywords(text, limit=20):
     """
     Extract key terms from the job description using simple tokenization
     
     Args:
-        text (str): Text to extract keywords from
+        text (str or TextAnalysis): Text to extract keywords from
         limit (int): Maximum number of keywords to return
         
     Returns:
@@ -26,38 +659,17 @@ def extract_keywords(text, limit=20):
     if not text:
         return []
     
-    # Simple stopwords list
-    stopwords = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what', 
-                'when', 'where', 'how', 'who', 'which', 'this', 'that', 'to', 'in', 
-                'for', 'with', 'by', 'at', 'of', 'from', 'about', 'is', 'are', 'was', 
-                'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 
-                'did', 'will', 'would', 'shall', 'should', 'can', 'could', 'may', 
-                'might', 'must', 'on', 'our', 'your', 'my', 'ours', 'yours', 'their', 'his', 'her'}
-    
-    # Tokenize text
-    tokens = _tokenize(text)
-    
-    # Filter tokens
-    keywords = [token for token in tokens if token not in stopwords and len(token) > 2]
-    
-    # Extract technical terms and skills
-    tech_pattern = r'\b(python|java|javascript|html|css|react|angular|node\.js|sql|nosql|mongodb|aws|azure|docker|kubernetes|machine learning|ai|data science|agile|scrum|devops|ci/cd)\b'
-    tech_keywords = re.findall(tech_pattern, text.lower())
-    keywords.extend(tech_keywords)
-    
     # Count occurrences and take the most frequent
-    keyword_counter = Counter(keywords)
-    top_keywords = [keyword for keyword, _ in keyword_counter.most_common(limit)]
-    
-    return top_keywords
+    return analyze_text(text).keywords(limit)
 
+@ANALYSIS_CACHE.memoize('calculate_match_score')
 def calculate_match_score(profile_text, job_text):
     """
     Calculate match score between profile and job description
     
     Args:
-        profile_text (str): Text from user profile
-        job_text (str): Text from job description
+        profile_text (str or TextAnalysis): Text from user profile
+        job_text (str or TextAnalysis): Text from job description
         
     Returns:
         float: Match score (0-100)
@@ -83,17 +695,180 @@ def calculate_match_score(profile_text, job_text):
     
     return round(score, 2)
 
+@ANALYSIS_CACHE.memoize('explain_match', copy=copy.deepcopy)
+def explain_match(profile_text, job_text):
+    """
+    Explain calculate_match_score with the keywords behind it and where they occur
+    
+    Args:
+        profile_text (str or TextAnalysis): Text from user profile
+        job_text (str or TextAnalysis): Text from job description
+        
+    Returns:
+        dict: score (same as calculate_match_score), matched and missing
+            keywords in job ranking order, and job_spans / profile_spans
+            mapping each keyword to its (start, end) offsets in that text
+    """
+    explanation = {
+        'score': 0,
+        'matched': [],
+        'missing': [],
+        'job_spans': {},
+        'profile_spans': {}
+    }
+    if not profile_text or not job_text:
+        return explanation
+    
+    profile = analyze_text(profile_text)
+    job = analyze_text(job_text)
+    profile_keywords = set(profile.keywords(50))
+    job_keywords = job.keywords(50)
+    
+    explanation['matched'] = [kw for kw in job_keywords if kw in profile_keywords]
+    explanation['missing'] = [kw for kw in job_keywords if kw not in profile_keywords]
+    explanation['score'] = calculate_match_score(profile, job)
+    explanation['job_spans'] = job.keyword_spans(job_keywords)
+    explanation['profile_spans'] = profile.keyword_spans(explanation['matched'])
+    return explanation
+
+def span_segments(text, span_groups):
+    """
+    Cut a text into plain and highlighted segments for templates
+    
+    Args:
+        text (str): Text the spans refer to
+        span_groups (dict): Label (e.g. a CSS class) to {keyword: [(start, end), ...]}
+        
+    Returns:
+        list: (segment text, label or None) pairs covering the whole text;
+            overlapping spans keep the one starting first (longest on ties)
+    """
+    spans = sorted(
+        ((start, end, label) for label, keyword_spans in span_groups.items()
+         for spans in keyword_spans.values() for start, end in spans),
+        key=lambda span: (span[0], -span[1])
+    )
+    segments = []
+    position = 0
+    for start, end, label in spans:
+        if start < position:
+            continue
+        if start > position:
+            segments.append((text[position:start], None))
+        segments.append((text[start:end], label))
+        position = end
+    if position < len(text):
+        segments.append((text[position:], None))
+    return segments
+
+def encode_document(text, keyword_limit=50):
+    """
+    Encode a text as integer token and keyword IDs
+    
+    Args:
+        text (str or TextAnalysis): Text to encode
+        keyword_limit (int): Number of ranked keywords to keep
+        
+    Returns:
+        EncodedDocument: Array-backed document
+    """
+    analysis = analyze_text(text)
+    return EncodedDocument(analysis.token_ids, analysis.keyword_ids(keyword_limit))
+
+def _keyword_ids(document):
+    """Top-50 keyword IDs of a job document (text, TextAnalysis or EncodedDocument)"""
+    if isinstance(document, EncodedDocument):
+        return document.keyword_ids[:50]
+    if not document:
+        return array(TOKEN_ID_TYPECODE)
+    return VOCABULARY.encode(extract_keywords(document, limit=50))
+
+def _keyword_matrix(documents):
+    """
+    Build a sparse CSR-style keyword matrix over vocabulary IDs
+
+    Args:
+        documents (iterable): Job documents
+
+    Returns:
+        tuple: (indptr, indices) row offsets and keyword IDs
+    """
+    indptr = [0]
+    indices = array(TOKEN_ID_TYPECODE)
+    for document in documents:
+        indices.extend(_keyword_ids(document))
+        indptr.append(len(indices))
+    return indptr, indices
+
+def calculate_match_scores(profile_text, job_texts):
+    """
+    Calculate match scores between one profile and many job descriptions
+    
+    The profile is vectorized once; every job becomes a row of a sparse
+    keyword matrix over vocabulary IDs and all scores come out of a single
+    matrix-vector product. Each score equals
+    calculate_match_score(profile_text, job_text).
+    
+    Args:
+        profile_text (str or TextAnalysis): Text from user profile
+        job_texts (list): Texts, TextAnalysis or EncodedDocument objects for the jobs
+        
+    Returns:
+        list: Match scores (0-100), one per job description
+    """
+    job_texts = list(job_texts)
+    if not profile_text:
+        return [0] * len(job_texts)
+    
+    profile_keywords = extract_keywords(profile_text, limit=50)
+    if not profile_keywords:
+        return [0] * len(job_texts)
+    
+    indptr, indices = _keyword_matrix(job_texts)
+    # Profile keywords no job has ever used cannot match, so they are not interned
+    profile_ids = VOCABULARY.encode(profile_keywords, add=False)
+    
+    if np is None:
+        profile_ids = set(profile_ids)
+        scores = []
+        for row in range(len(job_texts)):
+            start, end = indptr[row], indptr[row + 1]
+            matches = sum(1 for token_id in indices[start:end] if token_id in profile_ids)
+            scores.append(round((matches / (end - start)) * 100, 2) if end > start else 0)
+        return scores
+    
+    # Profile vector: 1 for every profile keyword over the whole vocabulary
+    profile_vector = np.zeros(len(VOCABULARY))
+    profile_vector[to_numpy(profile_ids)] = 1
+    
+    lengths = np.diff(np.asarray(indptr, dtype=np.int64))
+    rows = np.repeat(np.arange(len(job_texts)), lengths)
+    matches = np.bincount(
+        rows,
+        weights=profile_vector[to_numpy(indices)],
+        minlength=len(job_texts)
+    )
+    
+    scores = np.zeros(len(job_texts))
+    nonempty = lengths > 0
+    scores[nonempty] = np.round((matches[nonempty] / lengths[nonempty]) * 100, 2)
+    return scores.tolist()
+
+@ANALYSIS_CACHE.memoize('suggest_resume_improvements', copy=copy.deepcopy)
 def suggest_resume_improvements(profile_text, job_text):
     """
     Suggest improvements for resume based on job description
     
     Args:
-        profile_text (str): Text from user profile
-        job_text (str): Text from job description
+        profile_text (str or TextAnalysis): Text from user profile
+        job_text (str or TextAnalysis): Text from job description
         
     Returns:
         dict: Suggestions for improvements
     """
+    profile_text = analyze_text(profile_text)
+    job_text = analyze_text(job_text)
+    
     job_keywords = extract_keywords(job_text, limit=30)
     profile_keywords = extract_keywords(profile_text, limit=50)
     
@@ -112,79 +887,81 @@ def suggest_resume_improvements(profile_text, job_text):
     
     # Check for specific terms
     leadership_terms = ["lead", "manage", "coordinate", "direct", "supervise"]
-    if any(term in job_text.lower() for term in leadership_terms) and not any(term in profile_text.lower() for term in leadership_terms):
+    if job_text.contains_any(leadership_terms) and not profile_text.contains_any(leadership_terms):
         suggestions["recommendations"].append(
             "The job requires leadership skills. Highlight any leadership experience."
         )
     
     teamwork_terms = ["team", "collaborate", "cooperation", "group"]
-    if any(term in job_text.lower() for term in teamwork_terms) and not any(term in profile_text.lower() for term in teamwork_terms):
+    if job_text.contains_any(teamwork_terms) and not profile_text.contains_any(teamwork_terms):
         suggestions["recommendations"].append(
             "Emphasize your teamwork experience in your profile."
         )
     
     return suggestions
 
+# Question banks of generate_interview_questions; placeholders in braces are
+# filled from the job description
+TECHNICAL_QUESTION_TEMPLATES = [
+    "Can you explain your experience with {technology}?",
+    "How would you solve {problem} using {technology}?",
+    "Describe a challenging technical project you've worked on.",
+    "How do you stay updated with the latest developments in your field?",
+    "What is your approach to debugging complex issues?",
+    "Explain how you would design a system for {use_case}.",
+    "What experience do you have with {methodology}?",
+    "How would you implement {feature} for a large-scale system?",
+    "Describe your experience with cloud platforms like AWS or Azure.",
+    "How do you ensure code quality in your projects?"
+]
+
+BEHAVIORAL_QUESTION_TEMPLATES = [
+    "Describe a situation where you had to meet a tight deadline.",
+    "Tell me about a time when you had to resolve a conflict in a team.",
+    "How do you handle feedback and criticism?",
+    "Describe a situation where you had to learn something quickly.",
+    "Tell me about a time when you demonstrated leadership.",
+    "How do you prioritize tasks when you have multiple deadlines?",
+    "Describe a situation where you failed and what you learned from it.",
+    "How do you handle working under pressure?",
+    "Tell me about a time when you went above and beyond.",
+    "How do you adapt to changing requirements?"
+]
+
+HR_QUESTION_TEMPLATES = [
+    "Why are you interested in this position?",
+    "Where do you see yourself in 5 years?",
+    "What are your salary expectations?",
+    "Why do you want to leave your current job?",
+    "What are your strengths and weaknesses?",
+    "How would your colleagues describe you?",
+    "What motivates you at work?",
+    "How do you define success?",
+    "Why should we hire you?",
+    "Do you have any questions for us?"
+]
+
 def generate_interview_questions(job_text, question_type="all", num_questions=5):
     """
     Generate interview questions based on job description
     
     Args:
-        job_text (str): Job description
+        job_text (str or TextAnalysis): Job description
         question_type (str): Type of questions (technical, behavioral, hr, all)
         num_questions (int): Number of questions to generate
         
     Returns:
         list: Generated questions
     """
-    # Default questions by type
-    technical_questions = [
-        "Can you explain your experience with {technology}?",
-        "How would you solve {problem} using {technology}?",
-        "Describe a challenging technical project you've worked on.",
-        "How do you stay updated with the latest developments in your field?",
-        "What is your approach to debugging complex issues?",
-        "Explain how you would design a system for {use_case}.",
-        "What experience do you have with {methodology}?",
-        "How would you implement {feature} for a large-scale system?",
-        "Describe your experience with cloud platforms like AWS or Azure.",
-        "How do you ensure code quality in your projects?"
-    ]
-    
-    behavioral_questions = [
-        "Describe a situation where you had to meet a tight deadline.",
-        "Tell me about a time when you had to resolve a conflict in a team.",
-        "How do you handle feedback and criticism?",
-        "Describe a situation where you had to learn something quickly.",
-        "Tell me about a time when you demonstrated leadership.",
-        "How do you prioritize tasks when you have multiple deadlines?",
-        "Describe a situation where you failed and what you learned from it.",
-        "How do you handle working under pressure?",
-        "Tell me about a time when you went above and beyond.",
-        "How do you adapt to changing requirements?"
-    ]
-    
-    hr_questions = [
-        "Why are you interested in this position?",
-        "Where do you see yourself in 5 years?",
-        "What are your salary expectations?",
-        "Why do you want to leave your current job?",
-        "What are your strengths and weaknesses?",
-        "How would your colleagues describe you?",
-        "What motivates you at work?",
-        "How do you define success?",
-        "Why should we hire you?",
-        "Do you have any questions for us?"
-    ]
-    
-    # Extract keywords to customize questions
+    # Extract keywords to customize questions; they are canonical, so a job
+    # asking for "JS" or "nodejs" is asked about javascript or node.js
     keywords = extract_keywords(job_text, limit=10)
     technologies = [kw for kw in keywords if re.match(r'\b(python|java|javascript|html|css|react|angular|node\.js|sql|nosql|mongodb|aws|azure|docker|kubernetes)\b', kw)]
     methodologies = [kw for kw in keywords if kw in ["agile", "scrum", "waterfall", "devops", "kanban", "ci/cd"]]
     
     # Customize questions
     customized_technical = []
-    for q in technical_questions:
+    for q in TECHNICAL_QUESTION_TEMPLATES:
         if "{technology}" in q and technologies:
             customized_technical.append(q.replace("{technology}", technologies[0]))
         elif "{methodology}" in q and methodologies:
@@ -203,46 +980,189 @@ def generate_interview_questions(job_text, question_type="all", num_questions=5)
     if question_type == "technical" or question_type == "all":
         questions.extend(customized_technical[:num_questions])
     if question_type == "behavioral" or question_type == "all":
-        questions.extend(behavioral_questions[:num_questions])
+        questions.extend(BEHAVIORAL_QUESTION_TEMPLATES[:num_questions])
     if question_type == "hr" or question_type == "all":
-        questions.extend(hr_questions[:num_questions])
+        questions.extend(HR_QUESTION_TEMPLATES[:num_questions])
     
     # If all types are requested, balance the selection
     if question_type == "all":
         # Aim for balanced distribution
         per_type = max(1, num_questions // 3)
         questions = (customized_technical[:per_type] + 
-                     behavioral_questions[:per_type] + 
-                     hr_questions[:per_type])
+                     BEHAVIORAL_QUESTION_TEMPLATES[:per_type] + 
+                     HR_QUESTION_TEMPLATES[:per_type])
     
     return questions[:num_questions]
 
-def analyze_answer(question, answer):
+# Words ignored when comparing an answer with its question
+_ANSWER_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
+    'when', 'where', 'how', 'who', 'which', 'this', 'that', 'to', 'in'
+})
+
+# Confidence markers, matched as substrings of the lowercased answer
+CONFIDENCE_BOOSTERS = ("confident", "accomplished", "successful", "achieved", "led", "managed", "expertise", "proficient")
+CONFIDENCE_DETRACTORS = ("maybe", "perhaps", "try", "might", "could", "possibly", "i think", "not sure")
+
+# Histories at least this long are scored over a process pool, by start method.
+# Scoring costs about 65us per answer and pickling it to and from a worker
+# about 4us; starting a pool takes about 15ms with fork but 0.45s with spawn
+# (macOS, Windows). Two workers therefore break even near 600 answers with
+# fork and 16k with spawn; on one CPU the pool never pays off (20k answers:
+# serial 1.39s, two workers 1.65s).
+PARALLEL_MIN_ANSWERS = {'fork': 2000, 'forkserver': 20000, 'spawn': 20000}
+
+class QuestionKeywords:
     """
-    Analyze interview answer and provide feedback using simple text analysis
-    
+    Frozen keywords of one question that an answer is expected to mention
+
+    Scoring an answer is a set intersection with its tokens; the rare
+    keywords repeated in the question keep their count.
+    """
+
+    __slots__ = ('question_id', 'keywords', 'repeated', 'total')
+
+    def __init__(self, question_id, counts):
+        """
+        Args:
+            question_id (int): ID in the store, or None if it was not stored
+            counts (Counter): Keyword occurrences in the question
+        """
+        self.question_id = question_id
+        self.keywords = frozenset(counts)
+        self.repeated = {keyword: count for keyword, count in counts.items() if count > 1}
+        self.total = sum(counts.values())
+
+    def overlap(self, mentioned):
+        """Question keyword occurrences covered by the mentioned keywords"""
+        repeated = self.repeated
+        if not repeated:
+            return len(mentioned)
+        return sum(repeated.get(keyword, 1) for keyword in mentioned)
+
+class QuestionKeywordStore:
+    """
+    Keywords of every interview question, computed once per distinct question
+
+    The fixed question banks are registered at import; any other question
+    (LLM generated, customized templates) is added on first sight, up to
+    max_questions, after which new questions are analyzed without storing.
+    """
+
+    def __init__(self, max_questions=50000):
+        self.max_questions = max_questions
+        self._by_text = {}
+        self._by_id = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def lookup(self, question):
+        """
+        Keywords of a question, analyzing it on first sight
+
+        Args:
+            question (str or TextAnalysis): Question text
+
+        Returns:
+            QuestionKeywords: The question's keywords
+        """
+        if not isinstance(question, str):
+            question = analyze_text(question).text
+        entry = self._by_text.get(question)
+        if entry is not None:
+            return entry
+
+        counts = Counter(t for t in analyze_text(question).tokens if t not in _ANSWER_STOPWORDS and len(t) > 2)
+        with self._lock:
+            entry = self._by_text.get(question)
+            if entry is None:
+                if len(self._by_id) >= self.max_questions:
+                    return QuestionKeywords(None, counts)
+                entry = QuestionKeywords(len(self._by_id), counts)
+                self._by_id.append(entry)
+                self._by_text[question] = entry
+            return entry
+
+    def get(self, question_id):
+        """Keywords of a stored question by ID"""
+        return self._by_id[question_id]
+
+    def register(self, questions):
+        """
+        Add questions to the store
+
+        Args:
+            questions (iterable): Question texts
+
+        Returns:
+            list: IDs of the questions
+        """
+        return [self.lookup(question).question_id for question in questions]
+
+# Shared by analyze_answer, analyze_answers and StreamingAnswerAnalyzer
+QUESTION_KEYWORDS = QuestionKeywordStore()
+QUESTION_KEYWORDS.register(
+    [q for q in TECHNICAL_QUESTION_TEMPLATES if '{' not in q]
+    + BEHAVIORAL_QUESTION_TEMPLATES + HR_QUESTION_TEMPLATES
+)
+
+def _question_keywords(question):
+    """Keywords of a question that an answer is expected to mention"""
+    return QUESTION_KEYWORDS.lookup(question)
+
+def _empty_answer_feedback():
+    return {
+        "clarity": 0,
+        "relevance": 0,
+        "confidence": 0,
+        "feedback": "No answer provided.",
+        "improvement_tips": ["Please provide an answer to receive feedback."]
+    }
+
+def _score_answer(question_keywords, answer):
+    """
+    Score a non-empty answer against precomputed question keywords
+
     Args:
-        question (str): Interview question
-        answer (str): User's answer
-        
+        question_keywords (QuestionKeywords): Keywords of the question
+        answer (str or TextAnalysis): User's answer
+
     Returns:
         dict: Feedback on the answer
     """
-    if not answer:
-        return {
-            "clarity": 0,
-            "relevance": 0,
-            "confidence": 0,
-            "feedback": "No answer provided.",
-            "improvement_tips": ["Please provide an answer to receive feedback."]
-        }
+    answer = analyze_text(answer)
     
-    # Calculate metrics
-    word_count = len(answer.split())
+    # Calculate metrics (sentence count does not affect the scores, so it is not computed)
+    word_count = len(answer.text.split())
     
-    # Simple sentence detection
-    sentence_count = len([s for s in re.split(r'[.!?]+', answer) if s.strip()])
+    # Simple relevance check (keyword overlap). Question keywords are never
+    # stopwords or short, so a plain token intersection gives the same overlap
+    overlap = question_keywords.overlap(question_keywords.keywords.intersection(answer.tokens))
     
+    # Check confidence markers
+    lowered = answer.lower
+    boosters_found = sum(1 for term in CONFIDENCE_BOOSTERS if term in lowered)
+    detractors_found = sum(1 for term in CONFIDENCE_DETRACTORS if term in lowered)
+    
+    return _answer_feedback(word_count, overlap, question_keywords.total,
+                            boosters_found, detractors_found)
+
+def _answer_feedback(word_count, overlap, question_keyword_count, boosters_found, detractors_found):
+    """
+    Turn answer metrics into the feedback dict returned by analyze_answer
+
+    Args:
+        word_count (int): Whitespace-separated words in the answer
+        overlap (int): Question keyword occurrences mentioned in the answer
+        question_keyword_count (int): Question keyword occurrences in total
+        boosters_found (int): Distinct confidence boosters in the answer
+        detractors_found (int): Distinct confidence detractors in the answer
+
+    Returns:
+        dict: Feedback on the answer
+    """
     # Prepare feedback
     feedback = {
         "clarity": 0,
@@ -265,21 +1185,8 @@ def analyze_answer(question, answer):
         feedback["clarity"] = 8
         feedback["feedback"] = "Your answer has good length."
     
-    # Simple relevance check (keyword overlap)
-    question_tokens = _tokenize(question)
-    answer_tokens = _tokenize(answer)
-    
-    # Remove stopwords
-    stopwords = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what', 
-               'when', 'where', 'how', 'who', 'which', 'this', 'that', 'to', 'in'}
-    
-    question_keywords = [t for t in question_tokens if t not in stopwords and len(t) > 2]
-    answer_keywords = [t for t in answer_tokens if t not in stopwords and len(t) > 2]
-    
-    # Calculate keyword overlap
-    overlap = sum(1 for kw in question_keywords if kw in answer_keywords)
-    if question_keywords:
-        relevance_score = min(10, (overlap / len(question_keywords)) * 10)
+    if question_keyword_count:
+        relevance_score = min(10, (overlap / question_keyword_count) * 10)
     else:
         relevance_score = 5
     
@@ -288,13 +1195,6 @@ def analyze_answer(question, answer):
     if feedback["relevance"] < 5:
         feedback["improvement_tips"].append("Your answer doesn't fully address the question. Try to focus more on what was asked.")
     
-    # Check confidence markers
-    confidence_boosters = ["confident", "accomplished", "successful", "achieved", "led", "managed", "expertise", "proficient"]
-    confidence_detractors = ["maybe", "perhaps", "try", "might", "could", "possibly", "i think", "not sure"]
-    
-    boosters_found = sum(1 for term in confidence_boosters if term in answer.lower())
-    detractors_found = sum(1 for term in confidence_detractors if term in answer.lower())
-    
     confidence_score = 7 + min(3, boosters_found) - min(4, detractors_found)
     feedback["confidence"] = max(1, min(10, confidence_score))
     
@@ -312,3 +1212,184 @@ def analyze_answer(question, answer):
         feedback["feedback"] = "Your answer needs improvement. " + feedback["feedback"]
     
     return feedback
+
+def analyze_answer(question, answer):
+    """
+    Analyze interview answer and provide feedback using simple text analysis
+    
+    Args:
+        question (str or TextAnalysis): Interview question
+        answer (str or TextAnalysis): User's answer
+        
+    Returns:
+        dict: Feedback on the answer
+    """
+    if not answer:
+        return _empty_answer_feedback()
+    
+    return _score_answer(_question_keywords(question), answer)
+
+def _score_answer_chunk(question_keywords, items):
+    """Score (question index, answer) items; runs in a worker process"""
+    return [
+        _score_answer(question_keywords[index], answer) if answer else _empty_answer_feedback()
+        for index, answer in items
+    ]
+
+def analyze_answers(pairs, workers=None, chunk_size=500):
+    """
+    Analyze many interview answers, e.g. to re-score a stored history
+    
+    Each distinct question is tokenized once and its keywords are shared by
+    every answer to it. Large batches on multi-core hosts are split into
+    chunks scored over a process pool.
+    
+    Args:
+        pairs (iterable): (question, answer) pairs
+        workers (int): Worker processes (None picks automatically, 1 disables the pool)
+        chunk_size (int): Answers per task sent to a worker
+        
+    Returns:
+        list: Feedback dicts in the order of pairs, identical to analyze_answer
+    """
+    question_index = {}
+    question_keywords = []
+    items = []
+    for question, answer in pairs:
+        question = str(question)
+        index = question_index.get(question)
+        if index is None:
+            index = question_index[question] = len(question_keywords)
+            question_keywords.append(_question_keywords(question))
+        items.append((index, str(answer) if answer else answer))
+    
+    if workers is None:
+        # Without fixing the start method (the first listed is the platform default)
+        method = multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+        threshold = PARALLEL_MIN_ANSWERS.get(method, PARALLEL_MIN_ANSWERS['spawn'])
+        workers = None if (os.cpu_count() or 1) > 1 and len(items) >= threshold else 1
+    if workers == 1 or len(items) <= chunk_size:
+        return _score_answer_chunk(question_keywords, items)
+    
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_score_answer_chunk, [question_keywords] * len(chunks), chunks)
+            return [feedback for chunk in results for feedback in chunk]
+    except (OSError, BrokenProcessPool) as e:
+        # Some hosts cannot fork workers; score in this process instead
+        logging.warning(f"Process pool unavailable, scoring answers serially: {e}")
+        return _score_answer_chunk(question_keywords, items)
+
+# Sentence boundaries counted by StreamingAnswerAnalyzer
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Last characters of the processed text kept so markers split across chunks are still found
+_MARKER_CARRY = max(len(term) for term in CONFIDENCE_BOOSTERS + CONFIDENCE_DETRACTORS) - 1
+
+class StreamingAnswerAnalyzer:
+    """
+    Incremental analyze_answer for answers that arrive in pieces (live transcripts)
+
+    Each chunk updates word, sentence, keyword-overlap and confidence-marker
+    state in time proportional to the chunk, so feedback for everything
+    heard so far is available at any moment. Only the trailing partial word
+    is held back until the next chunk (or the next feedback call) completes it.
+    feedback() returns exactly what analyze_answer gives for the text fed so far.
+    """
+
+    def __init__(self, question):
+        """
+        Args:
+            question (str or TextAnalysis): Interview question being answered
+        """
+        self.question = str(question)
+        self._question_keywords = _question_keywords(question)
+        self.word_count = 0
+        self._closed_sentences = 0
+        self._open_sentence = False
+        self._mentioned = set()  # question keywords seen in the answer
+        self._markers = set()  # confidence markers seen in the answer
+        self._carry = ""  # lowercased tail of the processed text
+        self._pending = ""  # trailing partial word
+        self._received = False
+
+    def feed(self, chunk):
+        """
+        Add the next piece of the answer
+
+        Args:
+            chunk (str): Text continuing exactly where the previous chunk ended
+
+        Returns:
+            StreamingAnswerAnalyzer: self, so calls can be chained
+        """
+        if not chunk:
+            return self
+        self._received = True
+
+        text = self._pending + chunk
+        # Split after the last whitespace so no word or token spans two updates
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        self._pending = text[cut:]
+        if cut:
+            self._consume(text[:cut])
+        return self
+
+    def _consume(self, text):
+        """Fold a run of complete words into the counters"""
+        self.word_count += len(text.split())
+
+        pieces = _SENTENCE_SPLIT_RE.split(text)
+        if len(pieces) > 1:
+            # Every boundary closes the sentence in progress
+            self._closed_sentences += (self._open_sentence or bool(pieces[0].strip()))
+            self._closed_sentences += sum(1 for piece in pieces[1:-1] if piece.strip())
+            self._open_sentence = bool(pieces[-1].strip())
+        elif text.strip():
+            self._open_sentence = True
+
+        lowered = text.lower()
+        self._mentioned.update(self._question_keywords.keywords.intersection(_TOKEN_RE.findall(lowered)))
+
+        window = self._carry + lowered
+        for term in CONFIDENCE_BOOSTERS + CONFIDENCE_DETRACTORS:
+            if term not in self._markers and term in window:
+                self._markers.add(term)
+        self._carry = window[-_MARKER_CARRY:]
+
+    def _snapshot(self):
+        """Counters including the held-back partial word, without consuming it"""
+        if not self._pending:
+            return self
+        snapshot = copy.copy(self)
+        snapshot._mentioned = set(self._mentioned)
+        snapshot._markers = set(self._markers)
+        snapshot._pending = ""
+        snapshot._consume(self._pending)
+        return snapshot
+
+    @property
+    def sentence_count(self):
+        """Non-empty sentences so far"""
+        snapshot = self._snapshot()
+        return snapshot._closed_sentences + snapshot._open_sentence
+
+    def feedback(self):
+        """
+        Feedback for the answer received so far
+
+        Returns:
+            dict: Same structure and values as analyze_answer
+        """
+        if not self._received:
+            return _empty_answer_feedback()
+
+        snapshot = self._snapshot()
+        overlap = self._question_keywords.overlap(snapshot._mentioned)
+        boosters_found = sum(1 for term in CONFIDENCE_BOOSTERS if term in snapshot._markers)
+        detractors_found = sum(1 for term in CONFIDENCE_DETRACTORS if term in snapshot._markers)
+        return _answer_feedback(snapshot.word_count, overlap, self._question_keywords.total,
+                                boosters_found, detractors_found)
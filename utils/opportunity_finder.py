@@ -1,64 +1,218 @@
+import re
+import copy
+import json
+import heapq
+import base64
+import hashlib
 import logging
 import random
-import re
+from operator import itemgetter
 from datetime import datetime, timedelta
-from utils.nlp_utils import extract_keywords, calculate_match_score
+from utils.nlp_utils import extract_keywords, calculate_match_scores, observe_phrases
+from utils.search_index import BM25Index
+from utils.dedup import deduplicate
+from utils.fuzzy_match import normalize_skills
+from utils.semantic_index import embed
+from utils.skill_gap import SkillMatrix, profile_skill_columns
+from utils.trending import record_jobs
+from utils.preprocessing import preprocess_corpus
+from utils.facets import FacetIndex
+
+# Field boosts for ranked keyword search
+JOB_SEARCH_FIELDS = {'title': 3.0, 'company': 1.5, 'description': 1.0}
+HACKATHON_SEARCH_FIELDS = {'name': 3.0, 'organizer': 1.5, 'description': 1.0}
+
+class SearchPage(list):
+    """
+    One page of search results
+
+    A list of the page's records, plus the total number of matches and an
+    opaque cursor for the next page (None on the last page).
+    """
+
+    def __init__(self, items=(), total=0, next_cursor=None):
+        super().__init__(items)
+        self.total = total
+        self.next_cursor = next_cursor
+
+def _encode_cursor(offset):
+    """Opaque cursor pointing at a result offset"""
+    return base64.urlsafe_b64encode(json.dumps({'offset': offset}).encode()).decode().rstrip('=')
+
+def _decode_cursor(cursor):
+    """Offset a cursor points at (a missing or malformed cursor starts from the top)"""
+    if not cursor:
+        return 0
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))['offset']
+    except (ValueError, TypeError, KeyError, OverflowError):
+        return 0
+    # Only cursors written by _encode_cursor are honoured (bool is an int subclass)
+    if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+        return 0
+    return offset
+
+def _mock_url(kind, *fields):
+    """
+    URL of a mock posting derived from its content
+
+    Opportunity IDs are derived from the URL, so a regenerated catalog
+    gives a posting the same ID only if it is the same posting.
+    """
+    digest = hashlib.sha1("|".join(map(str, fields)).encode('utf-8')).hexdigest()[:12]
+    return f"https://example.com/{kind}/{digest}"
+
+def _profile_field(record, field, default=()):
+    """Read a field from a Profile (or one of its entries) or a plain dict"""
+    value = record.get(field) if isinstance(record, dict) else getattr(record, field, None)
+    return value or default
+
+def _page_end(offset, limit):
+    """
+    End offset of a page (None for all remaining results)
+
+    Raises:
+        ValueError: If limit is not a positive integer; an empty page would
+            hand out a cursor to the same offset forever
+    """
+    if limit is None:
+        return None
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"limit must be a positive integer, got {limit!r}")
+    return offset + limit
+
+def _page(ranked, offset, end, total):
+    """SearchPage of ranked[offset:end] (ranked holds at least the first end results)"""
+    next_cursor = _encode_cursor(end) if end is not None and end < total else None
+    return SearchPage(ranked[offset:end], total, next_cursor)
 
 class OpportunityFinder:
     """Class to handle job and hackathon opportunity search and recommendations"""
     
     def __init__(self):
         # In real implementation, this would be connected to APIs or web scraping
-        self.mock_jobs = self._generate_mock_jobs()
+        # Syndicated copies of the same posting are collapsed into one record
+        self.mock_jobs, self.duplicate_job_clusters = deduplicate(
+            self._generate_mock_jobs(), key=lambda job: job.url
+        )
         self.mock_hackathons = self._generate_mock_hackathons()
+        
+        # Stable ID -> record, for constant-time lookups by saved items and routes
+        self.jobs_by_id = {job.id: job for job in self.mock_jobs}
+        self.hackathons_by_id = {hackathon.id: hackathon for hackathon in self.mock_hackathons}
+        
+        # Bitmap indexes of the filterable fields, keyed by position in the mock lists
+        self.job_facets = FacetIndex(self.mock_jobs, {
+            'job_type': lambda job: job.job_type,
+            'location': lambda job: job.location.lower()
+        })
+        self.hackathon_facets = FacetIndex(self.mock_hackathons, {
+            'location': lambda hackathon: hackathon.location.lower(),
+            'is_remote': lambda hackathon: hackathon.is_remote,
+            'skill_level': lambda hackathon: hackathon.skill_level,
+            'team_size': lambda hackathon: hackathon.team_size
+        })
+        
+        # Streaming skill demand counters (jobs already seen are skipped)
+        record_jobs(self.mock_jobs)
+        
+        # Learn recurring phrases ("machine learning models") so they count as keywords
+        observe_phrases([job.title for job in self.mock_jobs] + [job.description for job in self.mock_jobs])
+        
+        # Ranked keyword search indexes, keyed by position in the mock lists
+        self.job_index = BM25Index(JOB_SEARCH_FIELDS)
+        for i, job in enumerate(self.mock_jobs):
+            self.job_index.add(i, job)
+        
+        self.hackathon_index = BM25Index(HACKATHON_SEARCH_FIELDS)
+        for i, hackathon in enumerate(self.mock_hackathons):
+            self.hackathon_index.add(i, hackathon)
+        
+        # Job-by-skill matrix for catalog-wide skill gap statistics
+        self.skill_matrix = SkillMatrix()
+        for job in self.mock_jobs:
+            self.skill_matrix.add(job)
+        
+        # Keywords and hashed-feature vectors, computed over a process pool for
+        # large catalogs (after observe_phrases, so learned phrases are included)
+        job_artifacts = preprocess_corpus([f"{job.title} {job.description}" for job in self.mock_jobs])
+        hackathon_artifacts = preprocess_corpus(
+            [f"{hackathon.name} {hackathon.description}" for hackathon in self.mock_hackathons]
+        )
+        
+        # Ranked keyword IDs per job URL, so match scoring skips re-extraction
+        self.job_documents = {job.url: document for job, document in zip(self.mock_jobs, job_artifacts.documents)}
+        
+        # Vector indexes for recommendations (None without NumPy)
+        self.job_vectors = job_artifacts.vector_index()
+        self.hackathon_vectors = hackathon_artifacts.vector_index()
+    
+    def get_job(self, job_id):
+        """Job with the given stable ID, or None"""
+        return self.jobs_by_id.get(job_id)
     
-    def search_jobs(self, keywords=None, job_type=None, location=None, profile=None):
+    def get_hackathon(self, hackathon_id):
+        """Hackathon with the given stable ID, or None"""
+        return self.hackathons_by_id.get(hackathon_id)
+    
+    def search_jobs(self, keywords=None, job_type=None, location=None, profile=None, limit=None, cursor=None):
         """
         Search for job opportunities
         
+        Only the requested page is selected (with a heap, not a full sort)
+        and, for profile searches, copied with its match scores.
+        
         Args:
             keywords (list): Keywords to search for
             job_type (str): Type of job ("remote", "full-time", "part-time", "internship")
             location (str): Job location
             profile (dict): User profile for matching
+            limit (int): Page size (None for all remaining results)
+            cursor (str): next_cursor of the previous page
             
         Returns:
-            list: Job opportunities
+            SearchPage: Job opportunities of the page
+            
+        Raises:
+            ValueError: If limit is not a positive integer
         """
         # In a real implementation, this would call external APIs or job boards
         # For MVP, we'll use the mock data with filtering
         
-        filtered_jobs = self.mock_jobs
+        facets = self.job_facets
+        filters = []
         
         # Filter by job type
         if job_type:
-            filtered_jobs = [job for job in filtered_jobs if job.job_type == job_type]
+            filters.append(facets.any_of('job_type', [job_type]))
         
-        # Filter by location (simple substring match)
+        # Filter by location (substring match, tested once per distinct location)
         if location:
-            filtered_jobs = [job for job in filtered_jobs if location.lower() in job.location.lower()]
+            location = location.lower()
+            filters.append(facets.where('location', lambda value: location in value))
         
-        # Filter by keywords
-        if keywords:
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if any(kw.lower() in job.title.lower() or kw.lower() in job.description.lower() 
-                      for kw in keywords)
-            ]
-        
-        # Calculate match score if profile provided
-        if profile:
-            profile_text = self._profile_to_text(profile)
-            for job in filtered_jobs:
-                job_text = f"{job.title} {job.description}"
-                job.match_score = calculate_match_score(profile_text, job_text)
-            
-            # Sort by match score
-            filtered_jobs.sort(key=lambda x: x.match_score, reverse=True)
+        offset = _decode_cursor(cursor)
+        end = _page_end(offset, limit)
         
-        return filtered_jobs
+        # Without a profile the search order is final, so only the page end is needed
+        rows, total = self._filtered_rows(self.job_index, facets, filters, keywords, None if profile else end)
+        filtered_jobs = [self.mock_jobs[i] for i in rows]
+        if not profile:
+            return _page(filtered_jobs, offset, end, total)
+        
+        # Score every match, then select the best end by match score (stable, like a full sort)
+        profile_text = self._profile_to_text(profile)
+        scores = calculate_match_scores(profile_text, self._job_documents(filtered_jobs))
+        scored = list(zip(filtered_jobs, scores))
+        ranked = heapq.nlargest(end, scored, key=itemgetter(1)) if end is not None else sorted(
+            scored, key=itemgetter(1), reverse=True
+        )
+        page = _page(ranked, offset, end, total)
+        page[:] = self._with_scores([job for job, _ in page], [score for _, score in page])
+        return page
     
-    def search_hackathons(self, keywords=None, location=None, remote=None, skill_level=None, team_size=None):
+    def search_hackathons(self, keywords=None, location=None, remote=None, skill_level=None, team_size=None,
+                          limit=None, cursor=None):
         """
         Search for hackathon opportunities
         
@@ -68,43 +222,51 @@ class OpportunityFinder:
             remote (bool): Whether hackathon is remote
             skill_level (str): Skill level ("beginner", "intermediate", "advanced")
             team_size (str): Team size ("individual", "team", "both")
+            limit (int): Page size (None for all remaining results)
+            cursor (str): next_cursor of the previous page
             
         Returns:
-            list: Hackathon opportunities
+            SearchPage: Hackathon opportunities of the page
+            
+        Raises:
+            ValueError: If limit is not a positive integer
         """
         # In a real implementation, this would call external APIs or hackathon platforms
         # For MVP, we'll use the mock data with filtering
         
-        filtered_hackathons = self.mock_hackathons
+        facets = self.hackathon_facets
+        filters = []
         
         # Filter by location
         if location:
-            filtered_hackathons = [h for h in filtered_hackathons if location.lower() in h.location.lower()]
+            location = location.lower()
+            filters.append(facets.where('location', lambda value: location in value))
         
         # Filter by remote
         if remote is not None:
-            filtered_hackathons = [h for h in filtered_hackathons if h.is_remote == remote]
+            filters.append(facets.any_of('is_remote', [remote]))
         
         # Filter by skill level
         if skill_level:
-            filtered_hackathons = [h for h in filtered_hackathons if h.skill_level == skill_level]
+            filters.append(facets.any_of('skill_level', [skill_level]))
         
-        # Filter by team size
+        # Filter by team size ("both" suits either)
         if team_size:
-            filtered_hackathons = [h for h in filtered_hackathons if h.team_size == team_size or h.team_size == "both"]
-        
-        # Filter by keywords
-        if keywords:
-            filtered_hackathons = [
-                h for h in filtered_hackathons 
-                if any(kw.lower() in h.name.lower() or kw.lower() in h.description.lower() 
-                      for kw in keywords)
-            ]
-        
-        # Sort hackathons by start date (upcoming first)
-        filtered_hackathons.sort(key=lambda x: x.start_date)
+            filters.append(facets.any_of('team_size', [team_size, "both"]))
+        
+        offset = _decode_cursor(cursor)
+        end = _page_end(offset, limit)
+        
+        # Keyword searches keep relevance order; otherwise upcoming first
+        rows, total = self._filtered_rows(self.hackathon_index, facets, filters, keywords, end if keywords else None)
+        filtered_hackathons = [self.mock_hackathons[i] for i in rows]
+        if not keywords:
+            start_date = lambda x: x.start_date
+            filtered_hackathons = heapq.nsmallest(end, filtered_hackathons, key=start_date) if end is not None else sorted(
+                filtered_hackathons, key=start_date
+            )
         
-        return filtered_hackathons
+        return _page(filtered_hackathons, offset, end, total)
     
     def get_personalized_recommendations(self, profile, limit=5):
         """
@@ -118,54 +280,136 @@ class OpportunityFinder:
             dict: Recommended jobs and hackathons
         """
         profile_text = self._profile_to_text(profile)
+        
+        # Nearest neighbours of the profile vector, most similar first
+        if self.job_vectors is not None:
+            profile_vector = embed(profile_text)
+            if profile_vector.any():
+                jobs = [self.mock_jobs[i] for i, _ in self.job_vectors.search(profile_vector, limit)]
+                jobs = self._with_scores(jobs, calculate_match_scores(profile_text, self._job_documents(jobs)))
+                
+                hackathons = [
+                    self.mock_hackathons[i] for i, _ in self.hackathon_vectors.search(profile_vector, limit)
+                ]
+                return {
+                    'jobs': jobs,
+                    'hackathons': hackathons
+                }
+        
         profile_keywords = extract_keywords(profile_text, limit=10)
         
         # Get jobs matching the profile
-        jobs = self.search_jobs(profile=profile)
-        jobs = jobs[:limit]
+        jobs = self.search_jobs(profile=profile, limit=limit)
         
         # Get hackathons based on skills
-        hackathons = self.search_hackathons(keywords=profile_keywords)
-        hackathons = hackathons[:limit]
+        hackathons = self.search_hackathons(keywords=profile_keywords, limit=limit)
         
         return {
             'jobs': jobs,
             'hackathons': hackathons
         }
     
+    def find_skill_gaps(self, profile, role=None, location=None, limit=10):
+        """
+        Find the skills a user most often lacks for the jobs they target
+        
+        Args:
+            profile (Profile or dict): User profile data
+            role (str): Target role, matched against job titles
+            location (str): Target location
+            limit (int): Maximum number of skills
+            
+        Returns:
+            dict: Jobs considered and missing skills weighted by match score
+        """
+        profile_columns = profile_skill_columns(self.skill_matrix, profile, self._profile_to_text(profile))
+        return self.skill_matrix.skill_gaps(profile_columns, role=role, location=location, limit=limit)
+    
+    @staticmethod
+    def _filtered_rows(search_index, facets, filters, keywords, limit=None):
+        """
+        Positions passing every facet filter, in BM25 order for keyword searches
+        
+        Args:
+            search_index (BM25Index): Keyword index of the records
+            facets (FacetIndex): Facet bitmaps of the same records
+            filters (list): Bitmaps to AND together
+            keywords (list): Keywords to search for
+            limit (int): Only the first limit positions are needed (None for all)
+            
+        Returns:
+            tuple: (record positions, number of matching records)
+        """
+        mask = None
+        for bitmap in filters:
+            mask = bitmap if mask is None else mask & bitmap
+        
+        # Ranked keyword retrieval (best BM25 match first), top limit by heap
+        if keywords:
+            scores = search_index.score(keywords)
+            if mask is not None:
+                scores = {i: score for i, score in scores.items() if facets.contains(mask, i)}
+            if limit is None:
+                ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+            else:
+                ranked = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+            return [i for i, _ in ranked], len(scores)
+        
+        if mask is None:
+            return range(facets.size)[:limit], facets.size
+        rows = facets.rows(mask)
+        return rows[:limit], len(rows)
+    
+    @staticmethod
+    def _with_scores(jobs, scores):
+        """Copies of jobs carrying a profile's match scores (the catalog is shared between requests)"""
+        scored = []
+        for job, score in zip(jobs, scores):
+            job = copy.copy(job)
+            job.match_score = score
+            scored.append(job)
+        return scored
+    
+    def _job_documents(self, jobs):
+        """Preprocessed documents of jobs, or their text for jobs added since"""
+        return [self.job_documents.get(job.url) or f"{job.title} {job.description}" for job in jobs]
+    
     def _profile_to_text(self, profile):
-        """Convert profile data to plain text for matching"""
+        """Convert profile data (a Profile or a dict) to plain text for matching"""
         if not profile:
             return ""
         
         profile_text = ""
         
         # Personal info
-        if 'personal_info' in profile:
-            profile_text += profile['personal_info'].get('summary', '') + " "
+        personal_info = _profile_field(profile, 'personal_info', None)
+        if personal_info:
+            profile_text += (personal_info.get('summary') or '') + " "
         
         # Skills
-        if 'skills' in profile:
-            profile_text += " ".join(profile['skills']) + " "
+        skills = _profile_field(profile, 'skills')
+        if skills:
+            profile_text += " ".join(normalize_skills(skills)) + " "
         
         # Experience
-        if 'experience' in profile:
-            for exp in profile['experience']:
-                profile_text += exp.get('title', '') + " " + exp.get('company', '') + " " + exp.get('description', '') + " "
-                profile_text += " ".join(exp.get('responsibilities', [])) + " "
+        for exp in _profile_field(profile, 'experience'):
+            profile_text += _profile_field(exp, 'title', '') + " " + _profile_field(exp, 'company', '') + " " + _profile_field(exp, 'description', '') + " "
+            profile_text += " ".join(_profile_field(exp, 'responsibilities')) + " "
         
         # Projects
-        if 'projects' in profile:
-            for proj in profile['projects']:
-                profile_text += proj.get('name', '') + " " + proj.get('description', '') + " "
-                profile_text += " ".join(proj.get('technologies', [])) + " "
+        for proj in _profile_field(profile, 'projects'):
+            profile_text += _profile_field(proj, 'name', '') + " " + _profile_field(proj, 'description', '') + " "
+            profile_text += " ".join(_profile_field(proj, 'technologies')) + " "
         
         return profile_text
     
-    def _generate_mock_jobs(self):
+    def _generate_mock_jobs(self, count=20):
         """
         Generate mock job data for demonstration
         
+        Args:
+            count (int): Number of jobs to generate
+            
         Returns:
             list: Mock job opportunities
         """
@@ -239,8 +483,8 @@ class OpportunityFinder:
         
         mock_jobs = []
         
-        # Generate 20 mock jobs
-        for i in range(20):
+        # Generate mock jobs
+        for _ in range(count):
             job_title = random.choice(job_titles)
             company = random.choice(companies)
             location = random.choice(locations)
@@ -261,7 +505,7 @@ class OpportunityFinder:
             days_ago = random.randint(0, 30)
             posted_date = datetime.now() - timedelta(days=days_ago)
             
-            url = f"https://example.com/jobs/{i}"
+            url = _mock_url('jobs', job_title, company, location, job_type, description)
             
             job = JobOpportunity(
                 title=job_title,
@@ -330,7 +574,7 @@ class OpportunityFinder:
         mock_hackathons = []
         
         # Generate 20 mock hackathons
-        for i in range(20):
+        for _ in range(20):
             name = random.choice(hackathon_names) + " " + str(random.randint(1, 10))
             organizer = random.choice(organizers)
             location = random.choice(locations)
@@ -348,7 +592,7 @@ class OpportunityFinder:
             start_date = datetime.now() + timedelta(days=days_offset)
             end_date = start_date + timedelta(days=random.randint(1, 3))
             
-            url = f"https://example.com/hackathons/{i}"
+            url = _mock_url('hackathons', name, organizer, location, start_date.date(), description)
             
             prizes = []
             if random.choice([True, False]):
@@ -0,0 +1,295 @@
+"""
+Bulk preprocessing of job corpora over a process pool
+
+Tokenizing, keyword extraction and embedding are pure functions of the text
+(plus the learned phrase table), so a large dump is split into chunks that
+worker processes handle independently. Chunks are submitted lazily with a
+bounded number in flight, so memory stays flat however large the input is,
+and results come back in input order.
+
+Usage (from the repository root):
+    python -m utils.preprocessing jobs.jsonl --workers 4 --output artifacts/
+    python -m utils.preprocessing --synthetic 20000     # mock jobs, throughput only
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from array import array
+from itertools import chain
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.nlp_utils import PHRASES, extract_keywords
+from utils.vocabulary import VOCABULARY, TOKEN_ID_TYPECODE, EncodedDocument
+from utils.semantic_index import DEFAULT_DIMENSIONS, VectorIndex, embed, np
+from utils.synonyms import SYNONYMS_VERSION
+
+# Corpora smaller than this are processed in the calling process
+PARALLEL_MIN_DOCUMENTS = 2000
+
+# Keywords kept per document (what calculate_match_scores reads)
+KEYWORD_LIMIT = 50
+
+def _init_worker(phrases):
+    """Give a worker the parent's learned phrases, so keywords come out identical"""
+    PHRASES.phrases = phrases
+
+def _preprocess_chunk(texts, keyword_limit, dimensions):
+    """
+    Keywords and vectors of a chunk of texts; runs in a worker process
+
+    Returns:
+        tuple: (keyword lists, float32 matrix of vectors or None without NumPy)
+    """
+    keywords = [extract_keywords(text, limit=keyword_limit) for text in texts]
+    vectors = None
+    if np is not None:
+        vectors = np.zeros((len(texts), dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row] = embed(text, dimensions)
+    return keywords, vectors
+
+def _chunks(texts, chunk_size):
+    """Split an iterable into lists of chunk_size texts"""
+    chunk = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_preprocessed(texts, workers=None, chunk_size=256, max_in_flight=None,
+                      keyword_limit=KEYWORD_LIMIT, dimensions=DEFAULT_DIMENSIONS):
+    """
+    Preprocess texts chunk by chunk, yielding results in input order
+
+    At most max_in_flight chunks are queued or running at a time; the next
+    chunk is read from texts only when an earlier one has been yielded.
+
+    Args:
+        texts (iterable): Document texts (may be a lazy generator)
+        workers (int): Worker processes (None uses every core, 1 disables the pool)
+        chunk_size (int): Texts per task sent to a worker
+        max_in_flight (int): Chunks submitted but not yet yielded (default: 2 per worker)
+        keyword_limit (int): Ranked keywords kept per document
+        dimensions (int): Vector length
+
+    Yields:
+        tuple: (keyword lists, vectors) per chunk, as returned by the workers
+    """
+    chunks = _chunks(texts, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield _preprocess_chunk(chunk, keyword_limit, dimensions)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    pending = deque()  # (chunk, future) submitted but not yet yielded
+    unsubmitted = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(PHRASES.phrases,)) as executor:
+            for unsubmitted in chunks:
+                pending.append((unsubmitted, executor.submit(_preprocess_chunk, unsubmitted, keyword_limit, dimensions)))
+                unsubmitted = None
+                while len(pending) >= max_in_flight:
+                    result = pending[0][1].result()
+                    pending.popleft()
+                    yield result
+            while pending:
+                result = pending[0][1].result()
+                pending.popleft()
+                yield result
+    except (OSError, BrokenProcessPool) as e:
+        # Some hosts cannot fork workers; finish the unyielded chunks in this process
+        logging.warning(f"Process pool unavailable, preprocessing serially: {e}")
+        leftover = [chunk for chunk, _ in pending]
+        if unsubmitted is not None:
+            leftover.append(unsubmitted)
+        for chunk in chain(leftover, chunks):
+            yield _preprocess_chunk(chunk, keyword_limit, dimensions)
+
+class CorpusArtifacts:
+    """
+    Keyword and vector artifacts of a preprocessed corpus, row i for document i
+
+    documents hold only the ranked keyword IDs (the token streams stay in the
+    workers), which is all calculate_match_scores reads.
+    """
+
+    def __init__(self, keywords, vectors, dimensions=DEFAULT_DIMENSIONS):
+        """
+        Args:
+            keywords (list): Ranked keyword list per document
+            vectors (numpy.ndarray): One row per document, or None without NumPy
+            dimensions (int): Vector length
+        """
+        self.keywords = keywords
+        self.vectors = vectors
+        self.dimensions = dimensions
+        self.documents = [
+            EncodedDocument(array(TOKEN_ID_TYPECODE), VOCABULARY.encode(document_keywords))
+            for document_keywords in keywords
+        ]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def vector_index(self, keys=None, **kwargs):
+        """
+        Build a VectorIndex over the vectors
+
+        Args:
+            keys (iterable): Key per document (default: row numbers)
+            **kwargs: VectorIndex options (nprobe, min_train_size, ...)
+
+        Returns:
+            VectorIndex: The index, or None without NumPy
+        """
+        if self.vectors is None:
+            return None
+        index = VectorIndex(self.dimensions, **kwargs)
+        for key, vector in zip(range(len(self)) if keys is None else keys, self.vectors):
+            index.add(key, vector)
+        return index
+
+    def save(self, directory):
+        """
+        Write keywords.json and vectors.npz to a directory
+
+        Args:
+            directory (str): Destination directory (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, 'keywords.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'synonyms_version': SYNONYMS_VERSION, 'keywords': self.keywords}, f)
+        os.replace(path + '.tmp', path)
+        if self.vectors is not None:
+            path = os.path.join(directory, 'vectors.npz')
+            np.savez_compressed(path + '.tmp.npz', vectors=self.vectors)
+            os.replace(path + '.tmp.npz', path)
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Read artifacts written by save
+
+        Args:
+            directory (str): Source directory
+
+        Returns:
+            CorpusArtifacts: The artifacts
+        """
+        with open(os.path.join(directory, 'keywords.json')) as f:
+            data = json.load(f)
+        if data.get('synonyms_version') != SYNONYMS_VERSION:
+            logging.warning(f"Artifacts in {directory} were built with synonym table version "
+                            f"{data.get('synonyms_version')}, current is {SYNONYMS_VERSION}; rebuild them")
+        vectors = None
+        path = os.path.join(directory, 'vectors.npz')
+        if np is not None and os.path.exists(path):
+            with np.load(path, allow_pickle=False) as arrays:
+                vectors = arrays['vectors']
+        dimensions = vectors.shape[1] if vectors is not None else DEFAULT_DIMENSIONS
+        return cls(data['keywords'], vectors, dimensions)
+
+def preprocess_corpus(texts, workers=None, chunk_size=256, max_in_flight=None,
+                      keyword_limit=KEYWORD_LIMIT, dimensions=DEFAULT_DIMENSIONS):
+    """
+    Preprocess a whole corpus into the artifacts OpportunityFinder consumes
+
+    Args:
+        texts (iterable): Document texts
+        workers (int): Worker processes (None picks automatically, 1 disables the pool)
+        chunk_size (int): Texts per task sent to a worker
+        max_in_flight (int): Chunks submitted but not yet collected
+        keyword_limit (int): Ranked keywords kept per document
+        dimensions (int): Vector length
+
+    Returns:
+        CorpusArtifacts: Keywords and vectors, in the order of texts
+    """
+    if workers is None and isinstance(texts, (list, tuple)) and len(texts) < PARALLEL_MIN_DOCUMENTS:
+        workers = 1
+
+    keywords = []
+    vector_chunks = []
+    for chunk_keywords, chunk_vectors in iter_preprocessed(
+            texts, workers, chunk_size, max_in_flight, keyword_limit, dimensions):
+        keywords.extend(chunk_keywords)
+        if chunk_vectors is not None:
+            vector_chunks.append(chunk_vectors)
+
+    vectors = None
+    if np is not None:
+        vectors = np.concatenate(vector_chunks) if vector_chunks else np.zeros((0, dimensions), dtype=np.float32)
+    return CorpusArtifacts(keywords, vectors, dimensions)
+
+def read_corpus(path):
+    """
+    Stream document texts from a file
+
+    JSON lines with title/description (and optionally requirements) fields
+    are joined like job texts; any other line is taken as a document.
+    """
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                try:
+                    job = json.loads(line)
+                except ValueError:
+                    yield line
+                    continue
+                yield " ".join(filter(None, (job.get('title'), job.get('description'), job.get('requirements'))))
+            else:
+                yield line
+
+def _synthetic_corpus(size):
+    """Job texts from the OpportunityFinder mock templates"""
+    from utils.opportunity_finder import OpportunityFinder
+    # Skip __init__: only the template-based generator is needed, not a full catalog
+    finder = OpportunityFinder.__new__(OpportunityFinder)
+    return [f"{job.title} {job.description}" for job in finder._generate_mock_jobs(count=size)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('corpus', nargs='?', help="JSON lines or plain text file, one document per line")
+    parser.add_argument('--synthetic', type=int, metavar='N', help="Preprocess N generated mock jobs instead")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="Documents per worker task")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="Chunks queued at once (default: 2 per worker)")
+    parser.add_argument('--output', help="Directory to write keywords.json and vectors.npz to")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        texts = _synthetic_corpus(args.synthetic)
+    elif args.corpus:
+        texts = read_corpus(args.corpus)
+    else:
+        parser.error("give a corpus file or --synthetic N")
+
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    artifacts = preprocess_corpus(texts, workers, args.chunk_size, args.max_in_flight)
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(artifacts)} documents in {elapsed:.2f}s with {workers} worker(s): "
+          f"{len(artifacts) / elapsed if elapsed else 0:.1f} docs/s")
+    if args.output:
+        artifacts.save(args.output)
+        print(f"Artifacts written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
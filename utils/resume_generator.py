@@ -2,7 +2,8 @@ import os
 import logging
 import tempfile
 from datetime import datetime
-from utils.nlp_utils import extract_keywords, calculate_match_score
+from utils.nlp_utils import TextAnalysis, extract_keywords, explain_match, span_segments
+from utils.fuzzy_match import correct_skill, normalize_skills
 
 def generate_customized_resume(profile, job_title, job_description, template_name="professional"):
     """
@@ -22,14 +23,16 @@ def generate_customized_resume(profile, job_title, job_description, template_nam
         return None
     
     # Extract keywords from job description
-    keywords = extract_keywords(job_description)
+    job_analysis = TextAnalysis(job_description)
+    keywords = extract_keywords(job_analysis)
     
     # Create a flat string of the profile for matching
     profile_text = ""
     if profile.get('personal_info'):
         profile_text += profile['personal_info'].get('summary', '') + " "
     
-    for skill in profile.get('skills', []):
+    # Misspelled skills ("javscript") are matched under their corrected spelling
+    for skill in normalize_skills(profile.get('skills', [])):
         profile_text += skill + " "
     
     for exp in profile.get('experience', []):
@@ -42,15 +45,22 @@ def generate_customized_resume(profile, job_title, job_description, template_nam
         for tech in proj.get('technologies', []):
             profile_text += tech + " "
     
-    # Calculate match score
-    match_score = calculate_match_score(profile_text, job_description)
+    # Calculate match score, with the matched and missing keywords located in the job text
+    explanation = explain_match(profile_text, job_analysis)
+    match_score = explanation['score']
+    job_spans = explanation['job_spans']
+    description_segments = span_segments(job_description, {
+        'matched': {kw: job_spans[kw] for kw in explanation['matched']},
+        'missing': {kw: job_spans[kw] for kw in explanation['missing']}
+    })
     
     # Reorder skills based on keywords
     prioritized_skills = []
     other_skills = []
     
+    keyword_set = {kw.lower() for kw in keywords}
     for skill in profile.get('skills', []):
-        if skill.lower() in [kw.lower() for kw in keywords]:
+        if skill.lower() in keyword_set or correct_skill(skill) in keyword_set:
             prioritized_skills.append(skill)
         else:
             other_skills.append(skill)
@@ -81,6 +91,9 @@ def generate_customized_resume(profile, job_title, job_description, template_nam
         'template': template_name,
         'job_title': job_title,
         'match_score': match_score,
+        'matched_keywords': explanation['matched'],
+        'missing_keywords': explanation['missing'],
+        'job_description_segments': description_segments,
         'keywords': keywords,
         'personal_info': profile.get('personal_info', {}),
         'skills': ordered_skills,
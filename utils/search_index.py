@@ -0,0 +1,243 @@
+import math
+import heapq
+import threading
+from collections import Counter
+from operator import itemgetter
+from utils.nlp_utils import STOPWORDS, analyze_text, fold_synonyms
+from utils.synonyms import TOKEN_ALIASES
+
+def _field_value(record, field):
+    """Read a field from a model object or a plain dict"""
+    if isinstance(record, dict):
+        value = record.get(field)
+    else:
+        value = getattr(record, field, None)
+    return value or ""
+
+def index_terms(text, parts=True):
+    """
+    Terms of a text as indexed for search (lowercase, canonical, stopwords removed)
+
+    Synonyms are resolved by fold_synonyms, exactly as for keyword scoring:
+    "vue.js" is one term, "google cloud" is also "gcp". Words of a
+    multi-word term are terms of their own as well, so a document about
+    "machine learning" also matches "learning".
+
+    Args:
+        text (str): Text to index or query
+        parts (bool): Keep the words of multi-word terms; queries drop them,
+            so "google cloud" matches documents that only say "GCP"
+
+    Returns:
+        Counter: Term frequencies
+    """
+    analysis = analyze_text(text)
+    token_counts = Counter(analysis.tokens)
+    canonical_counts, term_counts, covered, absorbed, _ = fold_synonyms(analysis.lower, token_counts)
+    if parts:
+        # A one-word scanned term ("ai", ".net") is counted once, as the term
+        token_counts -= absorbed
+    else:
+        token_counts -= covered
+    terms = Counter({
+        token: count for token, count in token_counts.items()
+        if token not in STOPWORDS and token not in TOKEN_ALIASES
+    })
+    terms.update(canonical_counts)
+    terms.update(term_counts)
+    return terms
+
+# Shortest query token expanded to the indexed terms it starts
+MIN_PREFIX = 3
+
+class BM25Index:
+    """
+    Inverted index with BM25F ranking over several boosted fields
+
+    Documents are added once (e.g. at catalog load) and can be added or
+    removed incrementally afterwards. Each posting keeps per-field term
+    frequencies, so a query only touches the postings of its own terms.
+    A prefix map from every term prefix to the terms extending it lets a
+    partial word ("kube") match the full one.
+    """
+
+    def __init__(self, fields, k1=1.2, b=0.75):
+        """
+        Args:
+            fields (dict): Field name to boost, e.g. {'title': 3.0, 'description': 1.0}
+            k1 (float): Term frequency saturation
+            b (float): Field length normalization
+        """
+        self.fields = dict(fields)
+        self.k1 = k1
+        self.b = b
+        self._boosts = tuple(self.fields.values())
+        self._postings = {}  # term -> {doc_id: per-field term frequencies}
+        self._doc_lengths = {}  # doc_id -> per-field token counts
+        self._doc_terms = {}  # doc_id -> terms, for removal
+        self._prefixes = {}  # prefix -> indexed terms starting with it
+        self._total_lengths = [0] * len(self.fields)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_lengths
+
+    def add(self, doc_id, record):
+        """
+        Index a document, replacing any previous version with the same ID
+
+        Args:
+            doc_id: Identifier returned by search
+            record: Object or dict carrying the indexed fields
+        """
+        field_counts = [index_terms(_field_value(record, field)) for field in self.fields]
+        lengths = tuple(sum(counts.values()) for counts in field_counts)
+        terms = set().union(*field_counts)
+
+        with self._lock:
+            self._remove(doc_id)
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._add_prefixes(term)
+                postings[doc_id] = tuple(counts[term] for counts in field_counts)
+            self._doc_lengths[doc_id] = lengths
+            self._doc_terms[doc_id] = tuple(terms)
+            for i, length in enumerate(lengths):
+                self._total_lengths[i] += length
+
+    def remove(self, doc_id):
+        """
+        Remove a document from the index
+
+        Returns:
+            bool: Whether the document was indexed
+        """
+        with self._lock:
+            return self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        lengths = self._doc_lengths.pop(doc_id, None)
+        if lengths is None:
+            return False
+
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._drop_prefixes(term)
+        for i, length in enumerate(lengths):
+            self._total_lengths[i] -= length
+        return True
+
+    def _add_prefixes(self, term):
+        for end in range(MIN_PREFIX, len(term)):
+            self._prefixes.setdefault(term[:end], set()).add(term)
+
+    def _drop_prefixes(self, term):
+        for end in range(MIN_PREFIX, len(term)):
+            extensions = self._prefixes[term[:end]]
+            extensions.discard(term)
+            if not extensions:
+                del self._prefixes[term[:end]]
+
+    def _expand(self, token):
+        """
+        Indexed terms a query token stands for
+
+        A token stands for itself and every term it is a prefix of ("data"
+        also matches "database"). Tokens shorter than MIN_PREFIX have no
+        prefix entries and match every term containing them, as the
+        substring filter did ("ai" matches "ai" and "maintain"); a single
+        character only matches itself, since nearly every term contains it.
+        """
+        if len(token) < 2:
+            return (token,) if token in self._postings else ()
+        if len(token) < MIN_PREFIX:
+            return tuple(term for term in self._postings if token in term)
+        expanded = self._prefixes.get(token, ())
+        if token in self._postings:
+            return (token, *expanded)
+        return tuple(expanded)
+
+    def score(self, query):
+        """
+        Score every document matching at least one keyword
+
+        A document matches a keyword if it contains every term of it (each
+        term standing for its prefix expansions): the posting lists of the
+        terms are intersected, and the keywords' matches are united. Matches
+        are ranked by BM25F over all query terms.
+
+        Args:
+            query (str or list): Query text or list of keywords
+
+        Returns:
+            dict: doc_id to BM25F score
+        """
+        if isinstance(query, str):
+            query = [query]
+        keywords = [terms for terms in (index_terms(keyword, parts=False) for keyword in query) if terms]
+
+        with self._lock:
+            terms = set()
+            matches = set()
+            for tokens in keywords:
+                keyword_matches = None
+                for token in tokens:
+                    expanded = self._expand(token)
+                    terms.update(expanded)
+                    token_matches = set().union(*(self._postings[term].keys() for term in expanded))
+                    keyword_matches = token_matches if keyword_matches is None else keyword_matches & token_matches
+                matches |= keyword_matches
+            return self._score(terms, matches)
+
+    def _score(self, terms, candidates):
+        num_docs = len(self._doc_lengths)
+        if not terms or not candidates or not num_docs:
+            return {}
+
+        k1, b, boosts = self.k1, self.b, self._boosts
+        average_lengths = [total / num_docs or 1 for total in self._total_lengths]
+        doc_lengths = self._doc_lengths
+        scores = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+
+            for doc_id, frequencies in postings.items():
+                if doc_id not in candidates:
+                    continue
+                lengths = doc_lengths[doc_id]
+                weighted_tf = 0.0
+                for tf, length, average, boost in zip(frequencies, lengths, average_lengths, boosts):
+                    if tf:
+                        weighted_tf += boost * tf / (1 - b + b * length / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * weighted_tf / (k1 + weighted_tf)
+
+        return scores
+
+    def search(self, query, limit=10):
+        """
+        Retrieve the best matching documents
+
+        Args:
+            query (str or list): Query text or list of keywords
+            limit (int): Number of results (None for all matches)
+
+        Returns:
+            list: (doc_id, score) pairs, best first
+        """
+        scores = self.score(query)
+        if limit is None:
+            return sorted(scores.items(), key=itemgetter(1), reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
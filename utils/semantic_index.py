@@ -0,0 +1,337 @@
+import os
+import json
+import zlib
+import math
+import logging
+import threading
+from collections import Counter
+from utils.nlp_utils import STOPWORDS, analyze_text
+from utils.synonyms import SYNONYMS_VERSION, canonicalize_token
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.info("NumPy not installed; semantic recommendations are disabled")
+
+# Length of the hashed feature vectors
+DEFAULT_DIMENSIONS = 512
+
+# Broader concepts a skill implies; they add shared features between related skills
+RELATED_CONCEPTS = {
+    'python': ('backend', 'programming'), 'java': ('backend', 'programming'),
+    'golang': ('backend', 'programming'), 'ruby': ('backend', 'programming'),
+    'javascript': ('frontend', 'programming'), 'typescript': ('frontend', 'programming'),
+    'react': ('frontend', 'javascript'), 'angular': ('frontend', 'javascript'),
+    'vue.js': ('frontend', 'javascript'), 'html': ('frontend', 'web'), 'css': ('frontend', 'web'),
+    'node.js': ('backend', 'javascript'), 'django': ('backend', 'python'), 'flask': ('backend', 'python'),
+    'sql': ('database', 'data'), 'postgresql': ('database', 'sql'), 'mysql': ('database', 'sql'),
+    'mongodb': ('database', 'nosql'), 'nosql': ('database', 'data'),
+    'docker': ('devops', 'cloud'), 'kubernetes': ('devops', 'cloud'), 'devops': ('cloud', 'operations'),
+    'aws': ('cloud', 'devops'), 'azure': ('cloud', 'devops'), 'gcp': ('cloud', 'devops'),
+    'machine learning': ('data', 'ai'), 'deep learning': ('machine learning', 'data'),
+    'tensorflow': ('machine learning', 'python'), 'pytorch': ('machine learning', 'python'),
+    'pandas': ('data', 'python'), 'analytics': ('data',), 'statistics': ('data',),
+    'figma': ('design', 'user experience'), 'user experience': ('design',), 'user interface': ('design',),
+    'agile': ('process',), 'scrum': ('process', 'agile'), 'kanban': ('process', 'agile')
+}
+
+# Relative weights of the feature kinds
+TOKEN_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.5
+CONCEPT_WEIGHT = 0.4
+
+def text_features(text):
+    """
+    Weighted features of a text: canonical tokens, word bigrams and implied concepts
+
+    Args:
+        text (str or TextAnalysis): Text to featurize
+
+    Returns:
+        Counter: Feature string to weight
+    """
+    tokens = [
+        canonicalize_token(token)
+        for token in analyze_text(text).tokens
+        if token not in STOPWORDS and len(token) > 1
+    ]
+    features = Counter()
+    for token in tokens:
+        features['w:' + token] += TOKEN_WEIGHT
+        for concept in RELATED_CONCEPTS.get(token, ()):
+            features['c:' + concept] += CONCEPT_WEIGHT
+    for first, second in zip(tokens, tokens[1:]):
+        features['b:' + first + ' ' + second] += BIGRAM_WEIGHT
+    return features
+
+def embed(text, dimensions=DEFAULT_DIMENSIONS):
+    """
+    Hash a text into a fixed-size, L2-normalized vector (the hashing trick)
+
+    Each feature lands in one of dimensions slots with a hash-derived sign, so
+    collisions cancel out on average instead of piling up. Term weights are
+    sublinear (1 + log) so repeated words do not dominate.
+
+    Args:
+        text (str or TextAnalysis): Text to embed
+        dimensions (int): Vector length
+
+    Returns:
+        numpy.ndarray: float32 vector (all zeros for texts without features)
+    """
+    vector = np.zeros(dimensions, dtype=np.float32)
+    features = text_features(text)
+    if not features:
+        return vector
+
+    slots = np.empty(len(features), dtype=np.int64)
+    weights = np.empty(len(features), dtype=np.float32)
+    for i, (feature, weight) in enumerate(features.items()):
+        digest = zlib.crc32(feature.encode('utf-8'))
+        slots[i] = (digest & 0x7fffffff) % dimensions
+        weights[i] = (1 + math.log(weight) if weight >= 1 else weight) * (1 if digest & 0x80000000 else -1)
+    np.add.at(vector, slots, weights)
+
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector
+
+class VectorIndex:
+    """
+    Approximate nearest-neighbor index over normalized vectors (IVF)
+
+    Vectors are assigned to the nearest of a few k-means centroids; a query
+    only scores the vectors of its nprobe closest centroids, so the cost of a
+    lookup grows with the square root of the catalog instead of its size.
+    Small indexes are searched exactly. Vectors can be added and removed at
+    any time; the centroids are retrained once the index has grown enough.
+    """
+
+    def __init__(self, dimensions=DEFAULT_DIMENSIONS, nprobe=8, min_train_size=256, seed=7):
+        """
+        Args:
+            dimensions (int): Vector length
+            nprobe (int): Centroid lists scanned per query
+            min_train_size (int): Below this many vectors every query is exact
+            seed (int): Seed for centroid initialization, so builds are reproducible
+        """
+        if np is None:
+            raise RuntimeError("VectorIndex requires NumPy")
+        self.dimensions = dimensions
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.seed = seed
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._size = 0  # rows in use (including removed ones)
+        self._keys = []  # row -> key (None once removed)
+        self._rows = {}  # key -> row
+        self._centroids = None
+        self._lists = []  # centroid -> rows assigned to it
+        self._list_of = {}  # row -> centroid
+        self._trained_size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def add(self, key, vector):
+        """
+        Index a vector, replacing any previous vector with the same key
+
+        Args:
+            key: Identifier returned by search (must be JSON-serializable to save)
+            vector (numpy.ndarray): Normalized vector of length dimensions
+        """
+        with self._lock:
+            self._remove(key)
+            if self._size == len(self._vectors):
+                grown = np.zeros((max(64, 2 * self._size), self.dimensions), dtype=np.float32)
+                grown[:self._size] = self._vectors[:self._size]
+                self._vectors = grown
+
+            row = self._size
+            self._vectors[row] = vector
+            self._size += 1
+            self._keys.append(key)
+            self._rows[key] = row
+
+            if self._centroids is not None:
+                centroid = int(np.argmax(self._centroids @ vector))
+                self._lists[centroid].add(row)
+                self._list_of[row] = centroid
+            if len(self._rows) >= max(self.min_train_size, 4 * self._trained_size):
+                self._train()
+
+    def remove(self, key):
+        """
+        Remove a vector
+
+        Returns:
+            bool: Whether the key was indexed
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key):
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        self._keys[row] = None
+        centroid = self._list_of.pop(row, None)
+        if centroid is not None:
+            self._lists[centroid].discard(row)
+        return True
+
+    def rebuild(self):
+        """Drop removed rows and retrain the centroids on the current vectors"""
+        with self._lock:
+            live = sorted(self._rows.values())
+            self._vectors = self._vectors[live].copy()
+            self._keys = [self._keys[row] for row in live]
+            self._rows = {key: row for row, key in enumerate(self._keys)}
+            self._size = len(live)
+            self._centroids = None
+            self._lists = []
+            self._list_of = {}
+            self._trained_size = 0
+            if self._size >= self.min_train_size:
+                self._train()
+
+    def _train(self, iterations=10, sample_per_list=64, batch_size=8192):
+        """Spherical k-means on a sample of the live vectors, then reassign every row"""
+        rows = np.fromiter(sorted(self._rows.values()), dtype=np.int64, count=len(self._rows))
+        num_lists = max(1, int(math.sqrt(len(rows))))
+
+        rng = np.random.default_rng(self.seed)
+        sample = self._vectors[rng.choice(rows, min(len(rows), sample_per_list * num_lists), replace=False)]
+        centroids = sample[rng.choice(len(sample), num_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for i in range(num_lists):
+                members = sample[assignment == i]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm:
+                        centroids[i] = centroid / norm
+
+        self._centroids = centroids
+        self._lists = [set() for _ in range(num_lists)]
+        self._list_of = {}
+        # Assign in batches so the similarity matrix stays small
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            assignment = np.argmax(self._vectors[batch] @ centroids.T, axis=1)
+            for row, centroid in zip(batch.tolist(), assignment.tolist()):
+                self._lists[centroid].add(row)
+                self._list_of[row] = centroid
+        self._trained_size = len(rows)
+        logging.info(f"Trained vector index: {len(rows)} vectors in {num_lists} lists")
+
+    def search(self, vector, limit=10):
+        """
+        Find the most similar vectors
+
+        Args:
+            vector (numpy.ndarray): Normalized query vector
+            limit (int): Number of results
+
+        Returns:
+            list: (key, cosine similarity) pairs, most similar first
+        """
+        with self._lock:
+            if not self._rows or limit <= 0:
+                return []
+            if self._centroids is None:
+                rows = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+            else:
+                probed = np.argsort(self._centroids @ vector)[::-1][:self.nprobe]
+                rows = np.fromiter(
+                    (row for i in probed.tolist() for row in self._lists[i]), dtype=np.int64
+                )
+            if not len(rows):
+                return []
+
+            similarities = self._vectors[rows] @ vector
+            if len(rows) > limit:
+                top = np.argpartition(similarities, -limit)[-limit:]
+            else:
+                top = np.arange(len(rows))
+            top = top[np.argsort(similarities[top])[::-1]]
+            return [(self._keys[rows[i]], float(similarities[i])) for i in top.tolist()]
+
+    def save(self, path):
+        """
+        Write the index to a .npz file
+
+        Args:
+            path (str): Destination file
+        """
+        with self._lock:
+            live = sorted(self._rows.values())
+            position = {row: i for i, row in enumerate(live)}
+            arrays = {
+                'vectors': self._vectors[live],
+                'meta': np.array(json.dumps({
+                    'dimensions': self.dimensions,
+                    'nprobe': self.nprobe,
+                    'min_train_size': self.min_train_size,
+                    'seed': self.seed,
+                    'keys': [self._keys[row] for row in live],
+                    'trained_size': self._trained_size,
+                    'synonyms_version': SYNONYMS_VERSION
+                }))
+            }
+            if self._centroids is not None:
+                arrays['centroids'] = self._centroids
+                arrays['assignment'] = np.array(
+                    [i for i, rows in enumerate(self._lists) for _ in rows], dtype=np.int64
+                )
+                arrays['assigned_rows'] = np.array(
+                    [position[row] for rows in self._lists for row in rows], dtype=np.int64
+                )
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write then rename, so readers never see a half-written index
+        temporary = path + '.tmp.npz'
+        np.savez_compressed(temporary, **arrays)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index written by save
+
+        Args:
+            path (str): Source file
+
+        Returns:
+            VectorIndex: The restored index
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('synonyms_version') != SYNONYMS_VERSION:
+                # Vectors were hashed with other canonical spellings; queries will match them less well
+                logging.warning(f"Vector index {path} was built with synonym table version "
+                                f"{meta.get('synonyms_version')}, current is {SYNONYMS_VERSION}; rebuild it")
+            index = cls(meta['dimensions'], meta['nprobe'], meta['min_train_size'], meta['seed'])
+            index._vectors = data['vectors'].astype(np.float32)
+            index._size = len(index._vectors)
+            # JSON turns tuple keys into lists; make them hashable again
+            index._keys = [tuple(key) if isinstance(key, list) else key for key in meta['keys']]
+            index._rows = {key: row for row, key in enumerate(index._keys)}
+            if 'centroids' in data:
+                index._centroids = data['centroids']
+                index._lists = [set() for _ in range(len(index._centroids))]
+                for centroid, row in zip(data['assignment'].tolist(), data['assigned_rows'].tolist()):
+                    index._lists[centroid].add(row)
+                    index._list_of[row] = centroid
+                index._trained_size = meta['trained_size']
+        return index
@@ -0,0 +1,200 @@
+import logging
+import threading
+from array import array
+from utils.nlp_utils import TermMatcher, analyze_text
+from utils.fuzzy_match import KNOWN_SKILLS, normalize_skills
+from utils.synonyms import ALIASES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.info("NumPy not installed; skill gap aggregation will use pure Python")
+
+def _job_field(job, field):
+    """Read a field from a JobOpportunity or a plain dict"""
+    value = job.get(field) if isinstance(job, dict) else getattr(job, field, None)
+    return value or ""
+
+class SkillMatrix:
+    """
+    Sparse job-by-skill matrix for catalog-wide skill statistics
+
+    Rows are jobs and columns are skills of a fixed vocabulary, stored in CSR
+    form (indptr plus column indices). Jobs are added incrementally; the
+    NumPy views are rebuilt lazily on the next query. Role and location are
+    grouped by distinct value, so filtering a large catalog only compares
+    the handful of distinct titles and locations.
+    """
+
+    def __init__(self, skills=KNOWN_SKILLS):
+        """
+        Args:
+            skills (iterable): Skill vocabulary (the matrix columns)
+        """
+        # Aliases are matched too but share the column of their canonical skill
+        self._matcher = TermMatcher(list(skills) + list(ALIASES))
+        self.skills = tuple(dict.fromkeys(ALIASES.get(term, term) for term in self._matcher.terms))
+        self._column = {skill: i for i, skill in enumerate(self.skills)}
+        self._indptr = array('q', [0])
+        self._indices = array('I')
+        self._rows_by_title = {}  # lowercased title -> job rows
+        self._rows_by_location = {}  # lowercased location -> job rows
+        self._arrays = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._indptr) - 1
+
+    def skill_columns(self, text):
+        """Columns of the vocabulary skills mentioned in a text"""
+        return sorted({
+            self._column[ALIASES.get(skill, skill)]
+            for skill in self._matcher.findall(analyze_text(text).lower)
+        })
+
+    def add(self, job):
+        """
+        Add a job as the next row
+
+        Args:
+            job: JobOpportunity or dict with title, description and location
+
+        Returns:
+            int: Row of the job
+        """
+        columns = self.skill_columns(f"{_job_field(job, 'title')} {_job_field(job, 'description')}")
+        with self._lock:
+            row = len(self)
+            self._indices.extend(columns)
+            self._indptr.append(len(self._indices))
+            self._rows_by_title.setdefault(_job_field(job, 'title').lower(), []).append(row)
+            self._rows_by_location.setdefault(_job_field(job, 'location').lower(), []).append(row)
+            self._arrays = None
+            return row
+
+    def _views(self):
+        """NumPy copies of the CSR arrays, rebuilt after additions"""
+        if self._arrays is None:
+            indptr = np.frombuffer(self._indptr, dtype=np.int64).copy()
+            indices = np.frombuffer(self._indices, dtype=np.uint32).astype(np.int64)
+            # Row of every stored entry, for scattering per-row weights onto entries
+            entry_rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+            self._arrays = (indptr, indices, entry_rows)
+        return self._arrays
+
+    def _matching_rows(self, groups, query):
+        """Rows whose grouped value contains the query (all rows without a query)"""
+        if not query:
+            return None
+        query = query.lower()
+        return [row for value, value_rows in groups.items() if query in value for row in value_rows]
+
+    def skill_gaps(self, profile_columns, role=None, location=None, limit=10):
+        """
+        Rank the skills missing from a profile across the matching jobs
+
+        Every matching job is weighted by its match score, the share of its
+        skills the profile already has, smoothed to (covered + 1) / (skills + 1)
+        so a profile with no known skills still weighs every job. Each missing
+        skill scores the sum of the weights of the jobs asking for it, so
+        skills wanted by jobs the user nearly qualifies for rank first.
+
+        Args:
+            profile_columns (iterable): Columns of the skills the profile has
+            role (str): Only jobs whose title contains this
+            location (str): Only jobs whose location contains this
+            limit (int): Number of skills returned
+
+        Returns:
+            dict: jobs_considered and skills, a list of
+                {'skill', 'score', 'jobs'} dicts, best first
+        """
+        with self._lock:
+            num_jobs = len(self)
+            role_rows = self._matching_rows(self._rows_by_title, role)
+            location_rows = self._matching_rows(self._rows_by_location, location)
+            if np is None:
+                return self._skill_gaps_python(set(profile_columns), role_rows, location_rows, limit)
+            indptr, indices, entry_rows = self._views()
+
+        selected = np.ones(num_jobs, dtype=bool)
+        for rows in (role_rows, location_rows):
+            if rows is not None:
+                mask = np.zeros(num_jobs, dtype=bool)
+                mask[rows] = True
+                selected &= mask
+
+        has_skill = np.zeros(len(self.skills), dtype=bool)
+        has_skill[list(profile_columns)] = True
+
+        # Match score per job: (covered skills + 1) / (skills asked for + 1)
+        entry_covered = has_skill[indices]
+        skill_counts = np.diff(indptr)
+        covered_counts = np.bincount(entry_rows, weights=entry_covered, minlength=num_jobs)
+        weights = (covered_counts + 1) / (skill_counts + 1)
+        weights[~selected] = 0
+
+        # Weighted column sums over the missing skills only
+        missing = ~entry_covered
+        scores = np.bincount(indices[missing], weights=weights[entry_rows[missing]], minlength=len(self.skills))
+        job_counts = np.bincount(indices[missing & selected[entry_rows]], minlength=len(self.skills))
+
+        ranked = np.argsort(-scores, kind='stable')[:limit]
+        return {
+            'jobs_considered': int(selected.sum()),
+            'skills': [
+                {'skill': self.skills[i], 'score': round(float(scores[i]), 2), 'jobs': int(job_counts[i])}
+                for i in ranked.tolist() if scores[i] > 0
+            ]
+        }
+
+    def _skill_gaps_python(self, profile_columns, role_rows, location_rows, limit):
+        """skill_gaps without NumPy, row by row"""
+        rows = range(len(self))
+        for subset in (role_rows, location_rows):
+            if subset is not None:
+                subset = set(subset)
+                rows = [row for row in rows if row in subset]
+
+        scores = {}
+        job_counts = {}
+        considered = 0
+        for row in rows:
+            considered += 1
+            columns = self._indices[self._indptr[row]:self._indptr[row + 1]]
+            if not columns:
+                continue
+            weight = (sum(1 for column in columns if column in profile_columns) + 1) / (len(columns) + 1)
+            for column in columns:
+                if column not in profile_columns:
+                    scores[column] = scores.get(column, 0.0) + weight
+                    job_counts[column] = job_counts.get(column, 0) + 1
+
+        ranked = sorted((column for column in scores if scores[column] > 0), key=lambda c: (-scores[c], c))
+        return {
+            'jobs_considered': considered,
+            'skills': [
+                {'skill': self.skills[c], 'score': round(scores[c], 2), 'jobs': job_counts[c]}
+                for c in ranked[:limit]
+            ]
+        }
+
+def profile_skill_columns(matrix, profile, profile_text=""):
+    """
+    Matrix columns of the skills a profile has
+
+    Args:
+        matrix (SkillMatrix): Matrix whose vocabulary is used
+        profile (Profile or dict): Profile data with a skills list
+        profile_text (str): Full profile text, so skills only mentioned in
+            experience or projects count too
+
+    Returns:
+        set: Column indices
+    """
+    columns = set(matrix.skill_columns(profile_text))
+    skills = profile.get('skills') if isinstance(profile, dict) else getattr(profile, 'skills', None)
+    for skill in normalize_skills(skills or []):
+        columns.update(matrix.skill_columns(skill))
+    return columns
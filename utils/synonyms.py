@@ -0,0 +1,83 @@
+import re
+import logging
+
+# Bump whenever SYNONYM_TABLE changes, so persisted artifacts built with an
+# older table (vector indexes, preprocessed corpora) can be detected
+SYNONYMS_VERSION = 2
+
+# Canonical skill -> aliases that mean the same thing (all lowercase)
+SYNONYM_TABLE = {
+    'javascript': ('js', 'ecmascript', 'es6', 'es2015', 'vanilla js'),
+    'typescript': ('ts',),
+    'node.js': ('node', 'nodejs', 'node js'),
+    'react': ('reactjs', 'react.js', 'react js'),
+    'angular': ('angularjs', 'angular.js'),
+    'vue.js': ('vue', 'vuejs', 'vue js'),
+    'python': ('py', 'python3', 'python 3'),
+    'golang': ('go lang',),
+    'postgresql': ('postgres', 'psql'),
+    'mongodb': ('mongo',),
+    'kubernetes': ('k8s', 'kube'),
+    'aws': ('amazon web services',),
+    'gcp': ('google cloud', 'google cloud platform'),
+    'azure': ('microsoft azure',),
+    'machine learning': ('ml',),
+    'ai': ('artificial intelligence',),
+    'ci/cd': ('cicd', 'ci cd', 'continuous integration', 'continuous delivery', 'continuous deployment'),
+    'restful apis': ('rest api', 'rest apis', 'restful api'),
+    'scikit-learn': ('sklearn', 'scikit learn'),
+    'tensorflow': ('tf',),
+    '.net': ('dotnet',),
+    'c#': ('csharp', 'c sharp'),
+    'c++': ('cpp',),
+    'f#': ('fsharp',),
+    'deep learning': ('dl',),
+    'natural language processing': ('nlp',),
+    'user experience': ('ux',),
+    'user interface': ('ui',),
+    'database': ('db',),
+}
+
+# Runs of word characters; a term made of one run is a single token
+_WORD_RE = re.compile(r'\w+')
+
+def _compile(table):
+    """
+    Flatten the table into alias -> canonical lookups
+
+    Returns:
+        tuple: (all aliases, single-token aliases, multi-token aliases)
+    """
+    aliases = {}
+    for canonical, synonyms in table.items():
+        for alias in synonyms:
+            alias = alias.lower()
+            if aliases.get(alias, canonical) != canonical:
+                logging.warning(f"Synonym '{alias}' is listed for both '{aliases[alias]}' and '{canonical}'")
+                continue
+            if alias != canonical:
+                aliases[alias] = canonical
+
+    token_aliases = {alias: canonical for alias, canonical in aliases.items() if _WORD_RE.fullmatch(alias)}
+    phrase_aliases = {alias: canonical for alias, canonical in aliases.items() if alias not in token_aliases}
+    return aliases, token_aliases, phrase_aliases
+
+# Compiled once at startup; every lookup is a single dict access
+ALIASES, TOKEN_ALIASES, PHRASE_ALIASES = _compile(SYNONYM_TABLE)
+
+def canonicalize(term):
+    """
+    Canonical spelling of a skill or keyword
+
+    Args:
+        term (str): Term in any case, e.g. "JS" or "Node JS"
+
+    Returns:
+        str: Canonical form ("javascript", "node.js"), or the lowercased term
+    """
+    term = " ".join(term.lower().split())
+    return ALIASES.get(term, term)
+
+def canonicalize_token(token):
+    """Canonical form of one lowercase word token (O(1))"""
+    return TOKEN_ALIASES.get(token, token)
@@ -0,0 +1,287 @@
+import random
+import logging
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from utils.nlp_utils import TermMatcher, analyze_text
+from utils.fuzzy_match import KNOWN_SKILLS
+from utils.synonyms import ALIASES
+
+# Segment value meaning "any role" or "any location"
+ANY = '*'
+
+# 31-bit prime for the count-min hash family
+_PRIME = (1 << 31) - 1
+
+class CountMinSketch:
+    """
+    Approximate counter with fixed memory (width x depth counters)
+
+    Estimates never undercount; with width w they overcount by at most
+    about e/w of the total with probability 1 - e^-depth.
+    """
+
+    def __init__(self, width=2048, depth=4, seed=11):
+        rng = random.Random(seed)
+        self.width = width
+        self.depth = depth
+        self._hashes = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(depth)]
+        # Compact rows; updates are single counters, which arrays handle faster than NumPy
+        self._table = [array('q', bytes(8 * width)) for _ in range(depth)]
+
+    def _slots(self, item):
+        # hash() of str is salted per process, which is fine for an in-memory sketch
+        value = hash(item) & 0x7fffffff
+        return [((a * value + b) % _PRIME) % self.width for a, b in self._hashes]
+
+    def add(self, item, count=1):
+        for row, slot in enumerate(self._slots(item)):
+            self._table[row][slot] += count
+
+    def estimate(self, item):
+        return min(self._table[row][slot] for row, slot in enumerate(self._slots(item)))
+
+class SpaceSaving:
+    """
+    Heavy-hitter tracker keeping at most capacity candidates (Space-Saving)
+
+    Any item occurring more than total / capacity times is guaranteed to be
+    among the candidates. When full, a new item replaces the smallest one.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self._counts = {}
+
+    def add(self, item, count=1):
+        counts = self._counts
+        if item in counts or len(counts) < self.capacity:
+            counts[item] = counts.get(item, 0) + count
+            return
+        smallest = min(counts, key=counts.get)
+        counts[item] = counts.pop(smallest) + count
+
+    def candidates(self):
+        return list(self._counts)
+
+class _Bucket:
+    """Counters for one time bucket"""
+
+    def __init__(self, sketch_width, sketch_depth, capacity, max_segments):
+        self.sketch = CountMinSketch(sketch_width, sketch_depth)
+        self.heavy_hitters = {}  # (role, location) -> SpaceSaving
+        self.capacity = capacity
+        self.max_segments = max_segments
+        self.jobs = 0
+
+    def add(self, segments, skills):
+        self.jobs += 1
+        for segment in segments:
+            tracker = self.heavy_hitters.get(segment)
+            if tracker is None:
+                if len(self.heavy_hitters) >= self.max_segments:
+                    # Only the bounded sketch records this segment; it has no candidate list
+                    tracker = None
+                else:
+                    tracker = self.heavy_hitters[segment] = SpaceSaving(self.capacity)
+            for skill in skills:
+                self.sketch.add((segment, skill))
+                if tracker is not None:
+                    tracker.add(skill)
+
+class TrendingSkills:
+    """
+    Streaming skill demand counters over time buckets
+
+    Every ingested job adds its skills (once per job) to the bucket of its
+    posting time, under four segments: overall, its role, its location and
+    both. Counts live in a count-min sketch and candidates in Space-Saving
+    heavy-hitter lists, so each bucket has fixed memory however many jobs
+    arrive, and only the most recent buckets are kept. Dashboard queries
+    sum a few buckets instead of recounting the catalog.
+    """
+
+    def __init__(self, bucket_seconds=86400, max_buckets=60, capacity=64,
+                 sketch_width=2048, sketch_depth=4, max_segments=512, max_seen=100000):
+        """
+        Args:
+            bucket_seconds (int): Length of a time bucket (default: one day)
+            max_buckets (int): Buckets kept; older ones are dropped
+            capacity (int): Heavy-hitter candidates per segment and bucket
+            sketch_width (int): Count-min sketch width
+            sketch_depth (int): Count-min sketch depth
+            max_segments (int): Segments with candidate lists per bucket
+            max_seen (int): Recent job keys remembered to skip re-ingested jobs
+        """
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._bucket_args = (sketch_width, sketch_depth, capacity, max_segments)
+        self._buckets = OrderedDict()  # bucket number -> _Bucket, oldest first
+        self._seen = OrderedDict()
+        self._max_seen = max_seen
+        self._matcher = TermMatcher(KNOWN_SKILLS + tuple(ALIASES))
+        self._lock = threading.Lock()
+
+    def _bucket_number(self, when):
+        return int(when.timestamp()) // self.bucket_seconds
+
+    @staticmethod
+    def _normalize(value):
+        return (value or '').strip().lower() or ANY
+
+    def skills_of(self, text):
+        """Distinct vocabulary skills mentioned in a text, in canonical form"""
+        return {ALIASES.get(skill, skill) for skill in self._matcher.findall(analyze_text(text).lower)}
+
+    def observe(self, title, location, text, when=None, key=None):
+        """
+        Count the skills of one ingested job
+
+        Args:
+            title (str): Job title (the role segment)
+            location (str): Job location
+            text (str): Text the skills are read from
+            when (datetime): Posting time (default: now)
+            key: Job identifier; a key seen recently is not counted again
+
+        Returns:
+            bool: Whether the job was counted
+        """
+        skills = self.skills_of(text)
+        role, location = self._normalize(title), self._normalize(location)
+        segments = {(ANY, ANY), (role, ANY), (ANY, location), (role, location)}
+        number = self._bucket_number(when or datetime.now())
+
+        with self._lock:
+            if key is not None:
+                if key in self._seen:
+                    return False
+                self._seen[key] = True
+                if len(self._seen) > self._max_seen:
+                    self._seen.popitem(last=False)
+
+            bucket = self._buckets.get(number)
+            if bucket is None:
+                if self._buckets and number < next(iter(self._buckets)) and len(self._buckets) >= self.max_buckets:
+                    # Older than everything kept
+                    return False
+                bucket = self._buckets[number] = _Bucket(*self._bucket_args)
+                if len(self._buckets) > 1 and number < next(reversed(self._buckets)):
+                    self._buckets = OrderedDict(sorted(self._buckets.items()))
+                while len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            bucket.add(segments, skills)
+        return True
+
+    def observe_job(self, job):
+        """
+        Count the skills of a JobOpportunity or a job dict from job_scraper
+
+        Returns:
+            bool: Whether the job was counted
+        """
+        if isinstance(job, dict):
+            field = job.get
+        else:
+            def field(name):
+                return getattr(job, name, None)
+
+        when = field('posted_date') or field('date_posted')
+        if isinstance(when, str):
+            try:
+                when = datetime.fromisoformat(when.replace('Z', '+00:00'))
+            except ValueError:
+                when = None
+        return self.observe(
+            field('title'), field('location'),
+            " ".join(filter(None, (field('title'), field('description'), field('requirements')))),
+            when=when if isinstance(when, datetime) else None,
+            key=field('url')
+        )
+
+    def _window_counts(self, segment, first, last, skills=None):
+        """Estimated counts in buckets first..last of the given skills (default: the heavy hitters)"""
+        buckets = [bucket for number, bucket in self._buckets.items() if first <= number <= last]
+        candidates = set()
+        if skills is not None:
+            candidates.update(skills)
+        else:
+            for bucket in buckets:
+                tracker = bucket.heavy_hitters.get(segment)
+                if tracker is not None:
+                    candidates.update(tracker.candidates())
+        return {
+            skill: sum(bucket.sketch.estimate((segment, skill)) for bucket in buckets)
+            for skill in candidates
+        }
+
+    def top_skills(self, limit=10, window=7, role=None, location=None, now=None):
+        """
+        Most demanded skills in the latest window
+
+        Args:
+            limit (int): Number of skills
+            window (int): Window length in buckets, ending with the current one
+            role (str): Job title to restrict to (exact, case-insensitive)
+            location (str): Location to restrict to (exact, case-insensitive)
+            now (datetime): End of the window (default: now)
+
+        Returns:
+            list: (skill, estimated job count) pairs, most demanded first
+        """
+        segment = (self._normalize(role), self._normalize(location))
+        last = self._bucket_number(now or datetime.now())
+        with self._lock:
+            counts = self._window_counts(segment, last - window + 1, last)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def trending(self, limit=10, window=7, role=None, location=None, now=None, min_count=3):
+        """
+        Skills whose demand grew most against the preceding window
+
+        Args:
+            limit (int): Number of skills
+            window (int): Window length in buckets
+            role (str): Job title to restrict to
+            location (str): Location to restrict to
+            now (datetime): End of the current window (default: now)
+            min_count (int): Skip skills seen fewer times in the current window
+
+        Returns:
+            list: Dicts with skill, count, previous and growth, fastest rising first
+        """
+        segment = (self._normalize(role), self._normalize(location))
+        last = self._bucket_number(now or datetime.now())
+        with self._lock:
+            current = self._window_counts(segment, last - window + 1, last)
+            previous = self._window_counts(segment, last - 2 * window + 1, last - window, skills=current)
+
+        rising = []
+        for skill, count in current.items():
+            if count < min_count:
+                continue
+            before = previous[skill]
+            rising.append({
+                'skill': skill,
+                'count': count,
+                'previous': before,
+                'growth': round((count + 1) / (before + 1), 2)
+            })
+        rising.sort(key=lambda item: (-item['growth'], -item['count'], item['skill']))
+        return rising[:limit]
+
+# Process-wide counters fed by the job ingestion paths
+TRENDING_SKILLS = TrendingSkills()
+
+def record_jobs(jobs):
+    """
+    Feed ingested jobs to the shared trending counters
+
+    Returns:
+        int: Jobs counted (recently seen jobs are skipped)
+    """
+    counted = sum(1 for job in jobs if TRENDING_SKILLS.observe_job(job))
+    if counted:
+        logging.debug(f"Recorded skills of {counted} jobs for trend analytics")
+    return counted
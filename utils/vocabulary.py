@@ -0,0 +1,128 @@
+import threading
+from array import array
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Typecode for token ID buffers (unsigned int, 4 bytes on all supported platforms)
+TOKEN_ID_TYPECODE = 'I'
+
+class Vocabulary:
+    """
+    Interned mapping between tokens and integer IDs
+
+    IDs are assigned densely from 0 in order of first sight and never change,
+    so encoded documents stay valid for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._tokens = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def __contains__(self, token):
+        return token in self._ids
+
+    def intern(self, token):
+        """Return the ID of a token, assigning a new one if needed"""
+        token_id = self._ids.get(token)
+        if token_id is not None:
+            return token_id
+        with self._lock:
+            token_id = self._ids.get(token)
+            if token_id is None:
+                token_id = len(self._tokens)
+                self._tokens.append(token)
+                self._ids[token] = token_id
+            return token_id
+
+    def lookup(self, token):
+        """Return the ID of a known token, or None without interning it"""
+        return self._ids.get(token)
+
+    def token(self, token_id):
+        """Return the token for an ID"""
+        return self._tokens[token_id]
+
+    def encode(self, tokens, add=True):
+        """
+        Encode tokens as a compact ID buffer
+
+        Args:
+            tokens (iterable): Tokens or keywords
+            add (bool): Intern unseen tokens; if False they are dropped
+
+        Returns:
+            array: Token IDs
+        """
+        if add:
+            return array(TOKEN_ID_TYPECODE, map(self.intern, tokens))
+        ids = self._ids
+        return array(TOKEN_ID_TYPECODE, (ids[t] for t in tokens if t in ids))
+
+    def decode(self, token_ids):
+        """
+        Decode an ID buffer back into tokens
+
+        Args:
+            token_ids (iterable): Token IDs (array, list or NumPy array)
+
+        Returns:
+            list: Tokens
+        """
+        tokens = self._tokens
+        return [tokens[token_id] for token_id in token_ids]
+
+# Process-wide vocabulary shared by every encoded document
+VOCABULARY = Vocabulary()
+
+def to_numpy(token_ids):
+    """View an ID buffer as a NumPy uint32 array without copying"""
+    if np is None:
+        raise ImportError("NumPy is required for to_numpy")
+    return np.frombuffer(token_ids, dtype=np.uint32)
+
+def count_ids(token_ids):
+    """
+    Count occurrences of each ID
+
+    Args:
+        token_ids (iterable): Token IDs
+
+    Returns:
+        Counter: ID to number of occurrences
+    """
+    return Counter(token_ids)
+
+def overlap(token_ids, other_ids):
+    """Number of distinct IDs the two buffers have in common"""
+    return len(set(token_ids).intersection(other_ids))
+
+class EncodedDocument:
+    """
+    Array-backed representation of a tokenized document
+
+    Holds the full token stream and the ranked keywords as ID buffers,
+    which takes a fraction of the memory of the equivalent string lists.
+    """
+
+    __slots__ = ('token_ids', 'keyword_ids')
+
+    def __init__(self, token_ids, keyword_ids):
+        self.token_ids = token_ids
+        self.keyword_ids = keyword_ids
+
+    def tokens(self, vocabulary=VOCABULARY):
+        """Decode the token stream"""
+        return vocabulary.decode(self.token_ids)
+
+    def keywords(self, limit=None, vocabulary=VOCABULARY):
+        """Decode the ranked keywords, most frequent first"""
+        keyword_ids = self.keyword_ids if limit is None else self.keyword_ids[:limit]
+        return vocabulary.decode(keyword_ids)